@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Arena benchmark: built-in strategies on identical seeded boards.
+
+Reports win rate, mean and p99 decision latency, and moves per second.
+Run with: python benchmarks/bench_arena.py [games] [difficulty]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.arena import AIStrategy, RandomStrategy, RuleStrategy, SolverStrategy, run_arena
+
+
+def main() -> int:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    difficulty = sys.argv[2] if len(sys.argv) > 2 else 'beginner'
+    print("=" * 72)
+    print(f"BOT ARENA ({games} {difficulty} games per strategy)")
+    print("=" * 72)
+    for result in run_arena([RandomStrategy(), RuleStrategy(), SolverStrategy(), AIStrategy()], games, difficulty):
+        print(result.get_summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Endgame benchmark: what the win-probability search buys on Expert.
+
+Plays Expert games with the AI's endgame search on. At every endgame
+guess it also scores the lowest-mine-probability cell the AI would
+otherwise have picked, so the gain in win probability is measured per
+decision rather than read off noisy win rates; the same seeds are then
+replayed with the search off for the overall win rate.
+Run with: python benchmarks/bench_endgame.py [games]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai import MinesweeperAI
+from src.endgame import EndgameSolver
+from src.minesweeper import Minesweeper
+from src.simulation import PRESETS
+
+WIDTH, HEIGHT, MINES = PRESETS['expert']
+
+
+def play(seed: int, endgame_cells: int, decisions=None) -> bool:
+    """Play one Expert game; with ``decisions``, record (search, greedy) win chances."""
+    random.seed(seed)
+    game = Minesweeper(WIDTH, HEIGHT, MINES, first_click=(WIDTH // 2, HEIGHT // 2))
+    ai = MinesweeperAI(game, workers=1, time_budget=0.5, endgame_cells=endgame_cells)
+    if decisions is not None:
+        judge = EndgameSolver(max_cells=endgame_cells, time_budget=2.0)
+        search = ai.endgame.best_move
+
+        def scored(view):
+            move = search(view)
+            if move is not None and move.probability > 0:
+                unknown, layouts = judge.layouts(view)
+                greedy = min(unknown, key=lambda i: (sum(layout >> i & 1 for layout in layouts), i))
+                value = judge.evaluate(view, (greedy % WIDTH, greedy // WIDTH))
+                if value is not None:
+                    decisions.append((move.win_probability, value))
+            return move
+        ai.endgame.best_move = scored
+    game.reveal(WIDTH // 2, HEIGHT // 2)
+    moves = 0
+    while not game.game_over and moves < WIDTH * HEIGHT * 4:
+        ai.make_move()
+        moves += 1
+    ai.close()
+    return game.game_won
+
+
+def main() -> int:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("=" * 60)
+    print(f"EXPERT ENDGAME SEARCH ({games} games)")
+    print("=" * 60)
+    decisions = []
+    start = time.perf_counter()
+    wins_on = sum(play(seed, 24, decisions) for seed in range(games))
+    on_time = time.perf_counter() - start
+    start = time.perf_counter()
+    wins_off = sum(play(seed, 0) for seed in range(games))
+    off_time = time.perf_counter() - start
+    print(f"search off  win rate {wins_off / games:6.1%}  ({off_time:.1f}s)")
+    print(f"search on   win rate {wins_on / games:6.1%}  ({on_time:.1f}s)")
+    if decisions:
+        gain = sum(a - b for a, b in decisions) / len(decisions)
+        better = sum(1 for a, b in decisions if a > b + 1e-9)
+        print(f"{len(decisions)} endgame guesses, {better} differ from lowest probability; "
+              f"mean win chance {sum(a for a, _ in decisions) / len(decisions):.3f} "
+              f"vs {sum(b for _, b in decisions) / len(decisions):.3f} (+{gain:.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
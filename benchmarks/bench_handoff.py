@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Handoff benchmark: cost of a worker request against a shared game.
+
+Compares the round trip of a request that reads the shared header with
+pickling the board grids, across board sizes.
+Run with: python benchmarks/bench_handoff.py [requests]
+"""
+
+import pickle
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.minesweeper import Minesweeper
+from src.workers import SolverPool
+
+SIZES = (9, 100, 1000)
+
+
+def main() -> int:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("=" * 60)
+    print(f"SHARED-MEMORY HANDOFF ({requests} requests per size)")
+    print("=" * 60)
+    with SolverPool(workers=1) as pool:
+        for size in SIZES:
+            game = Minesweeper(size, size, size * size // 6, first_click=(size // 2, size // 2))
+            game.reveal(size // 2, size // 2)
+            pool.ping(game)  # attach outside the timed loop
+            start = time.perf_counter()
+            for _ in range(requests):
+                pool.ping(game)
+            handoff = (time.perf_counter() - start) / requests
+            start = time.perf_counter()
+            pickle.dumps((game.board, game.revealed, game.flagged))
+            pickled = time.perf_counter() - start
+            print(f"{size:>5}x{size:<5} handoff {handoff * 1000:7.3f} ms   "
+                  f"pickling grids {pickled * 1000:8.2f} ms")
+            game.close_shared()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Hint benchmark: latency of HintEngine queries while a game is played.
+
+Follows the hints (revealing each suggested cell) and reports median and
+worst query time, against 10 ms on Expert and 100 ms on 500x500.
+Run with: python benchmarks/bench_hints.py [games]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.hints import HintEngine
+from src.minesweeper import Minesweeper
+
+BOARDS = (('Expert', 30, 16, 99, 0.010), ('500x500', 500, 500, 37500, 0.100))
+
+
+def play(width: int, height: int, mines: int, seed: int, limit: int = 5000):
+    """Play one game by the hints; returns the latency of every query."""
+    random.seed(seed)
+    game = Minesweeper(width, height, mines, first_click=(width // 2, height // 2))
+    hints = HintEngine(game)
+    timings = []
+    for _ in range(limit):
+        start = time.perf_counter()
+        hint = hints.hint()
+        timings.append(time.perf_counter() - start)
+        if hint is None or not game.reveal(*hint.cell):
+            break
+    hints.close()
+    return timings
+
+
+def main() -> int:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("=" * 60)
+    print(f"HINT LATENCY ({games} games per board)")
+    print("=" * 60)
+    ok = True
+    for name, width, height, mines, target in BOARDS:
+        timings = sorted(t for seed in range(games if width < 100 else 2)
+                         for t in play(width, height, mines, seed))
+        worst = timings[-1]
+        ok = ok and worst < target
+        print(f"{name:<8} {len(timings):6d} hints  median {timings[len(timings) // 2] * 1000:6.3f} ms  "
+              f"worst {worst * 1000:7.2f} ms  (target {target * 1000:.0f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
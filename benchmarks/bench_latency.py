@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark: click-to-paint time of the Tk frontend.
+
+Replays the same scripted clicks (reveals, flags, chords) against the
+real GUI, once with sounds on and once with them off, and reports
+p50/p95/p99 of the total and of each phase. It needs a display; on a
+headless machine run it under Xvfb. The JSON dump holds the second run.
+Run with: xvfb-run -a python benchmarks/bench_latency.py [moves] [width] [height] [mines] [json]
+"""
+
+import random
+import sys
+import tkinter as tk
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.latency import PHASES, LatencyTracer, replay, scripted_inputs
+
+
+def run(gui, width: int, height: int, mines: int, moves: int, sounds: bool, seed: int = 7) -> LatencyTracer:
+    random.seed(seed)  # same mine layout on every run
+    gui.start_game(width, height, mines)
+    if (gui.game.width, gui.game.height, gui.game.num_mines) != (width, height, mines):
+        raise RuntimeError(f"GUI opened a {gui.game.width}x{gui.game.height} game, not {width}x{height}")
+    gui.sounds_enabled = sounds
+    gui.latency = LatencyTracer()
+    replay(gui, scripted_inputs(gui.game, moves, seed))
+    return gui.latency
+
+
+def main() -> int:
+    moves = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+    mines = int(sys.argv[4]) if len(sys.argv) > 4 else width * height // 5
+    try:
+        from src.gui import MinesweeperGUI
+        gui = MinesweeperGUI()
+    except tk.TclError as e:
+        print(f"No display ({e}); run under xvfb-run")
+        return 1
+    print("=" * 60)
+    print(f"INPUT-TO-PAINT LATENCY ({width}x{height}, {mines} mines, up to {moves} inputs)")
+    print("=" * 60)
+    for sounds in (True, False):
+        tracer = run(gui, width, height, mines, moves, sounds)
+        figures = tracer.percentiles()
+        print(f"\nsounds {'on' if sounds else 'off'}: {tracer.count} inputs")
+        for name in ('total',) + PHASES:
+            row = figures[name]
+            print(f"  {name:<7} p50 {row['p50']:7.2f} ms   p95 {row['p95']:7.2f} ms   p99 {row['p99']:7.2f} ms")
+    if len(sys.argv) > 5:
+        tracer.dump(sys.argv[5])
+        print(f"\nSamples written to {sys.argv[5]}")
+    gui.root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Lookahead benchmark: cost of simulating one hypothetical reveal.
+
+Compares copy.deepcopy, Minesweeper.clone and checkpoint/undo on a
+part-played Expert board, each followed by one reveal on the copy.
+Run with: python benchmarks/bench_lookahead.py [states]
+"""
+
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.minesweeper import Minesweeper
+
+
+def setup(seed: int = 1) -> Minesweeper:
+    """An Expert game a few moves in, with plenty of hidden safe cells left."""
+    random.seed(seed)
+    game = Minesweeper(30, 16, 99, first_click=(15, 8))
+    game.reveal(15, 8)
+    return game
+
+
+def candidates(game: Minesweeper):
+    return [(x, y) for y in range(game.height) for x in range(game.width)
+            if not game.revealed[y][x] and game.board[y][x] != -1]
+
+
+def bench(name: str, game: Minesweeper, cells, states: int, simulate) -> float:
+    start = time.perf_counter()
+    for i in range(states):
+        simulate(game, cells[i % len(cells)])
+    per_state = (time.perf_counter() - start) / states
+    print(f"{name:<18} {per_state * 1e6:9.1f} us/state")
+    return per_state
+
+
+def with_deepcopy(game, cell):
+    copy.deepcopy(game).reveal(*cell)
+
+
+def with_clone(game, cell):
+    game.clone().reveal(*cell)
+
+
+def with_undo(game, cell):
+    game.checkpoint()
+    game.reveal(*cell)
+    game.undo()
+
+
+def main() -> int:
+    states = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    game = setup()
+    cells = candidates(game)
+    print("=" * 60)
+    print(f"LOOKAHEAD STATE COST (Expert, {states} states)")
+    print("=" * 60)
+    slow = bench("copy.deepcopy", game, cells, max(states // 10, 1), with_deepcopy)
+    fast = bench("clone()", game, cells, states, with_clone)
+    bench("checkpoint/undo", game, cells, states, with_undo)
+    print(f"\nclone() is {slow / fast:.0f}x faster than deepcopy")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Self-play throughput: one Minesweeper object per game vs BatchMinesweeper.
+
+Both runners play the same policy (single-cell rules, random guesses).
+Then the full AI is played with and without information-gain guessing,
+reporting guesses per game.
+Run with: python benchmarks/bench_simulation.py [games]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.simulation import simulate_ai, simulate_batch, simulate_objects
+
+
+def main() -> int:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print("=" * 60)
+    print("SELF-PLAY THROUGHPUT")
+    print("=" * 60)
+    for difficulty in ('beginner', 'intermediate'):
+        objects = simulate_objects(games, difficulty, seed=1)
+        batched = simulate_batch(games * 20, difficulty, seed=1)
+        speedup = batched.games_per_second() / objects.games_per_second()
+        print(f"{difficulty:<13} objects: {objects.get_summary()}")
+        print(f"{'':<13} batched: {batched.get_summary()}  ({speedup:.0f}x)")
+    print("\nFULL AI GUESSES")
+    for difficulty in ('intermediate', 'expert'):
+        for info_gain in (False, True):
+            result = simulate_ai(max(games // 5, 1), difficulty, seed=1, info_gain=info_gain)
+            label = 'info gain' if info_gain else 'lowest p'
+            print(f"{difficulty:<13} {label:<10} {result.get_summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
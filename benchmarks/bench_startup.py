@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: time from a cold interpreter to a ready game.
+
+Each sample runs in a fresh subprocess so module caches never carry over.
+Run with: python benchmarks/bench_startup.py [runs]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).parent.parent
+
+# Budget for a headless script to import the engine and build a board.
+STARTUP_BUDGET_MS = 30.0
+
+# Each scenario times its imports plus setup inside the child process.
+SCENARIOS = {
+    'engine': "from src.minesweeper import Minesweeper\n"
+              "game = Minesweeper(30, 16, 99)",
+    'engine+ai+stats': "from src.minesweeper import Minesweeper\n"
+                       "from src.ai import MinesweeperAI\n"
+                       "from src.stats import GameStats\n"
+                       "game = Minesweeper(30, 16, 99)\n"
+                       "ai = MinesweeperAI(game)",
+    'gui module': "import src.gui",
+}
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+{body}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'ms': elapsed, 'tkinter': 'tkinter' in sys.modules}}))
+"""
+
+
+def measure(body: str, runs: int) -> Dict[str, object]:
+    """Run ``body`` in ``runs`` fresh interpreters; return timing summary in ms."""
+    timings: List[float] = []
+    loads_tk = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', CHILD.format(body=body)], cwd=str(ROOT),
+                                capture_output=True, text=True, check=True).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        timings.append(sample['ms'])
+        loads_tk = loads_tk or sample['tkinter']
+    timings.sort()
+    return {
+        'median': statistics.median(timings),
+        'p90': timings[int(0.9 * (len(timings) - 1))],
+        'tkinter': loads_tk,
+    }
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    print("=" * 60)
+    print(f"STARTUP BENCHMARK ({runs} cold runs each)")
+    print("=" * 60)
+    ok = True
+    for name, body in SCENARIOS.items():
+        result = measure(body, runs)
+        print(f"{name:<18} median {result['median']:6.1f} ms   p90 {result['p90']:6.1f} ms"
+              f"   tkinter loaded: {result['tkinter']}")
+        if name == 'engine':
+            ok = result['median'] <= STARTUP_BUDGET_MS and not result['tkinter']
+    print()
+    print(f"Headless budget {STARTUP_BUDGET_MS:.0f} ms: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
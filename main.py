@@ -6,11 +6,11 @@ A feature-rich Minesweeper game implementation with AI solver.
 Run this file to start the game.
 """
 
-from src.gui import MinesweeperGUI
-
 
 def main():
     """Main entry point for the Minesweeper game."""
+    # Imported here so tools that import main.py never pay for tkinter
+    from src.gui import MinesweeperGUI
     app = MinesweeperGUI()
     app.run()
 
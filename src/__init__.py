@@ -1,8 +1,32 @@
 """
 Minesweeper - Professional Edition
 Source code package
+
+Importing the package is free of GUI cost: the engine, AI and stats
+modules never touch tkinter, and the top-level names below are resolved
+lazily on first access, so ``from src import Minesweeper`` only loads the
+engine.
 """
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
 
+__all__ = ["Minesweeper", "MinesweeperAI", "GameStats", "MinesweeperGUI"]
+
+_LAZY_EXPORTS = {
+    "Minesweeper": "src.minesweeper",
+    "MinesweeperAI": "src.ai",
+    "GameStats": "src.stats",
+    "MinesweeperGUI": "src.gui",
+}
+
+
+def __getattr__(name):
+    """Import the module behind a top-level name on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'src' has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
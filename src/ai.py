@@ -1,16 +1,78 @@
 import random
-import time
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Set
+from src.endgame import EndgameSolver
+from src.frontier import FrontierTracker
+from src.guessing import GuessSelector, corner_cells
 from src.minesweeper import Minesweeper
+from src.sampling import MonteCarloEstimator
+from src.solver import ConstraintSolver
+from src.view import FLAG, HIDDEN, BoardView
 
 
 class MinesweeperAI:
-    """Enhanced AI solver with basic logic and probability-based guessing."""
+    """Enhanced AI solver with basic logic and probability-based guessing.
+
+    Guesses use exact frontier enumeration from ``ConstraintSolver``;
+    ``workers`` and ``time_budget`` (seconds) bound how it runs. With a
+    budget, exact enumeration gets the first half and, if it does not
+    finish, ``MonteCarloEstimator`` samples the frontier for the rest.
+
+    With a ``pool`` (``src.workers.SolverPool``) the guessing step runs in
+    worker processes that read the game from shared memory instead.
+
+    Once at most ``endgame_cells`` cells are hidden, guesses come from
+    ``EndgameSolver``, which picks the move with the best chance of
+    winning; set it to 0 to always guess by lowest mine probability.
+    Before that, with ``info_gain`` a ``GuessSelector`` breaks near-ties
+    between guesses in favour of the one likely to settle more cells.
+
+    The AI subscribes to the game's change events and keeps its picture of
+    the board (frontier numbers, hidden count) up to date in place with a
+    ``FrontierTracker``, so a move costs time proportional to what changed
+    rather than to the board area. It reads the board only through a ``BoardView`` and
+    acts only through the game's move methods, so it never sees a mine.
+    """
     
-    def __init__(self, game: Minesweeper, gui=None):
+    def __init__(self, game: Minesweeper, gui=None, workers: Optional[int] = None,
+                 time_budget: Optional[float] = None, pool=None, endgame_cells: int = 24,
+                 info_gain: bool = True):
         self.game = game
+        self.pool = pool
+        self._planned: List[Tuple[int, int]] = []
+        # Mine probability of every real guess (p > 0) made this game
+        self.guess_probabilities: List[float] = []
+        self.view = BoardView(game)
         self.gui = gui
         self.difficulty = 0
+        half_budget = time_budget / 2 if time_budget is not None else None
+        self.solver = ConstraintSolver(workers=workers, time_budget=half_budget)
+        self.sampler = MonteCarloEstimator(time_budget=half_budget if half_budget is not None else 0.05)
+        self.endgame = EndgameSolver(max_cells=endgame_cells,
+                                     time_budget=time_budget if time_budget is not None else 0.25)
+        self.selector = GuessSelector() if info_gain else None
+        
+        # Incremental board picture, seeded by one scan and then event-driven
+        self._dirty_mines: Set[Tuple[int, int]] = set()
+        self._dirty_safe: Set[Tuple[int, int]] = set()
+        self.tracker = FrontierTracker(self.view, dirty=(self._dirty_mines, self._dirty_safe))
+        game.subscribe(self.on_game_change)
+
+    def close(self):
+        """Release solver worker processes and stop listening to the game."""
+        self.game.unsubscribe(self.on_game_change)
+        self.solver.shutdown()
+
+    @property
+    def hidden_count(self) -> int:
+        return self.tracker.hidden_count
+
+    @property
+    def frontier_numbers(self) -> Set[Tuple[int, int]]:
+        return self.tracker.frontier_numbers
+
+    def on_game_change(self, kind: str, cells: List[Tuple[int, int]]):
+        """Update the frontier and counts from a game change event."""
+        self.tracker.apply(kind, cells)
 
     def make_move(self) -> bool:
         """Make a move using logic and probability. Returns True if move was made."""
@@ -35,81 +97,127 @@ class MinesweeperAI:
         return self.find_random_move()
 
     def find_and_mark_mines(self) -> bool:
-        """Find and flag cells that must be mines."""
+        """Find and flag cells that must be mines, around numbers that changed."""
         move_made = False
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                if self.game.revealed[y][x] and self.game.board[y][x] > 0:
-                    neighbors = self.game.get_neighbors(x, y)
-                    hidden = [n for n in neighbors if not self.game.revealed[n[1]][n[0]] and not self.game.flagged[n[1]][n[0]]]
-                    flagged = [n for n in neighbors if self.game.flagged[n[1]][n[0]]]
-                    
-                    # If hidden + flagged equals the number, all hidden must be mines
-                    if len(hidden) + len(flagged) == self.game.board[y][x]:
-                        for nx, ny in hidden:
-                            if self.game.toggle_flag(nx, ny):
-                                if self.gui:
-                                    self.gui.update_info(f"AI: Flagging mine at ({nx}, {ny})")
-                                    time.sleep(0.1)
-                                move_made = True
+        dirty = sorted(self._dirty_mines, key=lambda c: (c[1], c[0]))
+        self._dirty_mines.clear()  # the tracker keeps filling this same set
+        for x, y in dirty:
+            if (x, y) not in self.frontier_numbers:
+                continue
+            cell = self.view.cell
+            neighbors = self.game.get_neighbors(x, y)
+            hidden = [n for n in neighbors if cell(*n) == HIDDEN]
+            flagged = [n for n in neighbors if cell(*n) == FLAG]
+            
+            # If hidden + flagged equals the number, all hidden must be mines
+            if len(hidden) + len(flagged) == cell(x, y):
+                for nx, ny in hidden:
+                    if self.game.toggle_flag(nx, ny):
+                        if self.gui:
+                            self.gui.update_info(f"AI: Flagging mine at ({nx}, {ny})")
+                        move_made = True
         return move_made
 
     def find_and_reveal_safe_cells(self) -> bool:
-        """Find and reveal cells that must be safe."""
-        move_made = False
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                if self.game.revealed[y][x] and self.game.board[y][x] > 0:
-                    neighbors = self.game.get_neighbors(x, y)
-                    flagged_count = sum(1 for nx, ny in neighbors if self.game.flagged[ny][nx])
-                    
-                    # If all mines are flagged, remaining neighbors are safe
-                    if flagged_count == self.game.board[y][x]:
-                        for nx, ny in neighbors:
-                            if not self.game.revealed[ny][nx] and not self.game.flagged[ny][nx]:
-                                if self.gui:
-                                    self.gui.update_info(f"AI: Revealing safe cell ({nx}, {ny})")
-                                    time.sleep(0.1)
-                                self.game.reveal(nx, ny)
-                                move_made = True
-        return move_made
+        """Find cells that must be safe, around numbers that changed, and reveal them as one move."""
+        safe = {}
+        dirty = sorted(self._dirty_safe, key=lambda c: (c[1], c[0]))
+        self._dirty_safe.clear()  # the tracker keeps filling this same set
+        for x, y in dirty:
+            if (x, y) not in self.frontier_numbers:
+                continue
+            cell = self.view.cell
+            neighbors = self.game.get_neighbors(x, y)
+            flagged_count = sum(1 for nx, ny in neighbors if cell(nx, ny) == FLAG)
+            
+            # If all mines are flagged, remaining neighbors are safe
+            if flagged_count == cell(x, y):
+                for nx, ny in neighbors:
+                    if cell(nx, ny) == HIDDEN:
+                        safe[(nx, ny)] = None
+        if not safe:
+            return False
+        if self.gui:
+            self.gui.update_info(f"AI: Revealing {len(safe)} safe cell(s)")
+        self.game.reveal_many(safe)
+        return True
 
     def find_best_probability_move(self) -> Optional[Tuple[int, int]]:
-        """Find the cell with lowest probability of being a mine."""
-        safe_cells = []
-        probability_map = {}
-        
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                if not self.game.revealed[y][x] and not self.game.flagged[y][x]:
-                    prob = self.calculate_mine_probability(x, y)
-                    if prob == 0:
-                        safe_cells.append((x, y))
-                    else:
-                        probability_map[(x, y)] = prob
+        """Find the cell with lowest probability of being a mine.
+
+        In the endgame, the cell with the best chance of winning instead.
+        """
+        if 0 < self.hidden_count <= self.endgame.max_cells:
+            move = self.endgame.best_move(self.view)
+            if move is not None:
+                if move.probability > 0:
+                    self.guess_probabilities.append(move.probability)
+                return move.cell
+        if self.pool is not None:
+            return self._remote_move()
+        frontier, outside_prob = self.solver.solve(self.view, self.frontier_numbers, self.hidden_count)
+        if not self.solver.last_exact:
+            estimate = self.sampler.estimate(self.view, self.frontier_numbers, self.hidden_count)
+            if estimate.probabilities:
+                frontier, outside_prob = estimate.probabilities, estimate.outside
         
+        safe_cells = [cell for cell, prob in frontier.items() if prob == 0]
         if safe_cells:
             return random.choice(safe_cells)
         
+        probability_map = dict(frontier)
+        if self.hidden_count > len(frontier):
+            # All cells off the frontier share one probability; stand one in for them
+            cell = self._random_hidden_cell(exclude=frontier)
+            if cell is not None:
+                probability_map[cell] = outside_prob if outside_prob is not None else self.calculate_mine_probability(*cell)
+                if probability_map[cell] == 0:
+                    return cell
+            if self.selector is not None and outside_prob is not None:
+                for corner in corner_cells(self.view, exclude=frontier):
+                    probability_map[corner] = outside_prob
+        
         if probability_map:
+            if self.selector is not None:
+                move = self.selector.choose(self.view, probability_map, outside_prob)
+                if probability_map[move] > 0:
+                    self.guess_probabilities.append(probability_map[move])
+                return move
             min_prob = min(probability_map.values())
             best_moves = [cell for cell, prob in probability_map.items() if prob == min_prob]
+            if min_prob > 0:
+                self.guess_probabilities.append(min_prob)
             return random.choice(best_moves)
         
         return None
 
+    def _remote_move(self) -> Optional[Tuple[int, int]]:
+        """Ask the shared-memory worker pool for moves; flag its mines, keep its safe cells."""
+        self._planned = [cell for cell in self._planned if self.view.cell(*cell) == HIDDEN]
+        while not self._planned:
+            flagged = False
+            for op, x, y in self.pool.plan(self.game, self.frontier_numbers, self.hidden_count):
+                if op == 'flag':
+                    flagged = self.game.toggle_flag(x, y) or flagged
+                elif self.view.cell(x, y) == HIDDEN:
+                    self._planned.append((x, y))
+            if not flagged:
+                break
+        return self._planned.pop(0) if self._planned else None
+
     def calculate_mine_probability(self, x: int, y: int) -> float:
         """Calculate probability that (x, y) contains a mine based on neighbors."""
+        cell = self.view.cell
         neighbors = self.game.get_neighbors(x, y)
         total_prob = 0.0
         count = 0
         
         for nx, ny in neighbors:
-            if self.game.revealed[ny][nx] and self.game.board[ny][nx] > 0:
+            if 0 < cell(nx, ny) < FLAG:
                 cell_neighbors = self.game.get_neighbors(nx, ny)
-                hidden = [n for n in cell_neighbors if not self.game.revealed[n[1]][n[0]] and not self.game.flagged[n[1]][n[0]]]
-                flagged = sum(1 for n in cell_neighbors if self.game.flagged[n[1]][n[0]])
-                remaining = self.game.board[ny][nx] - flagged
+                hidden = [n for n in cell_neighbors if cell(*n) == HIDDEN]
+                flagged = sum(1 for n in cell_neighbors if cell(*n) == FLAG)
+                remaining = cell(nx, ny) - flagged
                 
                 if remaining > 0 and len(hidden) > 0:
                     prob = remaining / len(hidden)
@@ -121,20 +229,34 @@ class MinesweeperAI:
         
         # Default probability based on remaining mines and hidden cells
         remaining_mines = self.game.num_mines - self.game.get_flag_count()
-        hidden_count = sum(1 for row in self.game.revealed for cell in row if not cell) - self.game.get_flag_count()
         
-        if hidden_count > 0:
-            return remaining_mines / hidden_count
+        if self.hidden_count > 0:
+            return remaining_mines / self.hidden_count
         return 0.5
 
+    def _random_hidden_cell(self, exclude=()) -> Optional[Tuple[int, int]]:
+        """Pick a uniformly random hidden, unflagged cell not in ``exclude``.
+
+        Rejection-samples first so big boards are not scanned; falls back
+        to a scan when hidden cells have become rare.
+        """
+        cell = self.view.cell
+        for _ in range(64):
+            x = random.randrange(self.game.width)
+            y = random.randrange(self.game.height)
+            if cell(x, y) == HIDDEN and (x, y) not in exclude:
+                return (x, y)
+        moves = [(x, y) for x in range(self.game.width)
+                 for y in range(self.game.height)
+                 if cell(x, y) == HIDDEN and (x, y) not in exclude]
+        return random.choice(moves) if moves else None
+
     def find_random_move(self) -> bool:
         """Make a random move when logic fails."""
-        moves = [(x, y) for x in range(self.game.width) 
-                 for y in range(self.game.height) 
-                 if not self.game.revealed[y][x] and not self.game.flagged[y][x]]
-        
-        if moves:
-            move = random.choice(moves)
+        move = self._random_hidden_cell()
+        if move:
+            remaining = self.game.num_mines - self.game.get_flag_count()
+            self.guess_probabilities.append(remaining / self.hidden_count if self.hidden_count else 0.0)
             if self.gui:
                 self.gui.update_info(f"AI: Random move at ({move[0]}, {move[1]})")
             return self.game.reveal(move[0], move[1])
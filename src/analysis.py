@@ -0,0 +1,552 @@
+import hashlib
+import os
+import random
+from array import array
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.minesweeper import Minesweeper
+from src.solver import ConstraintSolver, build_constraints
+from src.view import HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+# (width, height, mine cells as flat indices y * width + x, first click)
+Layout = Tuple[int, int, Tuple[int, ...], Cell]
+
+# Search steps allowed per cell when looking for a counterexample.
+NODE_LIMIT = 5000
+
+# Per-worker-process analyzer.
+_analyzer: Optional['BoardAnalyzer'] = None
+
+
+def layout_of(game: Minesweeper, first_click: Cell) -> Layout:
+    """Compact, picklable description of a game's mines and opening click.
+
+    Layouts are rectangular boards; other topologies raise ValueError.
+    """
+    if game.topology.kind != 'rectangular':
+        raise ValueError(f"layouts describe rectangular boards, not {game.topology.kind!r} ones")
+    # From the engine's mine index, so large boards are not scanned
+    width = game.width
+    mines = tuple(y * width + x for x, y in game.mine_cells())
+    if game.num_mines and not mines:
+        raise ValueError("mines have not been placed yet")
+    return game.width, game.height, mines, tuple(first_click)
+
+
+def random_layouts(count: int, width: int, height: int, mines: int, first_click: Optional[Cell] = None,
+                   seed: int = 0) -> Iterable[Layout]:
+    """Layouts from the game's own generator, one per seed ``seed .. seed + count - 1``."""
+    first_click = first_click or (width // 2, height // 2)
+    for index in range(count):
+        random.seed(seed + index)
+        game = Minesweeper(width, height, mines, first_click=first_click)
+        game.place_mines(exclude=first_click)
+        yield layout_of(game, first_click)
+
+
+def board_hash(layout: Layout) -> str:
+    """Stable key for a layout: same mines and first click, same hash."""
+    width, height, mines, (x, y) = layout
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array('I', (width, height, x, y)).tobytes())
+    digest.update(array('I', sorted(mines)).tobytes())
+    return digest.hexdigest()
+
+
+def count_3bv(width: int, height: int, mines: Iterable[int], topology=None) -> Tuple[int, int]:
+    """Return (3BV, openings) of a layout.
+
+    3BV is the fewest left clicks that clear the board: one per opening
+    (connected region of zeros) plus one per safe number not on the edge
+    of any opening. Pass ``topology`` (``src.topology``) for boards that
+    are not the standard rectangle.
+    """
+    if topology is not None and topology.kind != 'rectangular':
+        return _count_3bv_graph(topology, mines)
+    size = width * height
+    counts = bytearray(size)
+    mine = bytearray(size)
+    for index in mines:
+        mine[index] = 1
+    for index in range(size):
+        if mine[index]:
+            x, y = index % width, index // width
+            for ny in range(max(0, y - 1), min(height, y + 2)):
+                for nx in range(max(0, x - 1), min(width, x + 2)):
+                    counts[ny * width + nx] += 1
+
+    covered = bytearray(size)
+    openings = 0
+    for start in range(size):
+        if mine[start] or counts[start] or covered[start]:
+            continue
+        openings += 1
+        covered[start] = 1
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            x, y = index % width, index // width
+            for ny in range(max(0, y - 1), min(height, y + 2)):
+                for nx in range(max(0, x - 1), min(width, x + 2)):
+                    neighbor = ny * width + nx
+                    if not covered[neighbor]:
+                        covered[neighbor] = 1
+                        if not counts[neighbor]:
+                            queue.append(neighbor)
+    isolated = sum(1 for index in range(size) if not mine[index] and not covered[index])
+    return openings + isolated, openings
+
+
+def _count_3bv_graph(topology, mines: Iterable[int]) -> Tuple[int, int]:
+    """``count_3bv`` following a topology's adjacency."""
+    size = topology.size
+    near = topology.neighbor_indices
+    counts = bytearray(size)
+    mine = bytearray(size)
+    for index in mines:
+        mine[index] = 1
+        for neighbor in near(index):
+            counts[neighbor] += 1
+
+    covered = bytearray(size)
+    openings = 0
+    for start in range(size):
+        if mine[start] or counts[start] or covered[start]:
+            continue
+        openings += 1
+        covered[start] = 1
+        queue = deque([start])
+        while queue:
+            for neighbor in near(queue.popleft()):
+                if not covered[neighbor]:
+                    covered[neighbor] = 1
+                    if not counts[neighbor]:
+                        queue.append(neighbor)
+    isolated = sum(1 for index in range(size) if not mine[index] and not covered[index])
+    return openings + isolated, openings
+
+
+class _Frontier:
+    """Frontier constraints of a known layout, for proving cells forced.
+
+    A cell is forced when no assignment satisfying every constraint gives
+    it the opposite of its true value. The true layout is one solution,
+    so the search only has to find a different one: it flips the cell and
+    reassigns neighbours through the constraints that touch changed
+    cells; once none of those is left open, the rest of the frontier can
+    keep its true values and the counterexample is complete. Searches
+    stay local, so their cost does not grow with the board.
+    """
+
+    def __init__(self, constraints: List[Tuple[List[Cell], int]], game: Minesweeper):
+        self.cells: List[Cell] = []
+        index: Dict[Cell, int] = {}
+        self.members: List[List[int]] = []
+        self.mines: List[int] = []
+        self.of_cell: List[List[int]] = []
+        for k, (cells, mines) in enumerate(constraints):
+            members = []
+            for cell in cells:
+                i = index.get(cell)
+                if i is None:
+                    i = index[cell] = len(self.cells)
+                    self.cells.append(cell)
+                    self.of_cell.append([])
+                members.append(i)
+                self.of_cell[i].append(k)
+            self.members.append(members)
+            self.mines.append(mines)
+        self.truth = [1 if game.board[y][x] == -1 else 0 for x, y in self.cells]
+
+    def forced(self) -> Tuple[List[Cell], List[Cell]]:
+        """Return the (safe, mine) cells no consistent assignment can change."""
+        safe: List[Cell] = []
+        mines: List[Cell] = []
+        unforced = set()
+        for i, cell in enumerate(self.cells):
+            if i in unforced:
+                continue
+            changed = self.counterexample(i)
+            if changed is None:
+                (mines if self.truth[i] else safe).append(cell)
+            else:
+                unforced.update(changed)
+        return safe, mines
+
+    def counterexample(self, start: int) -> Optional[List[int]]:
+        """Cells changed in a solution where ``start`` is flipped; None if there is none.
+
+        A search that runs out of steps reports the cell as not forced.
+        """
+        truth, members, of_cell = self.truth, self.members, self.of_cell
+        value: Dict[int, int] = {}
+        need: Dict[int, int] = {}
+        free: Dict[int, int] = {}
+        trail: List[int] = []
+
+        def assign(i: int, v: int) -> bool:
+            value[i] = v
+            trail.append(i)
+            ok = True
+            for k in of_cell[i]:
+                if k not in need:
+                    need[k] = self.mines[k]
+                    free[k] = len(members[k])
+                need[k] -= v
+                free[k] -= 1
+                if need[k] < 0 or need[k] > free[k]:
+                    ok = False
+            return ok
+
+        def undo(mark: int):
+            while len(trail) > mark:
+                i = trail.pop()
+                v = value.pop(i)
+                for k in of_cell[i]:
+                    need[k] += v
+                    free[k] += 1
+
+        def next_cell() -> Optional[int]:
+            for i in trail:
+                if value[i] != truth[i]:
+                    for k in of_cell[i]:
+                        if free[k]:
+                            return next(j for j in members[k] if j not in value)
+            return None
+
+        if not assign(start, 1 - truth[start]):
+            return None
+        cell = next_cell()
+        if cell is None:
+            return [start]
+        stack = [(cell, [truth[cell], 1 - truth[cell]], len(trail))]
+        steps = 0
+        while stack:
+            cell, values, mark = stack[-1]
+            undo(mark)
+            if not values:
+                stack.pop()
+                continue
+            steps += 1
+            if steps > NODE_LIMIT:
+                return [start]
+            if assign(cell, values.pop(0)):
+                following = next_cell()
+                if following is None:
+                    return [i for i in trail if value[i] != truth[i]]
+                stack.append((following, [truth[following], 1 - truth[following]], len(trail)))
+        return None
+
+
+class BoardAnalysis:
+    """Solver metrics for one layout.
+
+    ``depth_counts[w]`` is how many cells were resolved in wave ``w`` (wave
+    0 is the opening click); ``depths`` holds each cell's wave row-major,
+    -1 for mines never needed, and is only kept on fresh analyses.
+    """
+
+    FIELDS = ('key', 'width', 'height', 'mines', 'first_click', 'bbbv', 'openings',
+              'forced_guesses', 'solver_waves', 'depth_counts')
+
+    def __init__(self, key: str, width: int, height: int, mines: int, first_click: Cell,
+                 bbbv: int, openings: int, forced_guesses: int, solver_waves: int,
+                 depth_counts: List[int], depths: Optional[array] = None):
+        self.key = key
+        self.width = width
+        self.height = height
+        self.mines = mines
+        self.first_click = tuple(first_click)
+        self.bbbv = bbbv
+        self.openings = openings
+        self.forced_guesses = forced_guesses
+        self.solver_waves = solver_waves
+        self.depth_counts = depth_counts
+        self.depths = depths
+
+    @property
+    def max_depth(self) -> int:
+        """Deduction waves needed to clear the board."""
+        return len(self.depth_counts) - 1
+
+    def rating(self) -> Tuple[int, int, int, int]:
+        """Sort key, hardest last: forced guesses, solver waves, depth, 3BV."""
+        return self.forced_guesses, self.solver_waves, self.max_depth, self.bbbv
+
+    def depth(self, x: int, y: int) -> int:
+        """Wave in which (x, y) was resolved (-1 for a mine never needed)."""
+        if self.depths is None:
+            raise ValueError("per-cell depths are not kept for cached analyses")
+        return self.depths[y * self.width + x]
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BoardAnalysis':
+        return cls(**{name: data[name] for name in cls.FIELDS})
+
+    def get_summary(self) -> str:
+        return (f"{self.width}x{self.height}/{self.mines}: 3BV {self.bbbv}, {self.openings} openings, "
+                f"{self.forced_guesses} forced guesses, depth {self.max_depth} "
+                f"({self.solver_waves} solver waves)")
+
+
+class BoardAnalyzer:
+    """Clears a known layout the way a perfect player would, measuring the work.
+
+    Play proceeds in waves: every cell that can be deduced from the
+    current position is resolved together and gets that wave's number as
+    its depth. Single-number rules come first and only numbers touched by
+    the last wave are rechecked, so big boards cost time in proportion to
+    the frontier. When they stall, a solver wave proves cells forced by
+    searching for counterexamples to the true layout, then tries the
+    exact ``ConstraintSolver`` for deductions that need the global mine
+    count. When nothing can be deduced the analyzer makes a forced guess,
+    revealing the lowest-probability cell that it knows to be safe.
+
+    The solver runs at most ``time_budget`` seconds (None: no limit) per
+    stall, falling back to estimated probabilities, so which safe cell a
+    guess picks can depend on machine speed on the hardest boards.
+    """
+
+    def __init__(self, time_budget: Optional[float] = 0.25):
+        self.solver = ConstraintSolver(workers=1, time_budget=time_budget)
+
+    def analyze(self, layout: Layout, keep_depths: bool = True) -> BoardAnalysis:
+        width, height, mine_indices, first_click = layout
+        key = board_hash(layout)
+        bbbv, openings = count_3bv(width, height, mine_indices)
+        game = Minesweeper(width, height, len(mine_indices), first_click=first_click)
+        game.set_mines([(index % width, index // width) for index in mine_indices])
+        view = BoardView(game)
+        rng = random.Random(key)
+
+        depths = array('i', [-1]) * (width * height)
+        depth_counts: List[int] = []
+        numbers: Set[Cell] = set()
+        dirty: Set[Cell] = set()
+        hidden = [width * height]
+        wave = [0]
+
+        def on_change(kind: str, cells: List[Cell]):
+            hidden[0] -= len(cells) if kind != 'unflag' else -len(cells)
+            depth_counts[-1] += len(cells)
+            for x, y in cells:
+                depths[y * width + x] = wave[0]
+                if 0 < view.cell(x, y) < 9:
+                    numbers.add((x, y))
+                    dirty.add((x, y))
+                for nx, ny in game.get_neighbors(x, y):
+                    if 0 < view.cell(nx, ny) < 9:
+                        dirty.add((nx, ny))
+
+        game.subscribe(on_change)
+        depth_counts.append(0)
+        game.reveal(*first_click)
+        guesses = solver_waves = 0
+        while not game.game_over:
+            wave[0] += 1
+            depth_counts.append(0)
+            safe, mines = self._local_deductions(view, dirty)
+            if not safe and not mines:
+                numbers.difference_update([cell for cell in numbers
+                                           if all(view.cell(*n) != HIDDEN for n in game.get_neighbors(*cell))])
+                constraints, _ = build_constraints(view, numbers, hidden[0])
+                safe, mines = _Frontier(constraints, game).forced()
+                guess = None
+                if not safe and not mines:
+                    safe, mines, guess = self._solver_wave(game, view, numbers, hidden[0], rng)
+                if safe or mines:
+                    solver_waves += 1
+                else:
+                    guesses += 1
+                    safe = [guess]
+            for x, y in mines:
+                game.toggle_flag(x, y)
+            game.reveal_many(safe)
+        game.unsubscribe(on_change)
+        return BoardAnalysis(key, width, height, len(mine_indices), first_click, bbbv, openings,
+                             guesses, solver_waves, depth_counts, depths if keep_depths else None)
+
+    @staticmethod
+    def _local_deductions(view: BoardView, dirty: Set[Cell]) -> Tuple[Set[Cell], Set[Cell]]:
+        """Apply the single-number rules to the numbers touched since the last wave."""
+        safe: Set[Cell] = set()
+        mines: Set[Cell] = set()
+        for x, y in dirty:
+            number = view.cell(x, y)
+            hidden = []
+            flags = 0
+            for n in view.get_neighbors(x, y):
+                code = view.cell(*n)
+                if code == HIDDEN:
+                    hidden.append(n)
+                elif code == 9:
+                    flags += 1
+            if not hidden:
+                continue
+            if flags == number:
+                safe.update(hidden)
+            elif flags + len(hidden) == number:
+                mines.update(hidden)
+        dirty.clear()
+        return safe - mines, mines
+
+    def _solver_wave(self, game: Minesweeper, view: BoardView, numbers: Set[Cell], hidden: int,
+                     rng: random.Random) -> Tuple[List[Cell], List[Cell], Optional[Cell]]:
+        """Exact deductions for the whole frontier, or the safest safe guess."""
+        probabilities, outside = self.solver.solve(view, numbers, hidden)
+        off_frontier = hidden > len(probabilities)
+        if self.solver.last_exact:
+            safe = [cell for cell, p in probabilities.items() if p == 0]
+            mines = [cell for cell, p in probabilities.items() if p == 1]
+            if off_frontier and outside in (0, 1):
+                rest = [(x, y) for y in range(game.height) for x in range(game.width)
+                        if view.cell(x, y) == HIDDEN and (x, y) not in probabilities]
+                (safe if outside == 0 else mines).extend(rest)
+            if safe or mines:
+                return safe, mines, None
+
+        candidates = sorted((p, cell) for cell, p in probabilities.items() if game.board[cell[1]][cell[0]] != -1)
+        guess = candidates[0] if candidates else None
+        if off_frontier and outside is not None and (guess is None or outside < guess[0]):
+            cell = self._safe_off_frontier(game, view, probabilities, rng)
+            if cell is not None:
+                guess = (outside, cell)
+        if guess is None:
+            guess = (1.0, self._safe_off_frontier(game, view, probabilities, rng))
+        return [], [], guess[1]
+
+    @staticmethod
+    def _safe_off_frontier(game: Minesweeper, view: BoardView, frontier: Dict[Cell, float],
+                           rng: random.Random) -> Optional[Cell]:
+        def usable(x, y):
+            return view.cell(x, y) == HIDDEN and game.board[y][x] != -1 and (x, y) not in frontier
+        for _ in range(64):
+            x, y = rng.randrange(game.width), rng.randrange(game.height)
+            if usable(x, y):
+                return x, y
+        cells = [(x, y) for y in range(game.height) for x in range(game.width) if usable(x, y)]
+        return rng.choice(cells) if cells else None
+
+    def shutdown(self):
+        self.solver.shutdown()
+
+
+class AnalysisCache:
+    """Analyses keyed by board hash, optionally persisted to a JSON file.
+
+    Only the summary metrics are kept; per-cell depths are dropped.
+    """
+
+    def __init__(self, capacity: int = 100000, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[BoardAnalysis]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return BoardAnalysis.from_dict(entry)
+
+    def put(self, analysis: BoardAnalysis):
+        self._entries[analysis.key] = analysis.to_dict()
+        self._entries.move_to_end(analysis.key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def save(self, path: Optional[str] = None):
+        """Save cached analyses to a JSON file."""
+        path = path or self.path
+        if not path:
+            return
+        import json
+        try:
+            with open(path, 'w') as f:
+                json.dump(list(self._entries.values()), f)
+        except IOError:
+            pass
+
+    def load(self, path: str):
+        """Load cached analyses from a JSON file."""
+        import json
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        for entry in entries[-self.capacity:]:
+            self._entries[entry['key']] = entry
+
+
+def analyze_board(game: Minesweeper, first_click: Cell, time_budget: Optional[float] = 0.25) -> BoardAnalysis:
+    """Analyze one game's layout from ``first_click``, keeping per-cell depths."""
+    analyzer = BoardAnalyzer(time_budget)
+    try:
+        return analyzer.analyze(layout_of(game, first_click))
+    finally:
+        analyzer.shutdown()
+
+
+def _init_worker(time_budget: Optional[float]):
+    global _analyzer
+    _analyzer = BoardAnalyzer(time_budget)
+
+
+def _analyze_chunk(layouts: List[Layout]) -> List[BoardAnalysis]:
+    """Worker entry point: summary analyses for a list of layouts."""
+    return [_analyzer.analyze(layout, keep_depths=False) for layout in layouts]
+
+
+def analyze_many(layouts: Iterable[Layout], workers: Optional[int] = None,
+                 cache: Optional[AnalysisCache] = None, time_budget: Optional[float] = 0.25,
+                 chunk: int = 16) -> List[BoardAnalysis]:
+    """Analyze many layouts, in input order, skipping ones already in ``cache``.
+
+    Misses are analyzed ``chunk`` at a time in ``workers`` processes
+    (default: one per CPU; 1 runs in this process) and added to the cache.
+    Results carry summary metrics only.
+    """
+    layouts = list(layouts)
+    keys = [board_hash(layout) for layout in layouts]
+    results: List[Optional[BoardAnalysis]] = [cache.get(key) if cache is not None else None for key in keys]
+    todo: Dict[str, Layout] = {}
+    for key, layout, result in zip(keys, layouts, results):
+        if result is None:
+            todo.setdefault(key, layout)
+    pending = list(todo.values())
+    chunks = [pending[i:i + chunk] for i in range(0, len(pending), chunk)]
+
+    workers = workers or os.cpu_count() or 1
+    done: Dict[str, BoardAnalysis] = {}
+    if workers == 1 or len(chunks) <= 1:
+        analyzer = BoardAnalyzer(time_budget)
+        for layout in pending:
+            analysis = analyzer.analyze(layout, keep_depths=False)
+            done[analysis.key] = analysis
+        analyzer.shutdown()
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(time_budget,)) as pool:
+            for analyses in pool.map(_analyze_chunk, chunks):
+                for analysis in analyses:
+                    done[analysis.key] = analysis
+    if cache is not None:
+        for analysis in done.values():
+            cache.put(analysis)
+    return [result if result is not None else done[key] for key, result in zip(keys, results)]
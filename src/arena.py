@@ -0,0 +1,314 @@
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+
+from src.ai import MinesweeperAI
+from src.latency import percentile
+from src.minesweeper import Minesweeper
+from src.simulation import PRESETS
+from src.solver import ConstraintSolver
+from src.view import FLAG, HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+# ('reveal' | 'flag' | 'chord', x, y)
+Action = Tuple[str, int, int]
+
+
+class Strategy(ABC):
+    """A player for the arena: sees a read-only ``BoardView``, returns one action.
+
+    Subclasses must implement ``observe``; ``new_game`` is called with the
+    view before the first move of every game for strategies that keep
+    state, and ``close`` once a run of games is over. Strategies are
+    pickled into worker processes, so keep them plain.
+    """
+
+    name = 'strategy'
+
+    def new_game(self, view: BoardView, game: Minesweeper):
+        """Reset per-game state.
+
+        ``game`` is the engine behind ``view``, for players that must drive
+        it themselves (``AIStrategy``); decisions should read the view only.
+        """
+
+    def close(self):
+        """Release anything held across games."""
+
+    @abstractmethod
+    def observe(self, view: BoardView) -> Action:
+        """The next action for the board shown."""
+
+
+class RandomStrategy(Strategy):
+    """Reveal a uniformly random hidden cell."""
+
+    name = 'random'
+
+    def observe(self, view: BoardView) -> Action:
+        x, y = random.choice(self.hidden_cells(view))
+        return 'reveal', x, y
+
+    @staticmethod
+    def hidden_cells(view: BoardView) -> List[Cell]:
+        return [(x, y) for y in range(view.height) for x in range(view.width)
+                if view.cell(x, y) == HIDDEN]
+
+
+class RuleStrategy(RandomStrategy):
+    """``MinesweeperAI``'s single-cell rules, guessing at random when stuck."""
+
+    name = 'rules'
+
+    def observe(self, view: BoardView) -> Action:
+        action = self.deduce(view)
+        return action if action is not None else super().observe(view)
+
+    @staticmethod
+    def deduce(view: BoardView) -> Optional[Action]:
+        """Flag a forced mine or reveal a forced safe cell, if any number allows it."""
+        for y in range(view.height):
+            for x in range(view.width):
+                number = view.cell(x, y)
+                if not 0 < number < 9:
+                    continue
+                hidden = []
+                flags = 0
+                for nx, ny in view.get_neighbors(x, y):
+                    code = view.cell(nx, ny)
+                    if code == HIDDEN:
+                        hidden.append((nx, ny))
+                    elif code == FLAG:
+                        flags += 1
+                if not hidden:
+                    continue
+                if flags == number:
+                    return ('reveal',) + hidden[0]
+                if flags + len(hidden) == number:
+                    return ('flag',) + hidden[0]
+        return None
+
+
+class SolverStrategy(RuleStrategy):
+    """Single-cell rules, then the lowest-probability cell from exact enumeration."""
+
+    name = 'solver'
+
+    def __init__(self, time_budget: Optional[float] = None):
+        self.time_budget = time_budget
+        self._solver: Optional[ConstraintSolver] = None
+
+    def __getstate__(self):
+        # The solver (and any worker pool) is rebuilt in each process.
+        return {'time_budget': self.time_budget, '_solver': None}
+
+    def observe(self, view: BoardView) -> Action:
+        action = self.deduce(view)
+        if action is not None:
+            return action
+        if self._solver is None:
+            self._solver = ConstraintSolver(workers=1, time_budget=self.time_budget)
+        probabilities, outside = self._solver.solve(view)
+        hidden = self.hidden_cells(view)
+        off_frontier = [cell for cell in hidden if cell not in probabilities]
+        if off_frontier and outside is not None:
+            probabilities[random.choice(off_frontier)] = outside
+        if not probabilities:
+            return super().observe(view)
+        best = min(probabilities.values())
+        x, y = random.choice([cell for cell, p in probabilities.items() if p == best])
+        return 'reveal', x, y
+
+
+class _QueuedMoves:
+    """Stands in for the game inside ``MinesweeperAI``: reads pass through
+    to the real game, moves are queued for the arena to apply."""
+
+    def __init__(self, game: Minesweeper):
+        self._game = game
+        self.queue: List[Action] = []
+
+    def __getattr__(self, name):
+        return getattr(self._game, name)
+
+    def reveal(self, x: int, y: int) -> bool:
+        self.queue.append(('reveal', x, y))
+        return True
+
+    def reveal_many(self, cells) -> bool:
+        self.queue.extend(('reveal', x, y) for x, y in cells)
+        return True
+
+    def toggle_flag(self, x: int, y: int) -> bool:
+        self.queue.append(('flag', x, y))
+        return True
+
+    def chord(self, x: int, y: int) -> bool:
+        self.queue.append(('chord', x, y))
+        return True
+
+
+class AIStrategy(RandomStrategy):
+    """``MinesweeperAI`` as an arena player.
+
+    The AI runs against the game behind the view, but its moves are queued
+    and handed out one action per ``observe``, so the arena applies and
+    times them like any other strategy's. ``options`` go to
+    ``MinesweeperAI`` (``workers`` defaults to 1, as arena games already
+    run in worker processes). Call ``close`` after the last game.
+    """
+
+    name = 'ai'
+
+    def __init__(self, **options):
+        options.setdefault('workers', 1)
+        self.options = options
+        self._ai: Optional[MinesweeperAI] = None
+        self._moves: Optional[_QueuedMoves] = None
+
+    def __getstate__(self):
+        # The AI is rebuilt for every game in whichever process plays it.
+        return {'options': self.options, '_ai': None, '_moves': None}
+
+    def new_game(self, view: BoardView, game: Minesweeper):
+        self.close()
+        self._moves = _QueuedMoves(game)
+        self._ai = MinesweeperAI(self._moves, **self.options)
+
+    def close(self):
+        """Release the last game's AI (its solver and game subscription)."""
+        if self._ai is not None:
+            self._ai.close()
+            self._ai = self._moves = None
+
+    def observe(self, view: BoardView) -> Action:
+        queue = self._moves.queue
+        while True:
+            while queue:
+                op, x, y = queue.pop(0)
+                # Earlier moves in the queue may have settled this cell
+                if view.cell(x, y) == HIDDEN or op == 'chord':
+                    return op, x, y
+            if not self._ai.make_move():
+                return super().observe(view)
+
+
+class ArenaResult:
+    """Strength and speed of one strategy over an arena run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.games = 0
+        self.wins = 0
+        self.moves = 0
+        self.elapsed = 0.0
+        self.latencies: List[float] = []
+
+    def add(self, wins: int, games: int, moves: int, elapsed: float, latencies: List[float]):
+        self.wins += wins
+        self.games += games
+        self.moves += moves
+        self.elapsed += elapsed
+        self.latencies.extend(latencies)
+
+    def get_win_rate(self) -> float:
+        """Calculate win rate as percentage."""
+        if self.games == 0:
+            return 0.0
+        return (self.wins / self.games) * 100
+
+    def mean_latency(self) -> float:
+        """Mean decision time in seconds."""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def p99_latency(self) -> float:
+        """99th percentile decision time in seconds."""
+        return percentile(sorted(self.latencies), 99)
+
+    def moves_per_second(self) -> float:
+        """Moves applied per second of play (decisions plus engine work)."""
+        return self.moves / self.elapsed if self.elapsed > 0 else 0.0
+
+    def get_summary(self) -> str:
+        return (f"{self.name:<10} {self.get_win_rate():5.1f}% won  "
+                f"mean {self.mean_latency() * 1000:7.3f} ms  p99 {self.p99_latency() * 1000:7.3f} ms  "
+                f"{self.moves_per_second():8.0f} moves/sec")
+
+
+def play_game(strategy: Strategy, seed: int, difficulty: str = 'beginner') -> Tuple[bool, int, List[float]]:
+    """Play one seeded game; returns (won, moves, decision latencies).
+
+    The arena makes the opening reveal in the centre and seeds the global
+    RNG first, so every strategy faces the same mine layout for a seed.
+    Games that run past four moves per cell count as losses. The strategy
+    is left open for the next game; ``close`` it when done.
+    """
+    width, height, mines = PRESETS[difficulty]
+    random.seed(seed)
+    start = (width // 2, height // 2)
+    game = Minesweeper(width, height, mines, first_click=start)
+    game.reveal(*start)
+    view = BoardView(game)
+    strategy.new_game(view, game)
+    latencies = []
+    moves = 0
+    limit = width * height * 4
+    while not game.game_over and moves < limit:
+        began = time.perf_counter()
+        op, x, y = strategy.observe(view)
+        latencies.append(time.perf_counter() - began)
+        if 0 <= x < width and 0 <= y < height:
+            if op == 'reveal':
+                game.reveal(x, y)
+            elif op == 'flag':
+                game.toggle_flag(x, y)
+            elif op == 'chord':
+                game.chord(x, y)
+        moves += 1
+    return game.game_won, moves, latencies
+
+
+def _play_chunk(args) -> Tuple[int, int, int, float, List[float]]:
+    """Worker entry point: play a list of seeds with one strategy."""
+    strategy, seeds, difficulty = args
+    wins = moves = 0
+    latencies: List[float] = []
+    start = time.perf_counter()
+    try:
+        for seed in seeds:
+            won, count, timings = play_game(strategy, seed, difficulty)
+            wins += won
+            moves += count
+            latencies.extend(timings)
+    finally:
+        strategy.close()
+    return wins, len(seeds), moves, time.perf_counter() - start, latencies
+
+
+def run_arena(strategies: Sequence[Strategy], games: int = 100, difficulty: str = 'beginner',
+              seed: int = 0, workers: Optional[int] = None) -> List[ArenaResult]:
+    """Play every strategy on the same ``games`` seeded boards.
+
+    Games are split into chunks and played in ``workers`` processes
+    (default: one per CPU; 1 plays in this process).
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = [seed + i for i in range(games)]
+    chunk = max(1, -(-games // workers))
+    tasks = [(index, (strategy, seeds[i:i + chunk], difficulty))
+             for index, strategy in enumerate(strategies)
+             for i in range(0, games, chunk)]
+    results = [ArenaResult(strategy.name) for strategy in strategies]
+    if workers == 1:
+        for index, args in tasks:
+            results[index].add(*_play_chunk(args))
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        outcomes = pool.map(_play_chunk, [args for _, args in tasks])
+        for (index, _), outcome in zip(tasks, outcomes):
+            results[index].add(*outcome)
+    return results
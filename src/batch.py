@@ -0,0 +1,363 @@
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+Planes = Tuple[int, int, int, int]
+
+
+class BatchMinesweeper:
+    """Many same-size games stepped together as bitboards.
+
+    Every game is laid out row-major in one arbitrary-precision integer,
+    with a blank padding column after each row and a blank padding row
+    after each game, so shifting a board by one cell in any direction
+    never carries a bit into a neighbouring row or game. Each game's block
+    (a "lane") is rounded up to whole bytes so per-game results can be read
+    from one ``to_bytes`` snapshot.
+
+    Reveals and flags take a bitboard of cells across all games and are
+    applied with a handful of whole-batch bitwise operations; flood fill is
+    iterative masked dilation, and adjacent counts are kept bit-sliced
+    (four bitboards holding bits 0-3 of every cell's number). Finished games
+    are frozen, and once at least half the lanes hold finished games they
+    are packed out of the bitboards so the long tail of slow games does not
+    pay for the whole batch. ``games[lane]`` maps lanes back to game numbers.
+    """
+
+    FIELDS = ('mines', 'zero', 'revealed', 'flagged')
+
+    def __init__(self, count: int, width: int, height: int, num_mines: int,
+                 first_click: Optional[Cell] = None, seed: Optional[int] = None):
+        self.count = count
+        self.width = width
+        self.height = height
+        self.num_mines = min(num_mines, width * height - 1)  # Ensure at least one safe cell
+        self.stride = width + 1
+        self.block = -(-(height + 1) * self.stride // 8) * 8
+        self._block_bytes = self.block // 8
+        self.random = random.Random(seed)
+
+        row = (1 << width) - 1
+        self._game_cells = 0
+        for y in range(height):
+            self._game_cells |= row << (y * self.stride)
+        self.games: List[int] = list(range(count))
+        self._set_lanes()
+
+        self.mines = self._place_mines(first_click)
+        self.numbers = self._count(self.mines, self.valid & ~self.mines)
+        self.zero = self.valid & ~self.mines & ~(self.numbers[0] | self.numbers[1] |
+                                                 self.numbers[2] | self.numbers[3])
+        self.revealed = 0
+        self.flagged = 0
+        self.done_lanes = 0
+        self.won_lanes = 0
+        self._won: List[bool] = [False] * count
+        self._done: List[bool] = [False] * count
+        self._retired: Dict[int, Tuple[int, ...]] = {}
+
+    def _set_lanes(self):
+        """Rebuild the per-lane masks for the games currently in ``games``."""
+        self._lanes = self._repeat(1)
+        self.valid = self._game_cells * self._lanes
+        self._active_cells = self.valid
+
+    def _repeat(self, pattern: int) -> int:
+        """Copy a one-lane pattern into every lane."""
+        return int.from_bytes(pattern.to_bytes(self._block_bytes, 'little') * len(self.games), 'little')
+
+    def _size(self) -> int:
+        return len(self.games) * self._block_bytes
+
+    def index(self, lane: int, x: int, y: int) -> int:
+        """Bit index of cell (x, y) in ``lane``."""
+        return lane * self.block + y * self.stride + x
+
+    def _place_mines(self, exclude: Optional[Cell]) -> int:
+        """Place mines uniformly per game, keeping ``exclude`` and its neighbours clear."""
+        excluded = set()
+        if exclude:
+            ex, ey = exclude
+            excluded = {(ex + dx, ey + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+        cells = [y * self.stride + x for y in range(self.height) for x in range(self.width)
+                 if (x, y) not in excluded]
+        mines = min(self.num_mines, len(cells))
+        buffer = bytearray(self._size())
+        for lane in range(self.count):
+            base = lane * self.block
+            for offset in self.random.sample(cells, mines):
+                bit = base + offset
+                buffer[bit >> 3] |= 1 << (bit & 7)
+        return int.from_bytes(buffer, 'little')
+
+    def dilate(self, bits: int) -> int:
+        """Cells in ``bits`` or next to one (3x3 neighbourhood), clipped to the boards."""
+        row = bits | (bits << 1) | (bits >> 1)
+        return (row | (row << self.stride) | (row >> self.stride)) & self.valid
+
+    def _count(self, bits: int, where: int) -> Planes:
+        """Bit-sliced 3x3 neighbourhood counts of ``bits``, masked to ``where``.
+
+        Horizontal triples are summed first, then three rows of those, with
+        bitwise full adders; the planes hold bits 0-3 of each cell's count.
+        """
+        left, right = bits << 1, bits >> 1
+        h0 = left ^ bits ^ right
+        h1 = (left & bits) | (left & right) | (bits & right)
+        s = self.stride
+        u0, d0, u1, d1 = h0 << s, h0 >> s, h1 << s, h1 >> s
+        p0 = u0 ^ h0 ^ d0
+        c0 = (u0 & h0) | (u0 & d0) | (h0 & d0)
+        t = u1 ^ h1 ^ d1
+        c1 = (u1 & h1) | (u1 & d1) | (h1 & d1)
+        p1 = t ^ c0
+        c2 = t & c0
+        return p0 & where, p1 & where, (c1 ^ c2) & where, c1 & c2 & where
+
+    def _equal(self, a: Planes, b: Planes, where: int) -> int:
+        """Cells of ``where`` whose bit-sliced values match in ``a`` and ``b``."""
+        for x, y in zip(a, b):
+            where &= ~(x ^ y)
+        return where
+
+    def _lanes_any(self, bits: int) -> int:
+        """Lane bit (the first bit of a lane) for every lane with any bit set."""
+        reach = 1
+        while reach < self.block:
+            shift = min(reach, self.block - reach)
+            bits |= bits >> shift
+            reach += shift
+        return bits & self._lanes
+
+    def _expand(self, lanes: int) -> int:
+        """Whole-board mask of the lanes whose lane bit is set."""
+        return lanes * ((1 << self.block) - 1) & self.valid
+
+    def _flood(self, seeds: int, region: int) -> int:
+        """Cells of ``region`` connected to ``seeds`` (a subset of it).
+
+        Each round first runs every seed to the top of its horizontal run
+        in one addition (the carry ripples through set bits and stops at
+        the padding column), then steps one cell in every direction.
+        """
+        reached = 0
+        while seeds:
+            run = (((region + seeds) ^ region) | seeds) & region
+            reached |= run
+            region &= ~run
+            row = run | (run << 1) | (run >> 1)
+            seeds = (row | (row << self.stride) | (row >> self.stride)) & region
+        return reached
+
+    def reveal(self, cells: int) -> int:
+        """Reveal every cell in ``cells`` (any number per game) with flood fill.
+
+        Games that hit a mine are lost; games with every safe cell revealed
+        are won. Returns the bitboard of cells newly revealed; it is laid
+        out by the lanes in effect before the call.
+        """
+        cells &= self._active_cells & ~self.revealed & ~self.flagged
+        if not cells:
+            return 0
+        hidden = self.valid & ~self.revealed & ~self.flagged
+        opening = self._flood(cells & self.zero, self.zero & hidden)
+        changed = cells | (self.dilate(opening) & hidden)
+        self.revealed |= changed
+
+        hit = cells & self.mines
+        lost = self._lanes_any(hit) if hit else 0
+        unsolved = self._lanes_any(self.valid & ~self.mines & ~self.revealed)
+        won = self.active_lanes() & ~unsolved & ~lost
+        self._finish(lost | won, won)
+        return changed
+
+    def toggle_flag(self, cells: int) -> int:
+        """Toggle flags on hidden cells of unfinished games; returns the cells toggled."""
+        cells &= self._active_cells & ~self.revealed
+        self.flagged ^= cells
+        return cells
+
+    def _finish(self, lanes: int, won: int):
+        if not lanes:
+            return
+        self.done_lanes |= lanes
+        self.won_lanes |= won
+        self._active_cells &= ~self._expand(lanes)
+        if self.done_lanes != self._lanes and 2 * self._popcount(self.done_lanes) >= len(self.games):
+            self._compact()
+
+    @staticmethod
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+    def _compact(self):
+        """Record finished games and pack the live lanes together."""
+        step = self._block_bytes
+        done = self.lane_list(self.done_lanes)
+        won = self.lane_list(self.won_lanes)
+        snapshots = {name: getattr(self, name).to_bytes(self._size(), 'little') for name in self.FIELDS}
+        planes = [plane.to_bytes(self._size(), 'little') for plane in self.numbers]
+        keep = []
+        for lane, game in enumerate(self.games):
+            if not done[lane]:
+                keep.append(lane)
+                continue
+            self._done[game] = True
+            self._won[game] = won[lane]
+            self._retired[game] = tuple(int.from_bytes(data[lane * step:(lane + 1) * step], 'little')
+                                        for data in list(snapshots.values()) + planes)
+
+        def pack(data: bytes) -> int:
+            return int.from_bytes(b''.join(data[lane * step:(lane + 1) * step] for lane in keep), 'little')
+
+        for name, data in snapshots.items():
+            setattr(self, name, pack(data))
+        self.numbers = tuple(pack(data) for data in planes)
+        self.games = [self.games[lane] for lane in keep]
+        self.done_lanes = 0
+        self.won_lanes = 0
+        self._set_lanes()
+
+    def active_lanes(self) -> int:
+        return self._lanes & ~self.done_lanes
+
+    def all_done(self) -> bool:
+        """Check if every game in the batch has finished."""
+        return self.done_lanes == self._lanes
+
+    def lane_list(self, lanes: int) -> List[bool]:
+        """Unpack a lane bitboard into one bool per lane."""
+        data = lanes.to_bytes(self._size(), 'little')
+        step = self._block_bytes
+        return [bool(data[lane * step] & 1) for lane in range(len(self.games))]
+
+    def _results(self, recorded: List[bool], lanes: int) -> List[bool]:
+        results = recorded[:]
+        for game, flag in zip(self.games, self.lane_list(lanes)):
+            results[game] = flag
+        return results
+
+    @property
+    def done(self) -> List[bool]:
+        """Per-game finished flags, indexed by game number."""
+        return self._results(self._done, self.done_lanes)
+
+    @property
+    def won(self) -> List[bool]:
+        """Per-game won flags, indexed by game number."""
+        return self._results(self._won, self.won_lanes)
+
+    def cells_mask(self, moves: Sequence[Optional[Cell]]) -> int:
+        """Bitboard with one cell per game from ``moves[game]`` (``None`` skips a game)."""
+        buffer = bytearray(self._size())
+        for lane, game in enumerate(self.games):
+            move = moves[game]
+            if move is not None:
+                bit = self.index(lane, move[0], move[1])
+                buffer[bit >> 3] |= 1 << (bit & 7)
+        return int.from_bytes(buffer, 'little')
+
+    def _block(self, field: int, game: int) -> int:
+        """One game's block of a field (index into FIELDS, then the number planes)."""
+        if game in self._retired:
+            return self._retired[game][field]
+        values = [getattr(self, name) for name in self.FIELDS] + list(self.numbers)
+        return values[field] >> (self.games.index(game) * self.block)
+
+    def _grid(self, field: int, game: int) -> List[List[bool]]:
+        block = self._block(field, game)
+        return [[bool(block >> (y * self.stride + x) & 1) for x in range(self.width)]
+                for y in range(self.height)]
+
+    def get_board(self, game: int) -> List[List[int]]:
+        """One game's board in ``Minesweeper.board`` form (-1 for mines)."""
+        mines = self._grid(0, game)
+        planes = [self._grid(len(self.FIELDS) + i, game) for i in range(4)]
+        return [[-1 if mines[y][x] else sum(planes[i][y][x] << i for i in range(4))
+                 for x in range(self.width)] for y in range(self.height)]
+
+    def get_revealed(self, game: int) -> List[List[bool]]:
+        return self._grid(2, game)
+
+    def get_flagged(self, game: int) -> List[List[bool]]:
+        return self._grid(3, game)
+
+
+class BatchAI:
+    """The single-cell rules of ``MinesweeperAI`` applied to a whole batch at once.
+
+    Around every revealed number, the flagged and unrevealed neighbour
+    counts are computed bit-sliced for all games together: where the
+    unrevealed count equals the number, its hidden neighbours are mines;
+    where the flag count equals it, they are safe. Games with no deduction
+    this step guess a random hidden cell, as ``find_random_move`` does.
+    """
+
+    def __init__(self, batch: BatchMinesweeper, seed: Optional[int] = None):
+        self.batch = batch
+        self.random = random.Random(seed)
+        self.guesses = 0
+
+    def deduce(self) -> Tuple[int, int]:
+        """Return (mines, safe) bitboards forced by single-cell rules in every game."""
+        b = self.batch
+        hidden = b.valid & ~b.revealed & ~b.flagged
+        numbers = b.revealed & b._active_cells & ~b.mines & ~b.zero
+        # Revealed cells have no unrevealed/flagged centre, so 3x3 counts are neighbour counts.
+        unrevealed = b._count(b.valid & ~b.revealed, numbers)
+        flags = b._count(b.flagged, numbers)
+        mine_sources = b._equal(unrevealed, b.numbers, numbers)
+        safe_sources = b._equal(flags, b.numbers, numbers)
+        mines = b.dilate(mine_sources) & hidden
+        safe = b.dilate(safe_sources) & hidden & ~mines
+        return mines, safe
+
+    def step(self) -> bool:
+        """Make one move in every unfinished game. Returns False once all are done."""
+        b = self.batch
+        if b.all_done():
+            return False
+        mines, safe = self.deduce()
+        b.toggle_flag(mines)
+        stuck = b.active_lanes() & ~b._lanes_any(mines | safe)
+        b.reveal(safe | self._guesses(stuck))
+        return not b.all_done()
+
+    def _guesses(self, lanes: int) -> int:
+        """One uniformly random hidden cell for each game in ``lanes``."""
+        if not lanes:
+            return 0
+        b = self.batch
+        step = b._block_bytes
+        hidden = (b.valid & ~b.revealed & ~b.flagged).to_bytes(b._size(), 'little')
+        buffer = bytearray(len(hidden))
+        for lane, stuck in enumerate(b.lane_list(lanes)):
+            if not stuck:
+                continue
+            offset = self._random_bit(int.from_bytes(hidden[lane * step:(lane + 1) * step], 'little'))
+            if offset is not None:
+                bit = lane * b.block + offset
+                buffer[bit >> 3] |= 1 << (bit & 7)
+                self.guesses += 1
+        return int.from_bytes(buffer, 'little')
+
+    def _random_bit(self, block: int) -> Optional[int]:
+        """Offset of a random set bit of one game's block.
+
+        Rejection-samples while hidden cells are plentiful and walks the set
+        bits once they have become rare.
+        """
+        b = self.batch
+        remaining = bin(block).count('1')
+        if remaining == 0:
+            return None
+        area = b.width * b.height
+        if remaining * 4 >= area:
+            while True:
+                y, x = divmod(int(self.random.random() * area), b.width)
+                offset = y * b.stride + x
+                if block >> offset & 1:
+                    return offset
+        for _ in range(int(self.random.random() * remaining)):
+            block &= block - 1
+        return (block & -block).bit_length() - 1
@@ -0,0 +1,218 @@
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from src.solver import build_constraints
+from src.view import HIDDEN
+
+Cell = Tuple[int, int]
+
+
+class _Timeout(Exception):
+    """Raised when the search runs past its deadline."""
+
+
+class EndgameMove:
+    """The search's answer: a cell, its mine probability and the chance of winning."""
+
+    def __init__(self, cell: Cell, probability: float, win_probability: float):
+        self.cell = cell
+        self.probability = probability
+        self.win_probability = win_probability
+
+    def __repr__(self) -> str:
+        return f"EndgameMove({self.cell}, p={self.probability:.3f}, win={self.win_probability:.3f})"
+
+
+class EndgameSolver:
+    """Exact win-probability search once few unknown cells remain.
+
+    Every mine layout consistent with the visible numbers and the mine
+    count is listed as a bit mask over flat cell indices. A state is the
+    set of layouts still possible: revealing a cell splits it by the number
+    that would appear, and a guess loses on the layouts where the cell is a
+    mine. The search takes any informative cell that is safe in every
+    layout for free and otherwise tries each guess, keeping the one with
+    the best chance of winning the game rather than the lowest marginal
+    mine probability.
+
+    Values are stored in a transposition table keyed by the layout set.
+    Masks use board-wide indices, so after a real move the next state is
+    usually already in the table and answers in O(1). ``best_move`` gives
+    up (returns None) above ``max_cells`` unknown cells or ``max_layouts``
+    layouts, or past ``time_budget`` seconds; finished subtrees stay
+    cached.
+    """
+
+    def __init__(self, max_cells: int = 24, max_layouts: int = 4096,
+                 time_budget: Optional[float] = 0.25, table_size: int = 200000):
+        self.max_cells = max_cells
+        self.max_layouts = max_layouts
+        self.time_budget = time_budget
+        self.table_size = table_size
+        self.table: Dict[FrozenSet[int], float] = {}
+        self._neighbors: Dict[int, int] = {}
+        self._deadline: Optional[float] = None
+        self._nodes = 0
+
+    def clear(self):
+        """Forget cached values, e.g. when a new game starts."""
+        self.table.clear()
+        self._neighbors.clear()
+
+    def layouts(self, view) -> Tuple[List[int], List[int]]:
+        """Unknown cells (flat indices) and every consistent mine layout over them.
+
+        The layout list is empty when there are more than ``max_cells``
+        unknown cells or more than ``max_layouts`` layouts.
+        """
+        width = view.width
+        unknown = [y * width + x for y in range(view.height) for x in range(width)
+                   if view.cell(x, y) == HIDDEN]
+        mines = view.num_mines - view.get_flag_count()
+        if not 0 <= mines <= len(unknown) or len(unknown) > self.max_cells:
+            return unknown, []
+        constraints, _ = build_constraints(view)
+        position = {index: i for i, index in enumerate(unknown)}
+        # Per constraint: mines still needed and cells still unassigned
+        need = [count for _, count in constraints]
+        free = [len(cells) for cells, _ in constraints]
+        touching: List[List[int]] = [[] for _ in unknown]
+        for c, (cells, _) in enumerate(constraints):
+            for x, y in cells:
+                touching[position[y * width + x]].append(c)
+        layouts: List[int] = []
+
+        def search(i: int, left: int, mask: int) -> bool:
+            if left == 0 or i == len(unknown):
+                if left == 0 and all(n == 0 for n in need):
+                    layouts.append(mask)
+                return len(layouts) <= self.max_layouts
+            if len(unknown) - i < left:
+                return True
+            touched = touching[i]
+            for c in touched:
+                free[c] -= 1
+            for mine in (1, 0):
+                if mine:
+                    if any(need[c] == 0 for c in touched):
+                        continue
+                    for c in touched:
+                        need[c] -= 1
+                ok = all(0 <= need[c] <= free[c] for c in touched)
+                if ok and not search(i + 1, left - mine, mask | (mine << unknown[i])):
+                    return False
+                if mine:
+                    for c in touched:
+                        need[c] += 1
+            for c in touched:
+                free[c] += 1
+            return True
+
+        if not search(0, mines, 0):
+            return unknown, []
+        return unknown, layouts
+
+    def _prepare(self, view, unknown: List[int]):
+        """Cache neighbour masks and start the clock for one query."""
+        width = view.width
+        for index in unknown:
+            if index not in self._neighbors:
+                x, y = index % width, index // width
+                self._neighbors[index] = sum(1 << (ny * width + nx) for nx, ny in view.get_neighbors(x, y))
+        if len(self.table) > self.table_size:
+            self.table.clear()
+        self._deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        self._nodes = 0
+
+    def best_move(self, view) -> Optional[EndgameMove]:
+        """The move with the best chance of winning, or None if out of range or time."""
+        unknown, layouts = self.layouts(view)
+        if not layouts:
+            return None
+        width = view.width
+        self._prepare(view, unknown)
+        try:
+            win, index = self._search(frozenset(layouts), unknown)
+        except _Timeout:
+            return None
+        if index is None:
+            # Everything is determined; any safe unknown cell wins
+            index = next((i for i in unknown if not layouts[0] >> i & 1), None)
+            if index is None:
+                return None
+        mines = sum(1 for layout in layouts if layout >> index & 1)
+        return EndgameMove((index % width, index // width), mines / len(layouts), win)
+
+    def evaluate(self, view, cell: Cell) -> Optional[float]:
+        """Chance of winning by revealing ``cell`` and then playing perfectly."""
+        unknown, layouts = self.layouts(view)
+        index = cell[1] * view.width + cell[0]
+        if not layouts or index not in unknown:
+            return None
+        self._prepare(view, unknown)
+        try:
+            return self._reveal_value(frozenset(layouts), index, unknown)
+        except _Timeout:
+            return None
+
+    def _reveal_value(self, layouts, index: int, cells: List[int]) -> float:
+        """Win probability after revealing ``index`` (zero on layouts where it is a mine)."""
+        groups = self._split(layouts, index)
+        return sum(len(g) * self._value(g, cells) for g in groups.values()) / len(layouts)
+
+    def _split(self, layouts, index: int) -> Dict[int, List[int]]:
+        """Safe layouts grouped by the number revealing ``index`` would show."""
+        around = self._neighbors[index]
+        groups: Dict[int, List[int]] = {}
+        for layout in layouts:
+            if not layout >> index & 1:
+                groups.setdefault(bin(layout & around).count('1'), []).append(layout)
+        return groups
+
+    def _search(self, layouts: FrozenSet[int], cells: List[int]) -> Tuple[float, Optional[int]]:
+        """(win probability, best cell) for a set of possible layouts."""
+        if len(layouts) == 1:
+            return 1.0, None
+        self._nodes += 1
+        if self._deadline is not None and self._nodes & 0xF == 0 and time.perf_counter() > self._deadline:
+            raise _Timeout
+        total = len(layouts)
+        known_safe = ~0
+        for layout in layouts:
+            known_safe &= ~layout
+        cached = self.table.get(layouts)
+        candidates = []
+        for index in cells:
+            if known_safe >> index & 1:
+                groups = self._split(layouts, index)
+                if len(groups) > 1:
+                    # Free information: reveal it first
+                    if cached is not None:
+                        return cached, index
+                    win = sum(len(g) * self._value(g, cells) for g in groups.values()) / total
+                    self.table[layouts] = win
+                    return win, index
+            else:
+                safe = sum(1 for layout in layouts if not layout >> index & 1)
+                if safe:
+                    candidates.append((safe, index))
+        candidates.sort(reverse=True)
+        best, best_index = -1.0, None
+        for safe, index in candidates:
+            if safe / total <= best:
+                break
+            win = self._reveal_value(layouts, index, cells)
+            if win > best:
+                best, best_index = win, index
+        self.table[layouts] = best
+        return best, best_index
+
+    def _value(self, layouts: List[int], cells: List[int]) -> float:
+        """Win probability of a state, from the table when it has been seen."""
+        if len(layouts) == 1:
+            return 1.0
+        key = frozenset(layouts)
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+        return self._search(key, cells)[0]
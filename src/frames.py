@@ -0,0 +1,111 @@
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+
+
+class FrameScheduler:
+    """Coalesce redraw requests into at most one flush per frame.
+
+    Callers mark cells dirty and set label texts as often as they like;
+    the first request in a frame schedules one ``flush(cells, labels, full)``
+    through ``schedule(delay_ms, callback)`` (``Tk.after``) for the next
+    frame boundary, and everything marked until then is drawn together.
+    ``full`` asks for a whole-board redraw. Independent of Tk, so any
+    scheduler with the ``after`` signature, or a test double, will do.
+
+    ``frames`` counts flushes, ``coalesced`` the requests folded into an
+    already scheduled frame, and ``dropped`` the frame slots that passed
+    with work pending but no flush, i.e. frames the event loop was too
+    busy to draw. ``fps()`` is the flush rate over the last second.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], object],
+                 flush: Callable[[Set[Cell], Dict[str, str], bool], None],
+                 fps: float = 60.0, clock: Callable[[], float] = time.perf_counter,
+                 cancel: Optional[Callable[[object], None]] = None):
+        self.schedule = schedule
+        self.flush = flush
+        self.cancel_callback = cancel
+        self.interval = 1.0 / fps
+        self.clock = clock
+        self.cells: Set[Cell] = set()
+        self.labels: Dict[str, str] = {}
+        self.full = False
+        self.frames = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending = None
+        self._requested_at = 0.0
+        self._last_flush = float('-inf')
+        self._recent: deque = deque()
+
+    def mark_cells(self, cells: Iterable[Cell]):
+        """Redraw these cells in the next frame."""
+        self.cells.update(cells)
+        self._request()
+
+    def mark_all(self):
+        """Redraw the whole board in the next frame."""
+        self.full = True
+        self._request()
+
+    def set_label(self, name: str, text: str):
+        """Show ``text`` in label ``name`` in the next frame; only the last text is drawn."""
+        self.labels[name] = text
+        self._request()
+
+    def _request(self):
+        if self._pending is not None:
+            self.coalesced += 1
+            return
+        now = self.clock()
+        self._requested_at = now
+        delay = max(0.0, self._last_flush + self.interval - now)
+        self._pending = self.schedule(int(delay * 1000), self._run)
+
+    def _run(self):
+        self._pending = None
+        now = self.clock()
+        late = now - max(self._requested_at, self._last_flush + self.interval)
+        if late > self.interval:
+            self.dropped += int(late / self.interval)
+        self.flush_now()
+
+    def pending(self) -> bool:
+        """Whether anything is waiting to be drawn."""
+        return bool(self.cells or self.labels or self.full)
+
+    def flush_now(self):
+        """Draw everything pending immediately (e.g. before a modal dialog)."""
+        if self._pending is not None and self.cancel_callback is not None:
+            self.cancel_callback(self._pending)
+            self._pending = None
+        if not self.pending():
+            return
+        cells, labels, full = self.cells, self.labels, self.full
+        self.cells, self.labels, self.full = set(), {}, False
+        self.flush(cells, labels, full)
+        now = self.clock()
+        self._last_flush = now
+        self.frames += 1
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - 1.0:
+            self._recent.popleft()
+
+    def reset(self):
+        """Forget pending work (e.g. when the board is rebuilt)."""
+        if self._pending is not None and self.cancel_callback is not None:
+            self.cancel_callback(self._pending)
+        self._pending = None
+        self.cells, self.labels, self.full = set(), {}, False
+
+    def fps(self) -> float:
+        """Frames flushed during the last second."""
+        now = self.clock()
+        return float(sum(1 for t in self._recent if t >= now - 1.0))
+
+    def get_summary(self) -> str:
+        return (f"{self.fps():.0f} fps, {self.frames} frames, {self.coalesced} updates coalesced, "
+                f"{self.dropped} dropped")
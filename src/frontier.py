@@ -0,0 +1,83 @@
+from typing import Iterable, List, Optional, Set, Tuple
+
+from src.view import FLAG, HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+
+
+class FrontierTracker:
+    """Event-driven picture of a board, shared by the AI and the hint engine.
+
+    Keeps ``hidden_count`` (hidden, unflagged cells) and
+    ``frontier_numbers`` (revealed numbers that still touch an unresolved
+    hidden cell) up to date from the game's change events, so a move costs
+    time proportional to the cells it changed rather than to the board
+    area. Every frontier number that may allow a new deduction is added to
+    each set in ``dirty``; owners pass in their own sets and empty them as
+    they work. Cells in ``known_mines`` (proven but not flagged) count as
+    resolved for the frontier while still counting as hidden.
+
+    The tracker does not subscribe itself: owners call ``apply()`` from
+    their own subscriber, so they can update their state around it.
+    """
+
+    def __init__(self, view: BoardView, dirty: Iterable[Set[Cell]] = (),
+                 known_mines: Optional[Set[Cell]] = None):
+        self.view = view
+        self.dirty: List[Set[Cell]] = list(dirty)
+        self.known_mines: Set[Cell] = known_mines if known_mines is not None else set()
+        self.frontier_numbers: Set[Cell] = set()
+        # Untouched rows are all hidden; only the others need reading
+        cell = view.cell
+        self.hidden_count = view.width * view.height
+        for y in view.touched_rows():
+            for x in range(view.width):
+                code = cell(x, y)
+                if code != HIDDEN:
+                    self.hidden_count -= 1
+                    if code != FLAG and self.has_hidden_neighbor(x, y):
+                        self.frontier_numbers.add((x, y))
+        for dirty in self.dirty:
+            dirty.update(self.frontier_numbers)
+
+    def has_hidden_neighbor(self, x: int, y: int) -> bool:
+        """Whether a revealed number still touches an unresolved hidden cell."""
+        cell = self.view.cell
+        if not 0 < cell(x, y) < FLAG:
+            return False
+        known = self.known_mines
+        return any(cell(*n) == HIDDEN and n not in known for n in self.view.get_neighbors(x, y))
+
+    def _mark(self, cell: Cell):
+        self.frontier_numbers.add(cell)
+        for dirty in self.dirty:
+            dirty.add(cell)
+
+    def touch(self, x: int, y: int):
+        """Recheck the frontier membership of the numbers around (x, y)."""
+        cell = self.view.cell
+        for n in self.view.get_neighbors(x, y):
+            if 0 < cell(*n) < FLAG:
+                if self.has_hidden_neighbor(*n):
+                    self._mark(n)
+                else:
+                    self.frontier_numbers.discard(n)
+
+    def apply(self, kind: str, cells: List[Cell]):
+        """Update from one change event; counts move once per listed cell."""
+        if kind == 'reveal':
+            self.hidden_count -= len(cells)
+            for x, y in cells:
+                if self.has_hidden_neighbor(x, y):
+                    self._mark((x, y))
+        elif kind == 'hide':
+            # Undo: these cells are hidden again, so none is a frontier number
+            self.hidden_count += len(cells)
+            for cell in cells:
+                self.frontier_numbers.discard(cell)
+                for dirty in self.dirty:
+                    dirty.discard(cell)
+        else:
+            self.hidden_count += -len(cells) if kind == 'flag' else len(cells)
+        for x, y in cells:
+            self.touch(x, y)
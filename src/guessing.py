@@ -0,0 +1,77 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.view import HIDDEN
+
+Cell = Tuple[int, int]
+
+
+class GuessSelector:
+    """Pick a guess by how much it is likely to open up, not only by risk.
+
+    Every cell within ``tolerance`` of the lowest mine probability is a
+    candidate. Each is scored by its chance of being safe times one plus
+    the number of neighbouring cells its number is expected to settle: a
+    number settles all of its unresolved neighbours when it shows only the
+    mines already known (all safe) or when it leaves no room for doubt (all
+    mines). Both chances come from the probabilities the solver already
+    computed, treating neighbours as independent, so no candidate needs a
+    new enumeration. Scoring stops at ``time_budget`` seconds, after the
+    lowest-probability candidate, so a guess never costs more than that.
+    """
+
+    def __init__(self, tolerance: float = 0.02, time_budget: float = 0.002, max_candidates: int = 64):
+        self.tolerance = tolerance
+        self.time_budget = time_budget
+        self.max_candidates = max_candidates
+
+    def choose(self, view, probabilities: Dict[Cell, float], outside: Optional[float] = None) -> Optional[Cell]:
+        """The best candidate among ``probabilities`` (cell -> mine probability)."""
+        if not probabilities:
+            return None
+        lowest = min(probabilities.values())
+        candidates = sorted((p, (y, x)) for (x, y), p in probabilities.items() if p <= lowest + self.tolerance)
+        deadline = time.perf_counter() + self.time_budget
+        best_cell, best_score = None, -1.0
+        for p, (y, x) in candidates[:self.max_candidates]:
+            score = (1 - p) * (1 + self.expected_settled(view, (x, y), probabilities, outside))
+            if score > best_score:
+                best_cell, best_score = (x, y), score
+            if time.perf_counter() > deadline:
+                break
+        return best_cell
+
+    def expected_settled(self, view, cell: Cell, probabilities: Dict[Cell, float],
+                         outside: Optional[float] = None) -> float:
+        """Expected number of unresolved neighbours that revealing ``cell`` settles."""
+        unresolved = self._neighbor_probabilities(view, cell, probabilities, outside)
+        if not unresolved:
+            return 0.0
+        all_safe = all_mines = 1.0
+        for p in unresolved:
+            all_safe *= 1 - p
+            all_mines *= p
+        return (all_safe + all_mines) * len(unresolved)
+
+    @staticmethod
+    def _neighbor_probabilities(view, cell: Cell, probabilities: Dict[Cell, float],
+                                outside: Optional[float]) -> List[float]:
+        """Mine probabilities of the hidden neighbours that are not yet certain."""
+        result = []
+        for n in view.get_neighbors(*cell):
+            if view.cell(*n) != HIDDEN:
+                continue
+            p = probabilities.get(n, outside)
+            if p is None:
+                p = 0.5
+            if 0 < p < 1:
+                result.append(p)
+        return result
+
+
+def corner_cells(view, exclude: Iterable[Cell] = ()) -> List[Cell]:
+    """Hidden corners, which have the fewest neighbours and open most often."""
+    exclude = set(exclude)
+    w, h = view.width - 1, view.height - 1
+    return [c for c in ((0, 0), (w, 0), (0, h), (w, h))
+            if view.cell(*c) == HIDDEN and c not in exclude]
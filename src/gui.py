@@ -1,36 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import time
-import sys
-import platform
 from typing import Optional, Tuple, Dict
 from src.minesweeper import Minesweeper
 from src.ai import MinesweeperAI
+from src.frames import FrameScheduler
+from src.hints import HintEngine
+from src.latency import LatencyTracer
+from src.sound import SoundWorker
+from src.sprites import GLYPHS, SpriteAtlas
 from src.stats import GameStats
 
-# Sound effects using winsound (Windows) or beep (cross-platform)
-try:
-    if platform.system() == 'Windows':
-        import winsound
-        def play_sound(frequency=800, duration=100):
-            """Play a beep sound on Windows."""
-            try:
-                winsound.Beep(frequency, duration)
-            except:
-                pass
-    else:
-        # Linux/Mac - use system beep
-        def play_sound(frequency=800, duration=100):
-            """Play a beep sound on Linux/Mac."""
-            try:
-                sys.stdout.write('\a')
-                sys.stdout.flush()
-            except:
-                pass
-except:
-    # Fallback - silent
-    def play_sound(frequency=800, duration=100):
-        pass
+# Sounds play on a background thread; play_sound() only queues them
+_sound_worker = SoundWorker()
+
+
+def play_sound(frequency=800, duration=100):
+    """Queue a beep and return at once; the platform backend is probed on first use."""
+    _sound_worker.play(frequency, duration)
 
 
 class MinesweeperGUI:
@@ -87,6 +74,17 @@ class MinesweeperGUI:
     # Default color scheme (Dark theme)
     COLORS = THEMES['Dark']
     
+    # A cell's look is a (cell_*, text_*) pair of style tags; each pair is
+    # drawn once per theme and cell size as a sprite from these bitmaps
+    GLYPHS = GLYPHS
+    
+    # Delay between AI moves in ms; at 0 the AI plays as many moves as fit
+    # in half a frame, then yields to the event loop
+    AI_SPEEDS = {'Slow': 500, 'Normal': 200, 'Fast': 50, 'Max': 0}
+
+    # Mouse button -> input kind in latency traces
+    CLICK_KINDS = {1: 'reveal', 3: 'flag', 2: 'chord'}
+
     DIFFICULTIES = {
         'Beginner': (9, 9, 10),
         'Intermediate': (16, 16, 40),
@@ -94,6 +92,23 @@ class MinesweeperGUI:
         'Custom': None
     }
     
+    @staticmethod
+    def build_style_table(colors: Dict) -> Dict[str, Dict[str, str]]:
+        """Precompute canvas item options for every cell tag under one theme."""
+        numbers = colors['numbers']
+        table = {
+            'cell_hidden': {'fill': colors['cell_hidden'], 'outline': colors['bg']},
+            'cell_flag': {'fill': colors['cell_flag'], 'outline': colors['bg']},
+            'cell_revealed': {'fill': colors['cell_revealed'], 'outline': colors['bg']},
+            'cell_mine': {'fill': colors['mine'], 'outline': colors['bg']},
+            'text_blank': {'fill': colors['text']},
+            'text_flag': {'fill': colors['text']},
+            'text_mine': {'fill': 'white'},
+        }
+        for n in range(1, 9):
+            table[f'text_{n}'] = {'fill': numbers[n] if n < len(numbers) else colors['text']}
+        return table
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Minesweeper - Professional Edition")
@@ -102,6 +117,7 @@ class MinesweeperGUI:
         # Game state
         self.game: Optional[Minesweeper] = None
         self.ai: Optional[MinesweeperAI] = None
+        self.hints: Optional[HintEngine] = None
         self.stats = GameStats()
         self.current_difficulty = 'Beginner'
         self.current_theme = 'Dark'
@@ -110,10 +126,25 @@ class MinesweeperGUI:
         self.sounds_enabled = True
         
         # UI Components
-        self.cells = []
+        self.canvas: Optional[tk.Canvas] = None
+        self.cell_size = 25
+        self.cell_items = []
+        self.cell_states = []
+        # How many cells show each state, so a theme change touches only those
+        self.state_counts: Dict[Tuple[str, str], int] = {}
+        self.hint_item = None
+        self.style_tables = {name: self.build_style_table(colors) for name, colors in self.THEMES.items()}
+        self.sprites = SpriteAtlas(self.style_tables)
         self.mine_counter_label = None
         self.timer_label = None
         self.info_label = None
+        self.ai_delay = self.AI_SPEEDS['Normal']
+        # Board and label changes are drawn at most once per frame
+        self.frames = FrameScheduler(self.root.after, self.flush_frame, cancel=self.root.after_cancel)
+        # Click-to-paint latency; F4 shows it over the board, Ctrl+L saves it
+        self.latency = LatencyTracer()
+        self.latency_item = None
+        self.show_latency = False
         
         self.setup_ui()
         self.new_game()
@@ -173,6 +204,21 @@ class MinesweeperGUI:
                                  state='readonly', width=10)
         theme_menu.pack(side=tk.LEFT, padx=5)
         theme_menu.bind('<<ComboboxSelected>>', self.on_theme_change)
+
+        # AI speed selector
+        speed_frame = tk.Frame(top_frame, bg=self.COLORS['bg'])
+        speed_frame.pack(side=tk.LEFT, padx=10)
+
+        tk.Label(speed_frame, text="AI Speed:", bg=self.COLORS['bg'],
+                fg=self.COLORS['fg'], font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=5)
+
+        self.speed_var = tk.StringVar(value='Normal')
+        speed_menu = ttk.Combobox(speed_frame, textvariable=self.speed_var,
+                                  values=list(self.AI_SPEEDS.keys()),
+                                  state='readonly', width=7)
+        speed_menu.pack(side=tk.LEFT, padx=5)
+        speed_menu.bind('<<ComboboxSelected>>',
+                        lambda e: setattr(self, 'ai_delay', self.AI_SPEEDS[self.speed_var.get()]))
         
         # Info panel
         info_frame = tk.Frame(self.root, bg=self.COLORS['bg'], pady=5)
@@ -207,6 +253,11 @@ class MinesweeperGUI:
         self.root.bind('<space>', lambda e: self.toggle_ai())
         self.root.bind('<Control-s>', lambda e: self.show_stats())
         self.root.bind('<Control-t>', lambda e: self.toggle_sounds())
+        self.root.bind('<h>', lambda e: self.show_hint())
+        self.root.bind('<F3>', lambda e: self.update_info(
+            f"Display: {self.frames.get_summary()}; sound: {_sound_worker.get_summary()}"))
+        self.root.bind('<F4>', lambda e: self.toggle_latency_overlay())
+        self.root.bind('<Control-l>', lambda e: self.dump_latency())
         self.root.focus_set()  # Enable keyboard focus
         
     def on_difficulty_change(self, event=None):
@@ -238,33 +289,44 @@ class MinesweeperGUI:
         if hasattr(self, 'board_frame'):
             self.board_frame.configure(bg=self.COLORS['bg'])
         
-        # Update display if game exists
-        if self.game:
-            self.update_display()
+        # Re-skin the board: the old theme's sprites are evicted and every
+        # cell state shown gets its new sprite with one itemconfigure
+        if self.canvas:
+            self.canvas.configure(bg=self.COLORS['bg'])
+            self.sprites.use(self.current_theme, self.cell_size)
+            for state in self.state_counts:
+                self.canvas.itemconfigure(self.sprites.tag(state), image=self.sprites.get(state))
     
     def new_game(self):
-        """Start a new game."""
+        """Start a new game at the current difficulty, asking for the size if Custom."""
+        if self.current_difficulty == 'Custom':
+            self.show_custom_dialog()
+            return
+        self.start_game(*self.DIFFICULTIES[self.current_difficulty])
+    
+    def start_game(self, width: int, height: int, num_mines: int):
+        """Start a new game of the given size."""
         if self.ai_active:
             self.toggle_ai()  # Stop AI if running
         
         self.timer_running = False
         self.start_time = None
         
-        # Get difficulty settings
-        if self.current_difficulty == 'Custom':
-            self.show_custom_dialog()
-            return
-        
-        width, height, num_mines = self.DIFFICULTIES[self.current_difficulty]
-        
         # Create new game
+        if self.ai:
+            self.ai.close()
+        if self.hints:
+            self.hints.close()
+        self.frames.reset()
         self.game = Minesweeper(width, height, num_mines)
+        self.game.subscribe(self.on_game_change)
         self.ai = MinesweeperAI(self.game, self)
+        self.hints = HintEngine(self.game)
         
         # Clear old board
         for widget in self.board_frame.winfo_children():
             widget.destroy()
-        self.cells = []
+        self.canvas = None
         
         # Create board
         self.create_board()
@@ -303,7 +365,7 @@ class MinesweeperGUI:
                 if 5 <= w <= 50 and 5 <= h <= 30 and 1 <= m < w * h:
                     self.DIFFICULTIES['Custom'] = (w, h, m)
                     dialog.destroy()
-                    self.new_game()
+                    self.start_game(w, h, m)
                 else:
                     messagebox.showerror("Error", "Invalid values! Width: 5-50, Height: 5-30, Mines: 1 to (width*height-1)")
             except ValueError:
@@ -313,33 +375,76 @@ class MinesweeperGUI:
                  bg='#4CAF50', fg='white', padx=20).grid(row=3, column=0, columnspan=2, pady=20)
     
     def create_board(self):
-        """Create the game board UI."""
-        cell_size = 25 if self.game.width <= 16 else 20 if self.game.width <= 30 else 15
-        
+        """Create the game board UI as one canvas with a sprite image per cell."""
+        self.cell_size = 25 if self.game.width <= 16 else 20 if self.game.width <= 30 else 15
+        size = self.cell_size
+        self.sprites.use(self.current_theme, size)
+        
+        self.canvas = tk.Canvas(self.board_frame, width=self.game.width * size,
+                                height=self.game.height * size, bg=self.COLORS['bg'],
+                                highlightthickness=0, cursor='hand2')
+        self.canvas.pack()
+        
+        self.cell_items = []
+        self.cell_states = []
+        self.hint_item = None
+        self.latency_item = None
+        hidden = ('cell_hidden', 'text_blank')
+        self.state_counts = {hidden: self.game.width * self.game.height}
+        image, tag = self.sprites.get(hidden), self.sprites.tag(hidden)
         for y in range(self.game.height):
-            row = []
-            for x in range(self.game.width):
-                btn = tk.Button(
-                    self.board_frame,
-                    width=2,
-                    height=1,
-                    bg=self.COLORS['cell_hidden'],
-                    relief=tk.RAISED,
-                    bd=2,
-                    font=('Arial', 9, 'bold'),
-                    command=lambda cx=x, cy=y: self.on_cell_click(cx, cy),
-                    cursor='hand2'
-                )
-                btn.grid(row=y, column=x, padx=1, pady=1)
-                
-                # Right-click binding
-                btn.bind('<Button-3>', lambda e, cx=x, cy=y: self.on_cell_right_click(e, cx, cy))
-                
-                # Middle-click for chording
-                btn.bind('<Button-2>', lambda e, cx=x, cy=y: self.on_cell_middle_click(cx, cy))
-                
-                row.append(btn)
-            self.cells.append(row)
+            self.cell_items.append([self.canvas.create_image(x * size, y * size, anchor='nw',
+                                                             image=image, tags=(tag,))
+                                    for x in range(self.game.width)])
+            self.cell_states.append([hidden] * self.game.width)
+        
+        # Left-click reveals, right-click flags, middle-click chords
+        self.canvas.bind('<Button-1>', self._on_canvas_event)
+        self.canvas.bind('<Button-3>', self._on_canvas_event)
+        self.canvas.bind('<Button-2>', self._on_canvas_event)
+    
+    def _on_canvas_event(self, event):
+        """Dispatch a canvas click to the handler for the cell under the pointer."""
+        x, y = event.x // self.cell_size, event.y // self.cell_size
+        if not (0 <= x < self.game.width and 0 <= y < self.game.height):
+            return
+        self.latency.begin(self.CLICK_KINDS.get(event.num, 'click'))
+        if event.num == 1:
+            self.on_cell_click(x, y)
+        elif event.num == 3:
+            self.on_cell_right_click(event, x, y)
+        elif event.num == 2:
+            self.on_cell_middle_click(x, y)
+        if not self.frames.pending():
+            self.latency.cancel()  # nothing to paint, nothing felt
+    
+    def cell_tags(self, x: int, y: int) -> Tuple[str, str]:
+        """Return the (rectangle, glyph) style tags for a cell's current state."""
+        if self.game.flagged[y][x]:
+            return 'cell_flag', 'text_flag'
+        if not self.game.revealed[y][x]:
+            return 'cell_hidden', 'text_blank'
+        value = self.game.board[y][x]
+        if value == -1:
+            return 'cell_mine', 'text_mine'
+        if value == 0:
+            return 'cell_revealed', 'text_blank'
+        return 'cell_revealed', f'text_{value}'
+    
+    def draw_cell(self, x: int, y: int):
+        """Swap one cell's sprite if its state changed since it was last drawn."""
+        state = self.cell_tags(x, y)
+        old = self.cell_states[y][x]
+        if old == state:
+            return
+        self.cell_states[y][x] = state
+        counts = self.state_counts
+        counts[old] -= 1
+        if not counts[old]:
+            del counts[old]
+        counts[state] = counts.get(state, 0) + 1
+        self.canvas.itemconfigure(self.cell_items[y][x], image=self.sprites.get(state),
+                                  tags=(self.sprites.tag(state),))
     
     def on_cell_click(self, x: int, y: int):
         """Handle left-click on a cell."""
@@ -352,8 +457,8 @@ class MinesweeperGUI:
         if not self.timer_running and not self.game.revealed[y][x]:
             self.start_timer()
         
-        success = self.game.reveal(x, y)
-        self.update_display()
+        with self.latency.phase('engine'):
+            success = self.game.reveal(x, y)
         
         if not success:
             if self.sounds_enabled:
@@ -382,7 +487,7 @@ class MinesweeperGUI:
             if self.game.revealed[y][x] and self.game.board[y][x] > 0:
                 context_menu.add_command(label="Chord", 
                                         command=lambda: self.on_cell_middle_click(x, y))
-            
+
             try:
                 context_menu.tk_popup(event.x_root, event.y_root)
             finally:
@@ -399,8 +504,8 @@ class MinesweeperGUI:
         if self.sounds_enabled:
             play_sound(600, 50)  # Flag sound
         
-        self.game.toggle_flag(x, y)
-        self.update_display()
+        with self.latency.phase('engine'):
+            self.game.toggle_flag(x, y)
         self.update_info(f"Flagged ({x}, {y})" if self.game.flagged[y][x] else f"Unflagged ({x}, {y})")
     
     def on_cell_middle_click(self, x: int, y: int):
@@ -408,39 +513,88 @@ class MinesweeperGUI:
         if self.game.game_over or not self.game.revealed[y][x]:
             return
         
-        self.game.chord(x, y)
-        self.update_display()
+        with self.latency.phase('engine'):
+            self.game.chord(x, y)
         
         if self.game.game_won:
             self.game_over(lost=False)
     
+    def on_game_change(self, kind: str, cells):
+        """Queue the cells a move changed for the next frame."""
+        self.frames.mark_cells(cells)
+
     def update_display(self):
-        """Update the visual display of the board."""
-        if not self.game:
+        """Redraw the whole board in the next frame."""
+        self.frames.mark_all()
+
+    def flush_frame(self, cells, labels, full: bool):
+        """Draw one frame: the dirty cells (or all of them) and changed labels."""
+        if not self.game or not self.canvas:
             return
-        
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                btn = self.cells[y][x]
-                
-                if self.game.flagged[y][x]:
-                    btn.config(text='🚩', bg=self.COLORS['cell_flag'], state=tk.NORMAL)
-                elif self.game.revealed[y][x]:
-                    btn.config(state=tk.DISABLED, relief=tk.SUNKEN)
-                    if self.game.board[y][x] == -1:
-                        btn.config(text='💣', bg=self.COLORS['mine'], fg='white')
-                    elif self.game.board[y][x] == 0:
-                        btn.config(text='', bg=self.COLORS['cell_revealed'])
-                    else:
-                        num = self.game.board[y][x]
-                        color = self.COLORS['numbers'][num] if num < len(self.COLORS['numbers']) else self.COLORS['text']
-                        btn.config(text=str(num), bg=self.COLORS['cell_revealed'], fg=color)
-                else:
-                    btn.config(text='', bg=self.COLORS['cell_hidden'], state=tk.NORMAL)
-        
+        self.latency.render_started()
+        if full:
+            cells = [(x, y) for y in range(self.game.height) for x in range(self.game.width)]
+        for x, y in cells:
+            self.draw_cell(x, y)
+        if cells and self.hint_item is not None:
+            # The board moved on; the hint no longer applies
+            self.canvas.itemconfigure(self.hint_item, state='hidden')
+
         # Update mine counter
         remaining = self.game.num_mines - self.game.get_flag_count()
         self.mine_counter_label.config(text=f"Mines: {remaining:03d}")
+        for name, text in labels.items():
+            getattr(self, name).config(text=text)
+        # Idle callbacks run in order, so this one runs after Tk has painted
+        self.root.after_idle(self.on_painted)
+
+    def on_painted(self):
+        """Close the traced inputs the last frame drew and refresh the overlay."""
+        self.latency.painted()
+        if self.show_latency and self.canvas:
+            if self.latency_item is None:
+                self.latency_item = self.canvas.create_text(
+                    4, 4, anchor='nw', fill='#FFEB3B', font=('Arial', 8), tags=('latency',))
+            self.canvas.itemconfigure(self.latency_item, text=self.latency.get_summary(), state='normal')
+            self.canvas.tag_raise(self.latency_item)
+
+    def toggle_latency_overlay(self):
+        """Show or hide the click-to-paint latency figures over the board."""
+        self.show_latency = not self.show_latency
+        if self.show_latency:
+            self.on_painted()
+        elif self.latency_item is not None:
+            self.canvas.itemconfigure(self.latency_item, state='hidden')
+
+    def dump_latency(self, path: str = 'latency.json'):
+        """Save the traced latencies as JSON."""
+        self.latency.dump(path)
+        self.update_info(f"Latency saved to {path}: {self.latency.get_summary()}")
+    
+    def show_hint(self):
+        """Outline a provably safe cell, or the safest guess, over the board.
+
+        Only the one highlight item is created or moved; cells are not redrawn.
+        """
+        if not self.game or not self.canvas or self.game.game_over:
+            return
+        hint = self.hints.hint()
+        if hint is None:
+            return
+        x, y = hint.cell
+        size = self.cell_size
+        coords = (x * size + 1, y * size + 1, x * size + size - 1, y * size + size - 1)
+        color = '#00E676' if hint.kind == 'safe' else '#FFC107'
+        if self.hint_item is None:
+            self.hint_item = self.canvas.create_rectangle(*coords, outline=color, width=3, tags=('hint',))
+        else:
+            self.canvas.coords(self.hint_item, *coords)
+            self.canvas.itemconfigure(self.hint_item, outline=color, state='normal')
+        self.canvas.tag_raise(self.hint_item)
+        if hint.kind == 'safe':
+            self.update_info(f"Hint: ({x}, {y}) is safe")
+        else:
+            self.update_info(f"Hint: best guess ({x}, {y}), {hint.probability:.0%} mine risk")
     
     def start_timer(self):
         """Start the game timer."""
@@ -452,7 +606,7 @@ class MinesweeperGUI:
         """Update the timer display."""
         if self.timer_running and not self.game.game_over:
             elapsed = int(time.time() - self.start_time)
-            self.timer_label.config(text=f"Time: {elapsed:03d}")
+            self.frames.set_label('timer_label', f"Time: {elapsed:03d}")
             self.root.after(1000, self.update_timer)
     
     def game_over(self, lost: bool):
@@ -460,32 +614,31 @@ class MinesweeperGUI:
         self.timer_running = False
         
         if lost:
-            # Reveal all mines
-            for y in range(self.game.height):
-                for x in range(self.game.width):
-                    if self.game.board[y][x] == -1:
-                        self.game.revealed[y][x] = True
-            
-            self.update_display()
+            # Reveal all mines; only their cells need redrawing
+            self.game.reveal_mines()
             elapsed = int(time.time() - self.start_time) if self.start_time else 0
-            
+
             self.update_info("💥 Game Over! You hit a mine!")
-            self.stats.record_game(False, elapsed, self.current_difficulty.lower())
-            
+            with self.latency.phase('stats'):
+                self.stats.record_game(False, elapsed, self.current_difficulty.lower())
+            self.frames.flush_now()  # show the final board behind the dialog
+
             messagebox.showinfo("Game Over", f"You hit a mine!\nTime: {elapsed} seconds")
         else:
             elapsed = int(time.time() - self.start_time) if self.start_time else 0
             best_time = self.stats.get_best_time(self.current_difficulty.lower())
-            
+
             self.update_info("🎉 Congratulations! You won!")
-            self.stats.record_game(True, elapsed, self.current_difficulty.lower())
-            
+            with self.latency.phase('stats'):
+                self.stats.record_game(True, elapsed, self.current_difficulty.lower())
+            self.frames.flush_now()
+
             msg = f"Congratulations! You cleared all mines!\nTime: {elapsed} seconds"
             if best_time and elapsed == best_time:
                 msg += f"\n🎯 New Best Time for {self.current_difficulty}!"
             elif best_time:
                 msg += f"\nBest Time: {self.stats._format_time(best_time)}"
-            
+
             messagebox.showinfo("You Win!", msg)
     
     def toggle_ai(self):
@@ -503,7 +656,11 @@ class MinesweeperGUI:
             self.run_ai()
     
     def run_ai(self):
-        """Run AI solver moves."""
+        """Run AI solver moves.
+
+        Moves only change the game; its change events mark cells for the
+        next frame, so fast play does not repaint states nobody sees.
+        """
         if not self.ai_active or self.game.game_over:
             return
         
@@ -511,24 +668,26 @@ class MinesweeperGUI:
             self.start_timer()
         
         moved = self.ai.make_move()
+        if moved and self.ai_delay == 0:
+            budget = time.perf_counter() + self.frames.interval / 2
+            while moved and not self.game.game_over and time.perf_counter() < budget:
+                moved = self.ai.make_move()
         
         if moved:
-            self.update_display()
-            
             if self.game.game_won:
                 self.game_over(lost=False)
                 self.ai_active = False
                 self.ai_btn.config(text="AI Solver", bg='#FF9800')
             elif not self.game.game_over:
-                self.root.after(200, self.run_ai)  # Continue AI moves
+                self.root.after(max(self.ai_delay, 1), self.run_ai)  # Continue AI moves
             else:
                 self.game_over(lost=True)
                 self.ai_active = False
                 self.ai_btn.config(text="AI Solver", bg='#FF9800')
     
     def update_info(self, message: str):
-        """Update the info label."""
-        self.info_label.config(text=message)
+        """Update the info label (drawn with the next frame)."""
+        self.frames.set_label('info_label', message)
     
     def toggle_sounds(self):
         """Toggle sound effects on/off."""
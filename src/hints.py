@@ -0,0 +1,184 @@
+import random
+import time
+from typing import List, Optional, Set, Tuple
+
+from src.frontier import FrontierTracker
+from src.minesweeper import Minesweeper
+from src.solver import ConstraintSolver
+from src.view import FLAG, HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+
+
+class Hint:
+    """A suggested cell: ``'safe'`` if proven, else ``'guess'`` with its mine probability."""
+
+    def __init__(self, kind: str, cell: Cell, probability: float, elapsed: float = 0.0):
+        self.kind = kind
+        self.cell = cell
+        self.probability = probability
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"Hint({self.kind!r}, {self.cell}, p={self.probability:.3f})"
+
+
+class _ProvenMines:
+    """A view that shows proven mines as flags, for the solver."""
+
+    def __init__(self, view: BoardView, mines: Set[Cell]):
+        self.view = view
+        self.mines = mines
+        self.num_mines = view.num_mines
+        self.get_neighbors = view.get_neighbors
+
+    def cell(self, x: int, y: int) -> int:
+        return FLAG if (x, y) in self.mines else self.view.cell(x, y)
+
+    def get_flag_count(self) -> int:
+        return self.view.get_flag_count() + len(self.mines)
+
+
+class HintEngine:
+    """Answers "where should I click?" without touching the game.
+
+    Like ``MinesweeperAI`` it follows the game's change events through a
+    ``FrontierTracker``, keeping the frontier, the hidden count and the
+    numbers touched since the last query, and it also remembers every
+    safe cell and mine it has proven, so a hint usually costs only the
+    single-number rules around the last click. Deduced mines count as flags, so hints work for players who
+    never flag; the player's own flags are trusted. When the rules run
+    dry the exact solver looks at the whole frontier within
+    ``time_budget`` seconds, and its answer is kept until the board
+    changes.
+    """
+
+    def __init__(self, game: Minesweeper, time_budget: Optional[float] = 0.005):
+        self.game = game
+        self.view = BoardView(game)
+        self.solver = ConstraintSolver(workers=1, time_budget=time_budget)
+        self._dirty: Set[Cell] = set()
+        self._safe: Set[Cell] = set()
+        self._mines: Set[Cell] = set()
+        self._guess: Optional[Hint] = None
+        self._guess_generation = -1
+        self.tracker = FrontierTracker(self.view, dirty=(self._dirty,), known_mines=self._mines)
+        game.subscribe(self.on_game_change)
+
+    def close(self):
+        """Stop listening to the game."""
+        self.game.unsubscribe(self.on_game_change)
+        self.solver.shutdown()
+
+    @property
+    def hidden_count(self) -> int:
+        return self.tracker.hidden_count
+
+    @property
+    def frontier_numbers(self) -> Set[Cell]:
+        return self.tracker.frontier_numbers
+
+    def on_game_change(self, kind: str, cells: List[Cell]):
+        """Update the frontier and forget proofs about cells that changed."""
+        for cell in cells:
+            self._safe.discard(cell)
+            self._mines.discard(cell)
+        self.tracker.apply(kind, cells)
+        if kind == 'hide':
+            # Undo: proofs may rest on numbers no longer shown (or on a mine
+            # layout the undo removed), so they are dropped
+            mines = list(self._mines)
+            self._mines.clear()
+            self._safe.clear()
+            for x, y in mines:
+                self.tracker.touch(x, y)
+
+    def hint(self) -> Optional[Hint]:
+        """Best cell to reveal next, or None when the game is over."""
+        start = time.perf_counter()
+        if self.game.game_over or self.hidden_count == 0:
+            return None
+        if self.hidden_count + self.game.get_flag_count() == self.game.width * self.game.height:
+            # Nothing revealed yet: the first click is always safe
+            return Hint('safe', (self.game.width // 2, self.game.height // 2), 0.0,
+                        time.perf_counter() - start)
+        self._apply_rules()
+        if self._safe:
+            return Hint('safe', min(self._safe, key=lambda c: (c[1], c[0])), 0.0,
+                        time.perf_counter() - start)
+        if self._guess_generation != self.game.generation:
+            self._guess = self._solve()
+            self._guess_generation = self.game.generation
+            if self._safe:
+                return Hint('safe', min(self._safe, key=lambda c: (c[1], c[0])), 0.0,
+                            time.perf_counter() - start)
+        if self._guess is None:
+            return None
+        self._guess.elapsed = time.perf_counter() - start
+        return self._guess
+
+    def _apply_rules(self):
+        """Single-number rules on the numbers touched since the last query.
+
+        Proven mines are remembered and their numbers rechecked, so chains
+        of deductions resolve without the player flagging anything.
+        """
+        cell = self.view.cell
+        while self._dirty:
+            x, y = self._dirty.pop()
+            number = cell(x, y)
+            if not 0 < number < FLAG:
+                continue
+            hidden = []
+            mines = 0
+            for n in self.view.get_neighbors(x, y):
+                code = cell(*n)
+                if code == FLAG or n in self._mines:
+                    mines += 1
+                elif code == HIDDEN:
+                    hidden.append(n)
+            if not hidden:
+                continue
+            if mines == number:
+                self._safe.update(hidden)
+            elif mines + len(hidden) == number:
+                self._mines.update(hidden)
+                for mx, my in hidden:
+                    self.tracker.touch(mx, my)
+
+    def _solve(self) -> Optional[Hint]:
+        """Ask the solver; record proven cells and return the safest guess."""
+        hidden = self.hidden_count - len(self._mines)
+        probabilities, outside = self.solver.solve(_ProvenMines(self.view, self._mines),
+                                                   self.frontier_numbers, hidden)
+        if self.solver.last_exact:
+            self._safe.update(c for c, p in probabilities.items() if p == 0)
+            mines = [c for c, p in probabilities.items() if p == 1]
+            self._mines.update(mines)
+            for x, y in mines:
+                self.tracker.touch(x, y)
+        candidates = {c: p for c, p in probabilities.items() if c not in self._mines}
+        if outside is not None and hidden > len(probabilities):
+            off = self._off_frontier_cell(probabilities)
+            if off is not None:
+                candidates[off] = outside
+        if not candidates:
+            return None
+        best = min(candidates.values())
+        cell = min((c for c, p in candidates.items() if p == best), key=lambda c: (c[1], c[0]))
+        return Hint('safe' if best == 0 else 'guess', cell, best)
+
+    def _off_frontier_cell(self, frontier) -> Optional[Cell]:
+        """A hidden cell away from the frontier; corners first, as they open most often."""
+        view = self.view
+        usable = lambda x, y: view.cell(x, y) == HIDDEN and (x, y) not in frontier and (x, y) not in self._mines
+        w, h = view.width - 1, view.height - 1
+        for x, y in ((0, 0), (w, 0), (0, h), (w, h)):
+            if usable(x, y):
+                return x, y
+        for _ in range(64):
+            x, y = random.randint(0, w), random.randint(0, h)
+            if usable(x, y):
+                return x, y
+        cells = [(x, y) for y in range(view.height) for x in range(view.width) if usable(x, y)]
+        return cells[0] if cells else None
@@ -0,0 +1,209 @@
+import json
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+# ('reveal' | 'flag' | 'chord', x, y)
+Input = Tuple[str, int, int]
+
+PHASES = ('engine', 'stats', 'render', 'wait')
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class LatencyTracer:
+    """Input-to-paint latency of the GUI, split by where the time went.
+
+    ``begin(kind)`` opens an input when a click reaches its handler; time
+    spent inside ``phase('engine')`` and ``phase('stats')`` is charged to
+    every open input. The frame flush calls ``render_started()`` and,
+    once Tk has painted (an idle callback after the flush),
+    ``painted()``, which closes the inputs that flush drew: ``render`` is
+    flush start to paint, ``wait`` the rest of the total (mostly waiting
+    for the frame slot). The last ``window`` inputs are kept for rolling
+    p50/p95/p99 figures. ``cancel()`` forgets an input that changed
+    nothing on screen.
+    """
+
+    def __init__(self, window: int = 1000, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.samples: Deque[Tuple[str, float, float, float, float, float]] = deque(maxlen=window)
+        self.count = 0
+        self._open: List[list] = []  # [kind, start, engine, stats]
+        self._render_start: Optional[float] = None
+
+    def begin(self, kind: str):
+        self._open.append([kind, self.clock(), 0.0, 0.0])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the time spent in the block to ``name`` ('engine' or 'stats')."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            if self._open:
+                spent = self.clock() - start
+                slot = 2 if name == 'engine' else 3
+                for record in self._open:
+                    record[slot] += spent
+
+    @property
+    def pending(self) -> int:
+        """Inputs begun but not yet painted or cancelled."""
+        return len(self._open)
+
+    def cancel(self):
+        """Forget the most recent input."""
+        if self._open:
+            self._open.pop()
+
+    def render_started(self):
+        if self._open and self._render_start is None:
+            self._render_start = self.clock()
+
+    def painted(self):
+        """Close every input the finished paint included."""
+        start = self._render_start
+        if start is None:
+            return
+        self._render_start = None
+        now = self.clock()
+        render = now - start
+        still_open = []
+        for record in self._open:
+            kind, began, engine, stats = record
+            if began > start:
+                still_open.append(record)
+                continue
+            total = now - began
+            self.samples.append((kind, total, engine, stats, render, max(0.0, total - engine - stats - render)))
+            self.count += 1
+        self._open = still_open
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99 in milliseconds for the total and each phase."""
+        columns = {'total': 1, 'engine': 2, 'stats': 3, 'render': 4, 'wait': 5}
+        result = {}
+        for name, index in columns.items():
+            values = sorted(sample[index] * 1000 for sample in self.samples)
+            result[name] = {f'p{q}': percentile(values, q) for q in PERCENTILES}
+        return result
+
+    def get_summary(self) -> str:
+        if not self.samples:
+            return "no inputs traced"
+        total = self.percentiles()['total']
+        return (f"input→paint p50 {total['p50']:.1f} ms, p95 {total['p95']:.1f} ms, "
+                f"p99 {total['p99']:.1f} ms ({len(self.samples)} inputs)")
+
+    def to_dict(self) -> dict:
+        return {
+            'inputs': self.count,
+            'percentiles_ms': self.percentiles(),
+            'samples': [{'kind': kind, 'total_ms': total * 1000, 'engine_ms': engine * 1000,
+                         'stats_ms': stats * 1000, 'render_ms': render * 1000, 'wait_ms': wait * 1000}
+                        for kind, total, engine, stats, render, wait in self.samples],
+        }
+
+    def dump(self, path: str):
+        """Write ``to_dict()`` as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def scripted_inputs(game, moves: int, seed: int = 0, flag_rate: float = 0.15,
+                    chord_rate: float = 0.1) -> Iterator[Input]:
+    """A repeatable stream of player inputs for ``game``, chosen as it goes.
+
+    The first input opens the safe cell nearest the centre (mines may
+    already be placed); after that it reveals random safe cells, flags
+    random mines and chords satisfied numbers, using the real board so
+    the game is never lost. Inputs that would win the game
+    are skipped (a win opens a dialog), so the stream may end early.
+    Read the next input only after the previous one was applied.
+    """
+    rng = random.Random(seed)
+    cx, cy = game.width // 2, game.height // 2
+    cells = sorted(((x, y) for y in range(game.height) for x in range(game.width)),
+                   key=lambda c: (c[0] - cx) ** 2 + (c[1] - cy) ** 2)
+    first = next((c for c in cells if _keeps_playing(game, 'reveal', c)), None)
+    if first is None:
+        return
+    yield ('reveal',) + first
+    for _ in range(moves - 1):
+        if game.game_over:
+            return
+        hidden = [(x, y) for y in range(game.height) for x in range(game.width)
+                  if not game.revealed[y][x] and not game.flagged[y][x]]
+        mines = [c for c in hidden if game.board[c[1]][c[0]] == -1]
+        roll = rng.random()
+        if mines and roll < flag_rate:
+            yield ('flag',) + rng.choice(mines)
+            continue
+        if roll < flag_rate + chord_rate:
+            chords = [(x, y) for y in range(game.height) for x in range(game.width)
+                      if _satisfied(game, x, y)]
+            rng.shuffle(chords)
+            cell = next((c for c in chords if _keeps_playing(game, 'chord', c)), None)
+            if cell is not None:
+                yield ('chord',) + cell
+                continue
+        safe = [c for c in hidden if game.board[c[1]][c[0]] != -1]
+        rng.shuffle(safe)
+        cell = next((c for c in safe if _keeps_playing(game, 'reveal', c)), None)
+        if cell is None:
+            return
+        yield ('reveal',) + cell
+
+
+def _satisfied(game, x: int, y: int) -> bool:
+    """A revealed number whose mines are all flagged and that still touches hidden cells."""
+    value = game.board[y][x]
+    if not game.revealed[y][x] or value <= 0:
+        return False
+    flags = hidden = 0
+    for nx, ny in game.get_neighbors(x, y):
+        if game.flagged[ny][nx]:
+            flags += 1
+        elif not game.revealed[ny][nx]:
+            hidden += 1
+    return hidden > 0 and flags == value
+
+
+def _keeps_playing(game, kind: str, cell: Cell) -> bool:
+    trial = game.clone()
+    getattr(trial, kind)(*cell)
+    return not trial.game_over
+
+
+def replay(gui, inputs: Iterator[Input], timeout: float = 5.0) -> int:
+    """Feed ``inputs`` to a running ``MinesweeperGUI`` as real Tk mouse events.
+
+    Each input is delivered with ``event_generate`` on the board canvas,
+    then the event loop is run until the tracer has seen it painted.
+    Returns the number of inputs replayed.
+    """
+    buttons = {'reveal': 1, 'flag': 3, 'chord': 2}
+    gui.root.update()
+    count = 0
+    for kind, x, y in inputs:
+        size = gui.cell_size
+        before = gui.latency.count
+        gui.canvas.event_generate(f'<Button-{buttons[kind]}>', x=x * size + size // 2, y=y * size + size // 2)
+        deadline = time.perf_counter() + timeout
+        while gui.latency.count == before and gui.latency.pending and time.perf_counter() < deadline:
+            gui.root.update()
+            time.sleep(0.0005)
+        count += 1
+    return count
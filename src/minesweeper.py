@@ -1,144 +1,525 @@
 import random
+from array import array
+from bisect import bisect_left
 from collections import deque
-from typing import List, Tuple, Optional
+from typing import Callable, Iterable, List, Tuple, Optional
+from src.storage import ListBoardStorage
+from src.topology import Topology, rectangular
+from src.view import FLAG, HEADER, HEADER_SIZE, HIDDEN, LOST, MAX_VIEW_CELLS, PLAYING, WON
 
 
 class Minesweeper:
-    """Minesweeper game engine with first-click safety and proper flagging."""
+    """Minesweeper game engine with first-click safety and proper flagging.
+
+    Cell state lives in a storage object exposing ``board``, ``revealed`` and
+    ``flagged`` grids indexed ``[y][x]``. The default is plain lists; pass an
+    ``MmapBoardStorage`` to keep huge boards in a memory-mapped file.
+
+    Which cells touch is up to ``topology`` (``src.topology``): the usual
+    8-neighbour rectangle by default, or a torus, hex board or any graph.
+    Mine counts, flood fill and everything built on ``get_neighbors`` follow it.
+
+    Observers registered with ``subscribe`` are called as
+    ``callback(kind, cells)`` after every change: ``'reveal'`` with the
+    newly revealed cells, ``'flag'`` or ``'unflag'`` with the toggled cell.
+
+    Mine positions are also kept as a sorted index of flat cell numbers
+    (``mine_cells()``), and ``row_hidden[y]`` counts the cells of row ``y``
+    that are neither revealed nor flagged, so whole-board work can be
+    limited to the mines or to the rows that changed.
+
+    ``clone()`` makes a cheap copy for lookahead search that shares rows
+    with the original until either side writes to them, and
+    ``checkpoint()``/``undo()`` roll a game back in O(changed cells). Undo
+    publishes ``'hide'`` for cells it covers again.
+
+    ``visible_buffer()`` lazily starts a packed player-visible copy of the
+    board (one byte per cell, see ``src.view``; boards up to
+    ``MAX_VIEW_CELLS``) that is kept current before
+    observers run; ``share_state()`` mirrors it, with a header of counts,
+    status and a generation counter, into shared memory.
+    """
     
-    def __init__(self, width: int, height: int, num_mines: int, first_click: Optional[Tuple[int, int]] = None):
+    def __init__(self, width: int, height: int, num_mines: int, first_click: Optional[Tuple[int, int]] = None,
+                 storage=None, topology: Optional[Topology] = None):
         self.width = width
         self.height = height
+        self.topology = topology if topology is not None else rectangular(width, height)
+        if (self.topology.width, self.topology.height) != (width, height):
+            raise ValueError("topology does not match the board size")
+        # Bound directly: neighbour lookups are the engine's hottest call
+        self.get_neighbors = self.topology.neighbors
         self.num_mines = min(num_mines, width * height - 1)  # Ensure at least one safe cell
-        self.board = [[0 for _ in range(width)] for _ in range(height)]
-        self.revealed = [[False for _ in range(width)] for _ in range(height)]
-        self.flagged = [[False for _ in range(width)] for _ in range(height)]
+        self.storage = storage if storage is not None else ListBoardStorage(width, height)
+        self.board = self.storage.board
+        self.revealed = self.storage.revealed
+        self.flagged = self.storage.flagged
         self.first_click = first_click
         self.game_over = False
         self.game_won = False
         self._mines_placed = False
+        self._flag_count = 0
+        self._revealed_safe = 0
+        self._mines = array('I')
+        self.row_hidden = array('I', [width]) * height
+        self._borrowed: Optional[bytearray] = None  # rows shared with a clone
+        self._board_shared = False
+        self._journal: Optional[List] = None
+        self._marks: List[Tuple] = []
+        self._listeners: List[Callable[[str, List[Tuple[int, int]]], None]] = []
+        self._visible: List = []
+        self._shared = None
+        self._shared_cells = None
+        self.generation = 0
         
         # Place mines after first click (for first-click safety)
         if first_click is None:
             self.place_mines()
-            self.calculate_adjacent_mines()
             self._mines_placed = True
 
+    def subscribe(self, callback: Callable[[str, List[Tuple[int, int]]], None]):
+        """Register a callback for board change events."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, List[Tuple[int, int]]], None]):
+        """Remove a callback registered with subscribe."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _publish(self, kind: str, cells: List[Tuple[int, int]]):
+        """Update the visible buffers, then notify subscribers of a change."""
+        if self._journal is not None:
+            self._journal.append((kind, cells))
+        self.generation += 1  # odd while writing: shared readers retry
+        if self._shared is not None:
+            self._write_header()
+        if self._visible:
+            width = self.width
+            for buffer in self._visible:
+                if kind == 'reveal':
+                    for x, y in cells:
+                        buffer[y * width + x] = self.board[y][x] & 0xFF
+                else:
+                    code = FLAG if kind == 'flag' else HIDDEN
+                    for x, y in cells:
+                        buffer[y * width + x] = code
+        self.generation += 1
+        if self._shared is not None:
+            self._write_header()
+        for callback in self._listeners:
+            callback(kind, cells)
+
+    def visible_buffer(self):
+        """Packed player-visible codes, created on first use and kept current.
+
+        Only rows with a revealed or flagged cell are read; boards above
+        ``MAX_VIEW_CELLS`` are refused with ValueError.
+        """
+        if not self._visible:
+            size = self.width * self.height
+            if size > MAX_VIEW_CELLS:
+                raise ValueError(f"board of {size} cells is too large for a view "
+                                 f"(limit {MAX_VIEW_CELLS} cells)")
+            buffer = bytearray([HIDDEN]) * size
+            for y in range(self.height):
+                if self.row_hidden[y] == self.width:
+                    continue
+                revealed, flagged, board = self.revealed[y], self.flagged[y], self.board[y]
+                row = y * self.width
+                for x in range(self.width):
+                    if revealed[x]:
+                        buffer[row + x] = board[x] & 0xFF
+                    elif flagged[x]:
+                        buffer[row + x] = FLAG
+            self._visible.append(buffer)
+        return self._visible[0]
+
+    def share_state(self) -> str:
+        """Mirror the visible state into a shared memory block; returns its name.
+
+        Worker processes open it with ``BoardView.attach(name)``.
+        """
+        if self._shared is None:
+            from multiprocessing import shared_memory
+            local = self.visible_buffer()
+            self._shared = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + len(local))
+            self._shared_cells = self._shared.buf[HEADER_SIZE:HEADER_SIZE + len(local)]
+            self._shared_cells[:] = local
+            self._write_header()
+            self._visible.append(self._shared_cells)
+        return self._shared.name
+
+    def _write_header(self):
+        if self.game_won:
+            status = WON
+        else:
+            status = LOST if self.game_over else PLAYING
+        HEADER.pack_into(self._shared.buf, 0, self.width, self.height, self.num_mines,
+                         self._flag_count, status, self.generation)
+
+    def close_shared(self):
+        """Stop mirroring and free the shared state block."""
+        if self._shared is not None:
+            # by identity: list.remove would match the equal local copy first
+            self._visible = [b for b in self._visible if b is not self._shared_cells]
+            self._shared_cells.release()
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
+            self._shared_cells = None
+
     def place_mines(self, exclude: Optional[Tuple[int, int]] = None):
-        """Place mines randomly, excluding the first click and its neighbors."""
+        """Place mines randomly, excluding the first click and its neighbors.
+
+        Adjacent counts are updated as each mine lands, so setup costs
+        O(mines) instead of a full-board counting pass.
+        """
+        self._own_board()
         excluded_cells = set()
         if exclude:
             excluded_cells.add(exclude)
             # Exclude neighbors for better first-click experience
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    nx, ny = exclude[0] + dx, exclude[1] + dy
-                    if 0 <= nx < self.width and 0 <= ny < self.height:
-                        excluded_cells.add((nx, ny))
+            excluded_cells.update(self.get_neighbors(*exclude))
         
-        mines_placed = 0
-        while mines_placed < self.num_mines:
+        placed = []
+        while len(placed) < self.num_mines:
             x = random.randint(0, self.width - 1)
             y = random.randint(0, self.height - 1)
             if (x, y) not in excluded_cells and self.board[y][x] != -1:
                 self.board[y][x] = -1
-                mines_placed += 1
+                placed.append(y * self.width + x)
+                for nx, ny in self.get_neighbors(x, y):
+                    if self.board[ny][nx] != -1:
+                        self.board[ny][nx] += 1
+        self._mines = array('I', sorted(placed))
 
-    def calculate_adjacent_mines(self):
-        """Calculate the number of adjacent mines for each cell."""
+    def set_mines(self, cells: List[Tuple[int, int]]):
+        """Use a fixed mine layout (e.g. a recorded board) instead of a random one.
+
+        Call before the first reveal; ``num_mines`` becomes ``len(cells)``.
+        """
+        self._own_board()
         for y in range(self.height):
             for x in range(self.width):
-                if self.board[y][x] == -1:
-                    continue
-                count = 0
-                for dy in (-1, 0, 1):
-                    for dx in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.board[ny][nx] == -1:
-                                count += 1
-                self.board[y][x] = count
+                self.board[y][x] = 0
+        for x, y in cells:
+            self.board[y][x] = -1
+        for x, y in cells:
+            for nx, ny in self.get_neighbors(x, y):
+                if self.board[ny][nx] != -1:
+                    self.board[ny][nx] += 1
+        self.num_mines = len(cells)
+        self._mines = array('I', sorted({y * self.width + x for x, y in cells}))
+        self._mines_placed = True
+
+    def calculate_adjacent_mines(self):
+        """Recount every cell's adjacent mines, and the mine index, from the board.
+
+        For boards whose mines were written into ``board`` directly. One
+        read pass finds the mines; counts are then added around each mine
+        and only cells whose value changes are written.
+        """
+        self._own_board()
+        width = self.width
+        mines = array('I')
+        for y in range(self.height):
+            row = self.board[y]
+            for x in range(width):
+                if row[x] == -1:
+                    mines.append(y * width + x)
+        counts = {}
+        for index in mines:
+            for nx, ny in self.get_neighbors(index % width, index // width):
+                counts[ny * width + nx] = counts.get(ny * width + nx, 0) + 1
+        for y in range(self.height):
+            row = self.board[y]
+            for x in range(width):
+                value = row[x]
+                if value != -1 and value != counts.get(y * width + x, 0):
+                    row[x] = counts.get(y * width + x, 0)
+        self._mines = mines
+
+    def mine_cells(self) -> List[Tuple[int, int]]:
+        """Every mine as (x, y), in row order, from the index (O(mines))."""
+        width = self.width
+        return [(index % width, index // width) for index in self._mines]
+
+    def mines_in_rows(self, start: int = 0, stop: Optional[int] = None) -> int:
+        """Number of mines in rows ``start`` to ``stop - 1`` (O(log mines))."""
+        stop = self.height if stop is None else stop
+        return bisect_left(self._mines, stop * self.width) - bisect_left(self._mines, start * self.width)
+
+    def mine_density(self, start: int = 0, stop: Optional[int] = None) -> float:
+        """Fraction of the cells in rows ``start`` to ``stop - 1`` that are mines."""
+        stop = self.height if stop is None else stop
+        cells = (stop - start) * self.width
+        return self.mines_in_rows(start, stop) / cells if cells > 0 else 0.0
+
+    def reveal_mines(self) -> List[Tuple[int, int]]:
+        """Show every unflagged mine after a loss; returns the cells changed."""
+        changed = []
+        for x, y in self.mine_cells():
+            if not self.revealed[y][x] and not self.flagged[y][x]:
+                if self._borrowed and self._borrowed[y]:
+                    self._own_row(y)
+                self.revealed[y][x] = True
+                self.row_hidden[y] -= 1
+                changed.append((x, y))
+        if changed:
+            self._publish('reveal', changed)
+        return changed
 
     def reveal(self, x: int, y: int) -> bool:
         """Reveal a cell. Returns True if safe, False if mine hit."""
-        if self.revealed[y][x] or self.flagged[y][x] or self.game_over:
+        return self.reveal_many([(x, y)])
+
+    def reveal_many(self, cells: Iterable[Tuple[int, int]]) -> bool:
+        """Reveal several cells as one move. Returns False if any was a mine.
+
+        Revealed and flagged cells are skipped. Zeros among the cells seed
+        a single flood fill that shares the revealed grid as its visited
+        set; the win check and the ``'reveal'`` event happen once, with
+        every changed cell. The move stops at the first mine: later cells
+        stay hidden and nothing is flood-filled.
+        """
+        if self.game_over:
             return True
+        changed = []
+        queue = deque()
+        hit_mine = False
+        borrowed = self._borrowed
+        for x, y in cells:
+            if self.revealed[y][x] or self.flagged[y][x]:
+                continue
+            # Place mines on first click if not already placed
+            if not self._mines_placed:
+                self.place_mines(exclude=(x, y))
+                self._mines_placed = True
+            if borrowed and borrowed[y]:
+                self._own_row(y)
+            self.revealed[y][x] = True
+            self.row_hidden[y] -= 1
+            changed.append((x, y))
+            if self.board[y][x] == -1:
+                hit_mine = True
+                queue.clear()
+                break
+            self._revealed_safe += 1
+            if self.board[y][x] == 0:
+                queue.append((x, y))
         
-        # Place mines on first click if not already placed
-        if not self._mines_placed:
-            self.place_mines(exclude=(x, y))
-            self.calculate_adjacent_mines()
-            self._mines_placed = True
-        
-        self.revealed[y][x] = True
+        # Iterative flood-fill for empty cells (queue-based, avoids recursion limits).
+        # The revealed grid doubles as the visited set, so huge openings need no side table.
+        neighbors = self.get_neighbors
+        while queue:
+            cx, cy = queue.popleft()
+            for nx, ny in neighbors(cx, cy):
+                if not self.revealed[ny][nx] and not self.flagged[ny][nx]:
+                    if borrowed and borrowed[ny]:
+                        self._own_row(ny)
+                    self.revealed[ny][nx] = True
+                    self.row_hidden[ny] -= 1
+                    self._revealed_safe += 1
+                    changed.append((nx, ny))
+
+                    # Continue flood-fill if this is also empty
+                    if self.board[ny][nx] == 0:
+                        queue.append((nx, ny))
         
-        if self.board[y][x] == -1:
+        if hit_mine:
             self.game_over = True
-            return False
-        
-        # Iterative flood-fill for empty cells (queue-based, avoids recursion limits)
-        if self.board[y][x] == 0:
-            queue = deque([(x, y)])
-            visited = {(x, y)}
-            
-            while queue:
-                cx, cy = queue.popleft()
-                
-                for dy in (-1, 0, 1):
-                    for dx in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx, ny = cx + dx, cy + dy
-                        
-                        if (0 <= nx < self.width and 0 <= ny < self.height and 
-                            not self.revealed[ny][nx] and not self.flagged[ny][nx] and 
-                            (nx, ny) not in visited):
-                            self.revealed[ny][nx] = True
-                            visited.add((nx, ny))
-                            
-                            # Continue flood-fill if this is also empty
-                            if self.board[ny][nx] == 0:
-                                queue.append((nx, ny))
-        
-        # Check win condition
-        if self.is_solved():
+        elif self.is_solved():
             self.game_won = True
             self.game_over = True
         
+        if changed:
+            self._publish('reveal', changed)
+        return not hit_mine
+
+    def to_dict(self) -> dict:
+        """Saved state as JSON-ready data.
+
+        Mines come from the index and only rows with revealed or flagged
+        cells are visited, so an early game saves in O(mines + rows).
+        """
+        width = self.width
+        revealed, flagged = [], []
+        for y in range(self.height):
+            if self.row_hidden[y] == width:
+                continue
+            for x in range(width):
+                if self.revealed[y][x]:
+                    revealed.append(y * width + x)
+                elif self.flagged[y][x]:
+                    flagged.append(y * width + x)
+        return {'width': width, 'height': self.height, 'num_mines': self.num_mines,
+                'mines': list(self._mines) if self._mines_placed else None,
+                'first_click': list(self.first_click) if self.first_click else None,
+                'revealed': revealed, 'flagged': flagged, 'topology': self.topology.kind,
+                'game_over': self.game_over, 'game_won': self.game_won}
+
+    @classmethod
+    def from_dict(cls, data: dict, storage=None, topology: Optional[Topology] = None) -> 'Minesweeper':
+        """Rebuild a game saved with ``to_dict``.
+
+        Torus and hex boards are rebuilt from the saved kind; other graphs
+        must be passed as ``topology``.
+        """
+        width = data['width']
+        if topology is None and data.get('topology') in ('torus', 'hexagonal'):
+            from src import topology as topologies
+            topology = getattr(topologies, data['topology'])(width, data['height'])
+        first_click = tuple(data['first_click']) if data.get('first_click') else (0, 0)
+        game = cls(width, data['height'], data['num_mines'], first_click=first_click, storage=storage,
+                   topology=topology)
+        game.first_click = tuple(data['first_click']) if data.get('first_click') else None
+        if data.get('mines') is not None:
+            game.set_mines([(i % width, i // width) for i in data['mines']])
+        for index in data['revealed']:
+            x, y = index % width, index // width
+            game.revealed[y][x] = True
+            game.row_hidden[y] -= 1
+            if game.board[y][x] != -1:
+                game._revealed_safe += 1
+        for index in data['flagged']:
+            x, y = index % width, index // width
+            game.flagged[y][x] = True
+            game.row_hidden[y] -= 1
+            game._flag_count += 1
+        game.game_over = data['game_over']
+        game.game_won = data['game_won']
+        return game
+
+    def clone(self) -> 'Minesweeper':
+        """A cheap copy of the game for lookahead search.
+
+        The copy shares the rows of the revealed and flagged grids with this
+        game; whichever side writes to a row first copies it, so a clone
+        costs O(height) and each simulated move copies only the rows it
+        touches. Once mines are placed the board itself is shared too.
+        The copy starts with no subscribers, visible buffers or journal and
+        always keeps its state in memory.
+        """
+        game = Minesweeper.__new__(Minesweeper)
+        game.__dict__.update(self.__dict__)
+        if isinstance(self.storage, ListBoardStorage):
+            board = self.board if self._mines_placed else [row[:] for row in self.board]
+            game.storage = ListBoardStorage.wrap(self.width, self.height, board,
+                                                 list(self.revealed), list(self.flagged))
+            shared = bytearray(b'\x01') * self.height
+            self._borrowed = shared
+            game._borrowed = bytearray(shared)
+            self._board_shared = game._board_shared = self._mines_placed
+        else:
+            # Rows of other storages are views; copy them into lists.
+            game.storage = ListBoardStorage.wrap(self.width, self.height, [list(row) for row in self.board],
+                                                 [list(row) for row in self.revealed],
+                                                 [list(row) for row in self.flagged])
+            game._borrowed = None
+            game._board_shared = False
+        game.board = game.storage.board
+        game.revealed = game.storage.revealed
+        game.flagged = game.storage.flagged
+        game.row_hidden = array('I', self.row_hidden)
+        game._listeners = []
+        game._visible = []
+        game._shared = None
+        game._shared_cells = None
+        game._journal = None
+        game._marks = []
+        return game
+
+    def _own_row(self, y: int):
+        """Copy row ``y`` of the revealed and flagged grids before writing to it."""
+        self._borrowed[y] = 0
+        self.revealed[y] = self.revealed[y][:]
+        self.flagged[y] = self.flagged[y][:]
+
+    def _own_board(self):
+        """Copy the board before writing to it if a clone shares it."""
+        if self._board_shared:
+            self._board_shared = False
+            self.board = self.storage.board = [row[:] for row in self.board]
+
+    def checkpoint(self) -> int:
+        """Start recording changes so ``undo()`` can return here; returns the depth.
+
+        Checkpoints nest: each ``undo()`` rolls back to the latest one.
+        """
+        if self._journal is None:
+            self._journal = []
+        self._marks.append((len(self._journal), self._flag_count, self._revealed_safe,
+                            self.game_over, self.game_won, self._mines_placed))
+        return len(self._marks)
+
+    def undo(self) -> bool:
+        """Roll back to the latest checkpoint in O(changed cells).
+
+        Returns False if there is no checkpoint. Revealed cells are hidden
+        again (and flags restored) with one ``'hide'``, ``'flag'`` and
+        ``'unflag'`` event each, so visible buffers stay current.
+        """
+        if not self._marks:
+            return False
+        start, flags, revealed_safe, game_over, game_won, mines_placed = self._marks.pop()
+        entries = self._journal[start:]
+        del self._journal[start:]
+        if not self._marks:
+            self._journal = None
+        borrowed = self._borrowed
+        hidden, flagged, unflagged = [], [], []
+        for kind, cells in reversed(entries):
+            for x, y in cells:
+                if borrowed and borrowed[y]:
+                    self._own_row(y)
+                if kind == 'reveal':
+                    self.revealed[y][x] = False
+                    self.row_hidden[y] += 1
+                    hidden.append((x, y))
+                else:
+                    flag = kind == 'unflag'
+                    self.flagged[y][x] = flag
+                    self.row_hidden[y] += -1 if flag else 1
+                    (flagged if flag else unflagged).append((x, y))
+        self._flag_count = flags
+        self._revealed_safe = revealed_safe
+        self.game_over = game_over
+        self.game_won = game_won
+        if self._mines_placed and not mines_placed:
+            # Undo first-click placement: clear the counts around each mine.
+            self._own_board()
+            for x, y in self.mine_cells():
+                self.board[y][x] = 0
+                for nx, ny in self.get_neighbors(x, y):
+                    self.board[ny][nx] = 0
+            self._mines = array('I')
+            self._mines_placed = False
+        journal, self._journal = self._journal, None
+        for kind, cells in (('hide', hidden), ('flag', flagged), ('unflag', unflagged)):
+            if cells:
+                self._publish(kind, cells)
+        self._journal = journal
         return True
 
     def toggle_flag(self, x: int, y: int) -> bool:
         """Toggle flag on a cell. Returns True if flag was toggled."""
         if self.revealed[y][x] or self.game_over:
             return False
+        if self._borrowed and self._borrowed[y]:
+            self._own_row(y)
         self.flagged[y][x] = not self.flagged[y][x]
+        self._flag_count += 1 if self.flagged[y][x] else -1
+        self.row_hidden[y] += -1 if self.flagged[y][x] else 1
+        self._publish('flag' if self.flagged[y][x] else 'unflag', [(x, y)])
         return True
 
     def get_flag_count(self) -> int:
         """Get the number of flagged cells."""
-        return sum(sum(row) for row in self.flagged)
+        return self._flag_count
 
     def is_solved(self) -> bool:
-        """Check if all safe cells are revealed."""
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.board[y][x] != -1 and not self.revealed[y][x]:
-                    return False
-        return True
-
-    def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
-        """Get all valid neighbor coordinates."""
-        neighbors = []
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    neighbors.append((nx, ny))
-        return neighbors
+        """Check if all safe cells are revealed (O(1) via the reveal counter)."""
+        return self._revealed_safe == self.width * self.height - self.num_mines
 
     def chord(self, x: int, y: int) -> bool:
         """Chord operation: reveal all unflagged neighbors if all mines are flagged."""
@@ -149,10 +530,6 @@ class Minesweeper:
         flagged_count = sum(1 for nx, ny in neighbors if self.flagged[ny][nx])
         
         if flagged_count == self.board[y][x]:
-            # All mines are flagged, reveal unflagged neighbors
-            for nx, ny in neighbors:
-                if not self.revealed[ny][nx] and not self.flagged[ny][nx]:
-                    if not self.reveal(nx, ny):
-                        return False  # Hit a mine
-            return True
+            # All mines are flagged, reveal unflagged neighbors in one move
+            return self.reveal_many(neighbors)
         return False
@@ -0,0 +1,145 @@
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+Constraint = Tuple[Tuple[int, ...], int]
+ComponentCounts = Dict[int, Tuple[int, List[int]]]
+PatternKey = Tuple[Constraint, ...]
+
+# The eight rotations/reflections of the square grid.
+TRANSFORMS = (
+    lambda x, y: (x, y),
+    lambda x, y: (-x, y),
+    lambda x, y: (x, -y),
+    lambda x, y: (-x, -y),
+    lambda x, y: (y, x),
+    lambda x, y: (-y, x),
+    lambda x, y: (y, -x),
+    lambda x, y: (-y, -x),
+)
+
+
+def canonicalize(cells: Sequence[Cell], constraints: Sequence[Constraint]) -> Tuple[PatternKey, List[int]]:
+    """Normalise a frontier component so symmetric copies share one key.
+
+    Each of the eight grid symmetries orders the cells by transformed
+    position; the constraint set rewritten in that order is a candidate
+    key and the smallest one wins. Returns the key and ``rank``, where
+    ``rank[i]`` is the component index of the i-th canonical cell.
+    """
+    best_key = None
+    best_rank: List[int] = []
+    for transform in TRANSFORMS:
+        points = [transform(x, y) for x, y in cells]
+        rank = sorted(range(len(cells)), key=points.__getitem__)
+        position = [0] * len(cells)
+        for r, index in enumerate(rank):
+            position[index] = r
+        key = tuple(sorted((tuple(sorted(position[c] for c in members)), mines)
+                           for members, mines in constraints))
+        if best_key is None or key < best_key:
+            best_key, best_rank = key, rank
+    return best_key, best_rank
+
+
+class PatternCache:
+    """LRU cache of component enumeration results, keyed by canonical pattern.
+
+    Results are stored in canonical cell order, so a hit can be mapped onto
+    any rotated, reflected or translated copy of the same pattern. The
+    cache is shared by default across moves and games; give it a ``path``
+    to load it on start-up and ``save()`` it between runs.
+    """
+
+    def __init__(self, capacity: int = 4096, max_cells: int = 48, path: Optional[str] = None):
+        self.capacity = capacity
+        self.max_cells = max_cells
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[PatternKey, ComponentCounts]' = OrderedDict()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, cells: Sequence[Cell], constraints: Sequence[Constraint]):
+        """Return (counts or None, key, rank); key/rank are reused by ``store``."""
+        if len(cells) > self.max_cells:
+            return None, None, None
+        key, rank = canonicalize(cells, constraints)
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            return None, key, rank
+        self._entries.move_to_end(key)
+        self.hits += 1
+        counts: ComponentCounts = {}
+        for mines, (solutions, canonical) in cached.items():
+            per_cell = [0] * len(rank)
+            for r, index in enumerate(rank):
+                per_cell[index] = canonical[r]
+            counts[mines] = (solutions, per_cell)
+        return counts, key, rank
+
+    def store(self, key: Optional[PatternKey], rank: Optional[List[int]], counts: ComponentCounts):
+        """Remember ``counts`` for a pattern returned by a missed ``lookup``."""
+        if key is None:
+            return
+        self._entries[key] = {mines: (solutions, [per_cell[index] for index in rank])
+                              for mines, (solutions, per_cell) in counts.items()}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def get_hit_rate(self) -> float:
+        """Calculate hit rate as percentage."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100
+
+    def get_summary(self) -> str:
+        """One-line summary of cache effectiveness."""
+        return (f"Pattern cache: {len(self._entries)} patterns, {self.hits} hits, "
+                f"{self.misses} misses ({self.get_hit_rate():.1f}% hit rate)")
+
+    def clear(self):
+        """Drop every cached pattern and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: Optional[str] = None):
+        """Save cached patterns to a JSON file."""
+        path = path or self.path
+        if not path:
+            return
+        entries = [[[list(members), mines] for members, mines in key] +
+                   [{str(k): [solutions, per_cell] for k, (solutions, per_cell) in counts.items()}]
+                   for key, counts in self._entries.items()]
+        import json  # deferred: keeps solver imports light for headless start-up
+        try:
+            with open(path, 'w') as f:
+                json.dump(entries, f)
+        except IOError:
+            pass
+
+    def load(self, path: str):
+        """Load cached patterns from a JSON file, keeping the most recent ``capacity``."""
+        import json
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        for entry in entries[-self.capacity:]:
+            *constraints, counts = entry
+            key = tuple((tuple(members), mines) for members, mines in constraints)
+            self._entries[key] = {int(k): (solutions, per_cell) for k, (solutions, per_cell) in counts.items()}
+
+
+# Process-wide cache used by ConstraintSolver unless told otherwise.
+shared_cache = PatternCache()
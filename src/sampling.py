@@ -0,0 +1,246 @@
+import math
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.solver import Cell, build_constraints, split_components
+
+
+class SampleEstimate:
+    """Per-cell mine probability estimates from a sampling run.
+
+    ``batch_means`` holds each cell's mean over every full batch of the
+    chain, the inputs to its interval.
+    """
+
+    def __init__(self, probabilities: Dict[Cell, float], intervals: Dict[Cell, Tuple[float, float]],
+                 outside: Optional[float], samples: int, elapsed: float,
+                 batch_means: Optional[Dict[Cell, List[float]]] = None):
+        self.probabilities = probabilities
+        self.intervals = intervals
+        self.outside = outside
+        self.samples = samples
+        self.elapsed = elapsed
+        self.batch_means = batch_means if batch_means is not None else {}
+
+
+def _log_comb(n: int, k: int) -> float:
+    """Natural log of C(n, k), or -inf when k is out of range."""
+    if k < 0 or k > n:
+        return float('-inf')
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+class MonteCarloEstimator:
+    """Anytime frontier probability estimator using constraint-respecting MCMC.
+
+    The chain lives on mine assignments of the whole frontier that satisfy
+    every revealed number. Each step picks a cell, takes it and the cells
+    it shares numbers with (up to ``window`` cells), and redraws that block
+    exactly from its conditional distribution given the rest of the board,
+    weighting each option by the ways to fill the unconstrained cells.
+    That block Gibbs update keeps the chain on consistent boards and makes
+    its long-run averages match the exact solver's probabilities.
+
+    Sampling stops at ``time_budget`` seconds or ``max_samples`` steps,
+    whichever comes first. Intervals are 95% batch-means intervals, which
+    account for the correlation between successive samples.
+    """
+
+    def __init__(self, time_budget: float = 0.05, max_samples: int = 20000,
+                 window: int = 10, batches: int = 20, seed: Optional[int] = None):
+        self.time_budget = time_budget
+        self.max_samples = max_samples
+        self.window = window
+        self.batches = batches
+        self.random = random.Random(seed)
+
+    def estimate(self, game, numbers: Optional[Iterable[Cell]] = None,
+                 hidden: Optional[int] = None) -> SampleEstimate:
+        """Sample the current frontier of ``game`` within the budget.
+
+        ``numbers`` and ``hidden`` are passed through to build_constraints.
+        """
+        start = time.time()
+        deadline = start + self.time_budget
+        constraints, hidden = build_constraints(game, numbers, hidden)
+
+        cells: List[Cell] = []
+        members: List[Tuple[int, ...]] = []
+        need: List[int] = []
+        for order, component in split_components(constraints):
+            offset = len(cells)
+            cells.extend(order)
+            for local, mines in component:
+                members.append(tuple(offset + i for i in local))
+                need.append(mines)
+        size = len(cells)
+        outside = hidden - size
+        remaining = game.num_mines - game.get_flag_count()
+
+        by_cell: List[List[int]] = [[] for _ in range(size)]
+        for index, group in enumerate(members):
+            for cell in group:
+                by_cell[cell].append(index)
+
+        state = self._initial_state(size, members, need, by_cell, remaining, outside, deadline)
+        if state is None:
+            return SampleEstimate({}, {}, None, 0, time.time() - start)
+        return self._run_chain(cells, members, need, by_cell, state, remaining, outside, deadline, start)
+
+    def _initial_state(self, size: int, members: Sequence[Tuple[int, ...]], need: Sequence[int],
+                       by_cell: Sequence[List[int]], remaining: int, outside: int,
+                       deadline: float) -> Optional[List[int]]:
+        """Depth-first search for one consistent assignment, trying values in random order."""
+        placed = [0] * len(need)
+        open_cells = [len(group) for group in members]
+        assignment = [0] * size
+        order = [(0, 1) if self.random.random() < 0.5 else (1, 0) for _ in range(size)]
+        nodes = 0
+
+        # Stack entries: (cell, next choice index, mines placed before this cell).
+        stack = [(0, 0, 0)]
+        while stack:
+            nodes += 1
+            if nodes & 0x3FF == 0 and time.time() > deadline:
+                return None
+            cell, choice, mines = stack.pop()
+            if cell == size:
+                if 0 <= remaining - mines <= outside:
+                    return assignment
+                continue
+            if choice > 0:
+                for index in by_cell[cell]:
+                    placed[index] -= assignment[cell]
+                    open_cells[index] += 1
+            if choice == 2:
+                continue
+            value = order[cell][choice]
+            stack.append((cell, choice + 1, mines))
+            assignment[cell] = value
+            ok = True
+            for index in by_cell[cell]:
+                placed[index] += value
+                open_cells[index] -= 1
+                if placed[index] > need[index] or placed[index] + open_cells[index] < need[index]:
+                    ok = False
+            if ok:
+                stack.append((cell + 1, 0, mines + value))
+        return None
+
+    def _window(self, cell: int, members, by_cell) -> List[int]:
+        """The cell plus a random selection of cells sharing a number with it."""
+        neighbours = {other for index in by_cell[cell] for other in members[index]}
+        neighbours.discard(cell)
+        chosen = list(neighbours)
+        if len(chosen) >= self.window:
+            chosen = self.random.sample(chosen, self.window - 1)
+        return [cell] + chosen
+
+    def _redraw(self, block: List[int], state: List[int], members, need, by_cell,
+                mines: int, remaining: int, outside: int) -> int:
+        """Resample ``block`` from its exact conditional; returns the new mine total."""
+        position = {cell: i for i, cell in enumerate(block)}
+        touched = sorted({index for cell in block for index in by_cell[cell]})
+        # Mines each touched number still needs from the block, and the
+        # block cells that can supply them.
+        owed = {}
+        open_cells = {}
+        for index in touched:
+            outside_block = sum(state[c] for c in members[index] if c not in position)
+            owed[index] = need[index] - outside_block
+            open_cells[index] = sum(1 for c in members[index] if c in position)
+        base = mines - sum(state[c] for c in block)
+
+        options: List[Tuple[float, Tuple[int, ...]]] = []
+        values = [0] * len(block)
+
+        def search(i: int, count: int):
+            if i == len(block):
+                log_weight = _log_comb(outside, remaining - base - count)
+                if log_weight != float('-inf'):
+                    options.append((log_weight, tuple(values)))
+                return
+            cell = block[i]
+            for value in (0, 1):
+                ok = True
+                for index in by_cell[cell]:
+                    owed[index] -= value
+                    open_cells[index] -= 1
+                    if owed[index] < 0 or owed[index] > open_cells[index]:
+                        ok = False
+                if ok:
+                    values[i] = value
+                    search(i + 1, count + value)
+                for index in by_cell[cell]:
+                    owed[index] += value
+                    open_cells[index] += 1
+
+        search(0, 0)
+        if not options:
+            return mines
+        top = max(weight for weight, _ in options)
+        weights = [math.exp(weight - top) for weight, _ in options]
+        _, chosen = self.random.choices(options, weights=weights)[0]
+        for cell, value in zip(block, chosen):
+            state[cell] = value
+        return base + sum(chosen)
+
+    def _run_chain(self, cells: List[Cell], members, need, by_cell, state: List[int],
+                   remaining: int, outside: int, deadline: float, start: float) -> SampleEstimate:
+        size = len(cells)
+        mines = sum(state)
+        batch_size = max(1, self.max_samples // self.batches)
+        # Lazy per-cell accumulation: a cell's running total only needs
+        # updating when its value changes.
+        hits = [0] * size
+        since = [0] * size
+        # Flushed totals at the start of the current batch
+        previous = [0] * size
+        batch_hits: List[List[float]] = []
+        outside_sum = 0.0
+        batch_start = 0
+        samples = 0
+
+        def flush(now: int):
+            for i in range(size):
+                hits[i] += state[i] * (now - since[i])
+                since[i] = now
+
+        while samples < self.max_samples:
+            if samples & 0x1F == 0 and samples and time.time() > deadline:
+                break
+            if size:
+                block = self._window(self.random.randrange(size), members, by_cell)
+                before = [state[c] for c in block]
+                mines = self._redraw(block, state, members, need, by_cell, mines, remaining, outside)
+                for cell, old in zip(block, before):
+                    if state[cell] != old:
+                        hits[cell] += old * (samples - since[cell])
+                        since[cell] = samples
+            samples += 1
+            if outside:
+                outside_sum += (remaining - mines) / outside
+            if samples - batch_start == batch_size:
+                flush(samples)
+                batch_hits.append([(hits[i] - previous[i]) / batch_size for i in range(size)])
+                previous = hits[:]
+                batch_start = samples
+
+        flush(samples)
+        probabilities = {cell: hits[i] / samples for i, cell in enumerate(cells)}
+        batch_means = {cell: [batch[i] for batch in batch_hits] for i, cell in enumerate(cells)}
+        intervals = {cell: self._interval(probabilities[cell], batch_means[cell]) for cell in cells}
+        outside_prob = outside_sum / samples if outside else None
+        return SampleEstimate(probabilities, intervals, outside_prob, samples, time.time() - start,
+                              batch_means)
+
+    @staticmethod
+    def _interval(mean: float, batch_means: Sequence[float]) -> Tuple[float, float]:
+        """95% batch-means confidence interval, clipped to [0, 1]."""
+        count = len(batch_means)
+        if count < 2:
+            return 0.0, 1.0
+        variance = sum((m - mean) ** 2 for m in batch_means) / (count - 1)
+        half = 1.96 * math.sqrt(variance / count)
+        return max(0.0, mean - half), min(1.0, mean + half)
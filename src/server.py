@@ -0,0 +1,285 @@
+import asyncio
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.minesweeper import Minesweeper
+from src.view import FLAG, HIDDEN
+
+Cell = Tuple[int, int]
+
+# Queue marker telling a lagging session's writer to send a fresh snapshot.
+_RESYNC = object()
+
+
+def _encode(message: Dict) -> bytes:
+    """Serialise one protocol message as a compact JSON line."""
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode()
+
+
+class GameRoom:
+    """One shared game and the sessions watching it.
+
+    Engine change events are collected while a command runs and sent as a
+    single delta afterwards, so a chord or flood fill reaches clients as
+    one message listing only the cells that changed.
+    """
+
+    def __init__(self, game_id: int, game: Minesweeper, owner: Optional['Session'] = None):
+        self.game_id = game_id
+        self.game = game
+        self.owner = owner
+        self.seq = 0
+        self.sessions: Set['Session'] = set()
+        self._pending: List[Tuple[int, int, int]] = []
+        game.subscribe(self.on_game_change)
+
+    def close(self):
+        """Stop listening to the game so it can be freed."""
+        self.game.unsubscribe(self.on_game_change)
+        self._pending = []
+
+    def on_game_change(self, kind: str, cells: List[Cell]):
+        """Record changed cells with their code for the next delta."""
+        for x, y in cells:
+            if kind == 'reveal':
+                self._pending.append((x, y, self.game.board[y][x]))
+            else:
+                self._pending.append((x, y, FLAG if kind == 'flag' else HIDDEN))
+
+    def status(self) -> str:
+        if self.game.game_won:
+            return 'won'
+        return 'lost' if self.game.game_over else 'playing'
+
+    def apply(self, op: str, x: int, y: int):
+        """Run one move on the game and broadcast what changed."""
+        if op == 'reveal':
+            self.game.reveal(x, y)
+        elif op == 'flag':
+            self.game.toggle_flag(x, y)
+        else:
+            self.game.chord(x, y)
+        self.flush()
+
+    def flush(self):
+        """Send pending changes to every session as one delta."""
+        if not self._pending:
+            return
+        self.seq += 1
+        data = _encode({'type': 'delta', 'game': self.game_id, 'seq': self.seq,
+                        'cells': self._pending, 'status': self.status()})
+        self._pending = []
+        for session in list(self.sessions):
+            session.send(data)
+
+    def snapshot(self) -> bytes:
+        """Every revealed or flagged cell, for a client joining or resyncing."""
+        game = self.game
+        cells = []
+        for y in range(game.height):
+            if game.row_hidden[y] == game.width:
+                continue
+            for x in range(game.width):
+                if game.revealed[y][x]:
+                    cells.append((x, y, game.board[y][x]))
+                elif game.flagged[y][x]:
+                    cells.append((x, y, FLAG))
+        return _encode({'type': 'snapshot', 'game': self.game_id, 'seq': self.seq,
+                        'width': game.width, 'height': game.height, 'mines': game.num_mines,
+                        'cells': cells, 'status': self.status()})
+
+
+class Session:
+    """One connected client with a bounded outgoing queue.
+
+    Broadcasts never wait on a client: when a slow client's queue fills,
+    its backlog is dropped and replaced by a single resync marker, and the
+    writer sends a fresh snapshot once the client catches up.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int):
+        self.writer = writer
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.room: Optional[GameRoom] = None
+        # Rooms this client created that are still open
+        self.created: Set[int] = set()
+        self.resyncs = 0
+
+    def send(self, data):
+        """Queue a message without blocking the caller."""
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+            self.resyncs += 1
+
+    async def write_loop(self):
+        """Drain the queue to the socket, waiting on the transport's flow control."""
+        while True:
+            data = await self.queue.get()
+            if data is _RESYNC:
+                if self.room is None:
+                    continue
+                data = self.room.snapshot()
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class GameServer:
+    """Asyncio TCP server hosting shared games over newline-delimited JSON.
+
+    Client commands, one JSON object per line:
+      {"op": "new", "width": 9, "height": 9, "mines": 10}
+      {"op": "join", "game": 1}
+      {"op": "reveal" | "flag" | "chord", "x": 3, "y": 4}
+      {"op": "leave"}
+
+    ``new`` and ``join`` answer with a snapshot of the known cells; after
+    that every move in the room is streamed to all its sessions as a delta
+    of ``[x, y, code]`` triples (0-8 number, -1 mine, 9 flag, 10 hidden).
+    Errors come back as {"type": "error", "message": ...}.
+
+    Boards are limited to ``max_side`` cells per side and need at least
+    9 cells; a new game may hold at most ``width * height - 9`` mines,
+    leaving room for the first-click safe block. A room is closed when its
+    last session leaves, and one client may keep at most
+    ``max_rooms_per_client`` of the rooms it created open.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, queue_size: int = 256,
+                 max_side: int = 1000, max_rooms_per_client: int = 4):
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.max_side = max_side
+        self.max_rooms_per_client = max_rooms_per_client
+        self.rooms: Dict[int, GameRoom] = {}
+        self.sessions: Set[Session] = set()
+        self._next_id = 1
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> Tuple[str, int]:
+        """Start listening; returns the bound (host, port)."""
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def close(self):
+        """Stop accepting clients and disconnect the ones still attached."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for session in list(self.sessions):
+            session.writer.close()
+
+    def create_game(self, width: int, height: int, mines: int,
+                    owner: Optional[Session] = None) -> GameRoom:
+        """Host a new game for ``owner`` (if any); returns its room.
+
+        Raises ValueError for sizes outside ``1..max_side``, boards under
+        9 cells, a mine count that cannot fit around the first-click safe
+        block, or an owner already holding ``max_rooms_per_client`` rooms.
+        """
+        for name, side in (('width', width), ('height', height)):
+            if not 1 <= side <= self.max_side:
+                raise ValueError(f"{name} must be between 1 and {self.max_side}")
+        if width * height < 9:
+            raise ValueError(f"board must have at least 9 cells, not {width * height}")
+        if not 0 <= mines <= width * height - 9:
+            raise ValueError(f"mines must be between 0 and {width * height - 9}")
+        if owner is not None and len(owner.created) >= self.max_rooms_per_client:
+            raise ValueError(f"at most {self.max_rooms_per_client} open games per client")
+        # Mines are placed on the first reveal, which keeps first-click safety
+        room = GameRoom(self._next_id, Minesweeper(width, height, mines, first_click=(0, 0)), owner)
+        self.rooms[room.game_id] = room
+        if owner is not None:
+            owner.created.add(room.game_id)
+        self._next_id += 1
+        return room
+
+    def close_room(self, room: GameRoom):
+        """Drop a room and release its game."""
+        self.rooms.pop(room.game_id, None)
+        room.close()
+        if room.owner is not None:
+            room.owner.created.discard(room.game_id)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = Session(writer, self.queue_size)
+        self.sessions.add(session)
+        writer_task = asyncio.ensure_future(session.write_loop())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    self.handle_command(session, json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    session.send(_encode({'type': 'error', 'message': str(e)}))
+        except (ConnectionError, ValueError):
+            # Dropped connection or an over-long line
+            pass
+        finally:
+            self._leave(session)
+            self.sessions.discard(session)
+            writer_task.cancel()
+            writer.close()
+
+    def handle_command(self, session: Session, command: Dict):
+        """Dispatch one decoded client command."""
+        op = command['op']
+        if op == 'new':
+            room = self.create_game(int(command['width']), int(command['height']), int(command['mines']),
+                                    owner=session)
+            self._join(session, room)
+        elif op == 'join':
+            room = self.rooms.get(command['game'])
+            if room is None:
+                raise KeyError(f"no game {command['game']}")
+            self._join(session, room)
+        elif op == 'leave':
+            self._leave(session)
+        elif op in ('reveal', 'flag', 'chord'):
+            room = session.room
+            if room is None:
+                raise ValueError("join a game first")
+            x, y = int(command['x']), int(command['y'])
+            if not (0 <= x < room.game.width and 0 <= y < room.game.height):
+                raise ValueError(f"cell ({x}, {y}) is off the board")
+            room.apply(op, x, y)
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    def _join(self, session: Session, room: GameRoom):
+        self._leave(session)
+        session.room = room
+        room.sessions.add(session)
+        session.send(room.snapshot())
+
+    def _leave(self, session: Session):
+        room = session.room
+        if room is not None:
+            room.sessions.discard(session)
+            session.room = None
+            if not room.sessions:
+                self.close_room(room)
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765):
+    """Run a server until cancelled."""
+    server = GameServer(host, port)
+    await server.start()
+    print(f"Minesweeper server listening on {server.host}:{server.port}")
+    try:
+        await asyncio.Future()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    import sys
+    asyncio.run(serve(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8765))
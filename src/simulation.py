@@ -0,0 +1,228 @@
+import os
+import random
+import time
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.ai import MinesweeperAI
+from src.batch import BatchAI, BatchMinesweeper
+from src.frontier import FrontierTracker
+from src.minesweeper import Minesweeper
+from src.telemetry import GameRecord
+from src.view import FLAG, HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+
+# Board presets, keyed like the best-time entries in GameStats.
+PRESETS = {
+    'beginner': (9, 9, 10),
+    'intermediate': (16, 16, 40),
+    'expert': (30, 16, 99),
+}
+
+
+class SimulationResult:
+    """Outcome of a self-play run; ``guesses`` is set when the runner counts them."""
+
+    def __init__(self, games: int, wins: int, elapsed: float, guesses: Optional[int] = None):
+        self.games = games
+        self.wins = wins
+        self.elapsed = elapsed
+        self.guesses = guesses
+
+    def get_win_rate(self) -> float:
+        """Calculate win rate as percentage."""
+        if self.games == 0:
+            return 0.0
+        return (self.wins / self.games) * 100
+
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def guesses_per_game(self) -> float:
+        return self.guesses / self.games if self.guesses is not None and self.games else 0.0
+
+    def get_summary(self) -> str:
+        summary = (f"{self.games} games, {self.get_win_rate():.1f}% won, "
+                   f"{self.games_per_second():.0f} games/sec")
+        if self.guesses is not None:
+            summary += f", {self.guesses_per_game():.2f} guesses/game"
+        return summary
+
+
+class RulePlayer:
+    """Single-cell rules and random guesses for one game: ``BatchAI``'s policy.
+
+    Only a ``FrontierTracker`` is kept, handing over the numbers touched
+    since the last move; there is no solver, sampler or endgame search to
+    build, so per-game setup stays as light as the batch engine's.
+    """
+
+    def __init__(self, game: Minesweeper):
+        self.game = game
+        self.view = BoardView(game)
+        self._dirty: Set[Cell] = set()
+        self.tracker = FrontierTracker(self.view, dirty=(self._dirty,))
+        game.subscribe(self.tracker.apply)
+
+    def step(self) -> bool:
+        """Flag every forced mine and reveal every forced safe cell, else guess.
+
+        Returns False when no hidden cell is left to play.
+        """
+        cell = self.view.cell
+        mines: Set[Cell] = set()
+        safe: Set[Cell] = set()
+        for x, y in self._dirty:
+            number = cell(x, y)
+            if not 0 < number < FLAG:
+                continue
+            hidden = []
+            flags = 0
+            for n in self.view.get_neighbors(x, y):
+                code = cell(*n)
+                if code == HIDDEN:
+                    hidden.append(n)
+                elif code == FLAG:
+                    flags += 1
+            if flags + len(hidden) == number:
+                mines.update(hidden)
+            elif flags == number:
+                safe.update(hidden)
+        self._dirty.clear()
+        for x, y in mines:
+            self.game.toggle_flag(x, y)
+        safe -= mines
+        if not mines and not safe:
+            guess = self._random_hidden_cell()
+            if guess is None:
+                return False
+            safe.add(guess)
+        if safe:
+            self.game.reveal_many(sorted(safe, key=lambda c: (c[1], c[0])))
+        return True
+
+    def _random_hidden_cell(self) -> Optional[Cell]:
+        width, height = self.game.width, self.game.height
+        cell = self.view.cell
+        for _ in range(64):
+            x, y = random.randrange(width), random.randrange(height)
+            if cell(x, y) == HIDDEN:
+                return x, y
+        cells = [(x, y) for y in range(height) for x in range(width) if cell(x, y) == HIDDEN]
+        return random.choice(cells) if cells else None
+
+
+def simulate_objects(games: int, difficulty: str = 'beginner', seed: Optional[int] = None) -> SimulationResult:
+    """Play ``games`` self-play games one ``Minesweeper`` object at a time.
+
+    Each game gets a ``RulePlayer``, the policy ``BatchAI`` applies, so
+    the two runners compare engines rather than player setup.
+    """
+    width, height, mines = PRESETS[difficulty]
+    if seed is not None:
+        random.seed(seed)
+    start_cell = (width // 2, height // 2)
+    wins = 0
+    start = time.time()
+    for _ in range(games):
+        game = Minesweeper(width, height, mines, first_click=start_cell)
+        player = RulePlayer(game)
+        game.reveal(*start_cell)
+        while not game.game_over and player.step():
+            pass
+        wins += game.game_won
+    return SimulationResult(games, wins, time.time() - start)
+
+
+def simulate_batch(games: int, difficulty: str = 'beginner', seed: Optional[int] = None,
+                   batch_size: int = 1000) -> SimulationResult:
+    """Play ``games`` self-play games in batches of ``batch_size`` with ``BatchAI``."""
+    width, height, mines = PRESETS[difficulty]
+    rng = random.Random(seed)
+    start_cell = (width // 2, height // 2)
+    wins = 0
+    start = time.time()
+    for first in range(0, games, batch_size):
+        count = min(batch_size, games - first)
+        batch = BatchMinesweeper(count, width, height, mines, first_click=start_cell,
+                                 seed=rng.getrandbits(32))
+        ai = BatchAI(batch, seed=rng.getrandbits(32))
+        batch.reveal(batch.cells_mask([start_cell] * count))
+        while ai.step():
+            pass
+        wins += sum(batch.won)
+    return SimulationResult(games, wins, time.time() - start)
+
+
+def play_records(seeds: Iterable[int], difficulty: str = 'beginner',
+                 endgame_cells: int = 24, info_gain: bool = True) -> Iterator[GameRecord]:
+    """Play one full-AI game per seed, yielding a telemetry record as each ends.
+
+    The global RNG is seeded per game, so a record's seed replays its game.
+    Games that run past four moves per cell count as losses.
+    ``endgame_cells`` and ``info_gain`` are passed to the AI.
+    """
+    width, height, mines = PRESETS[difficulty]
+    start_cell = (width // 2, height // 2)
+    limit = width * height * 4
+    for seed in seeds:
+        random.seed(seed)
+        start = time.perf_counter()
+        game = Minesweeper(width, height, mines, first_click=start_cell)
+        ai = MinesweeperAI(game, workers=1, endgame_cells=endgame_cells, info_gain=info_gain)
+        game.reveal(*start_cell)
+        moves = 1
+        while not game.game_over and moves < limit:
+            ai.make_move()
+            moves += 1
+        ai.close()
+        yield GameRecord(seed, width, height, mines, moves, ai.guess_probabilities,
+                         game.game_won, time.perf_counter() - start)
+
+
+def simulate_ai(games: int, difficulty: str = 'beginner', seed: int = 0,
+                endgame_cells: int = 24, info_gain: bool = True) -> SimulationResult:
+    """Play ``games`` full-AI games in this process and count their guesses."""
+    start = time.time()
+    wins = guesses = 0
+    for record in play_records(range(seed, seed + games), difficulty, endgame_cells, info_gain):
+        wins += record.won
+        guesses += record.guesses
+    return SimulationResult(games, wins, time.time() - start, guesses)
+
+
+def _record_chunk(args) -> List[GameRecord]:
+    """Worker entry point: play a list of seeds and return their records."""
+    seeds, difficulty = args
+    return list(play_records(seeds, difficulty))
+
+
+def stream_records(games: int, difficulty: str = 'beginner', seed: int = 0,
+                   workers: Optional[int] = None, chunk: int = 256) -> Iterator[GameRecord]:
+    """Yield telemetry for seeds ``seed .. seed + games - 1`` in seed order.
+
+    Games are played in ``workers`` processes (default: one per CPU; 1
+    plays in this process), ``chunk`` seeds per task. At most two tasks
+    per worker are in flight, so memory stays flat however long the run.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from play_records(range(seed, seed + games), difficulty)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    starts = iter(range(seed, seed + games, chunk))
+    end = seed + games
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for first in starts:
+            pending.append(pool.submit(_record_chunk, (range(first, min(first + chunk, end)), difficulty)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            records = pending.popleft().result()
+            first = next(starts, None)
+            if first is not None:
+                pending.append(pool.submit(_record_chunk, (range(first, min(first + chunk, end)), difficulty)))
+            yield from records
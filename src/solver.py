@@ -0,0 +1,399 @@
+import itertools
+import math
+import os
+import time
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.patterns import PatternCache, shared_cache
+from src.view import FLAG, HIDDEN
+
+Cell = Tuple[int, int]
+# A constraint is (indices of hidden cells, mines still to place among them).
+Constraint = Tuple[Tuple[int, ...], int]
+# Enumeration result: mines in component -> (solution count, per-cell mine counts).
+ComponentCounts = Dict[int, Tuple[int, List[int]]]
+
+
+class EnumerationTimeout(Exception):
+    """Raised when a component enumeration runs past its deadline."""
+
+
+def build_constraints(game, numbers: Optional[Iterable[Cell]] = None,
+                      hidden: Optional[int] = None) -> Tuple[List[Tuple[List[Cell], int]], int]:
+    """Collect (hidden neighbour cells, remaining mines) for every revealed number.
+
+    Returns the constraints plus the number of hidden, unflagged cells.
+    Callers that track the frontier incrementally pass the revealed
+    ``numbers`` to inspect and the ``hidden`` count, skipping the
+    full-board scan.
+    """
+    if numbers is None or hidden is None:
+        numbers = []
+        hidden = 0
+        for y in range(game.height):
+            for x in range(game.width):
+                if not game.revealed[y][x]:
+                    if not game.flagged[y][x]:
+                        hidden += 1
+                elif game.board[y][x] > 0:
+                    numbers.append((x, y))
+
+    constraints = []
+    code = getattr(game, 'cell', None)
+    if code is not None:
+        # BoardView: read the packed visible codes instead of three grids
+        for x, y in numbers:
+            cells = []
+            flagged = 0
+            for nx, ny in game.get_neighbors(x, y):
+                neighbor = code(nx, ny)
+                if neighbor == FLAG:
+                    flagged += 1
+                elif neighbor == HIDDEN:
+                    cells.append((nx, ny))
+            if cells:
+                constraints.append((cells, code(x, y) - flagged))
+        return constraints, hidden
+
+    for x, y in numbers:
+        cells = []
+        flagged = 0
+        for nx, ny in game.get_neighbors(x, y):
+            if game.flagged[ny][nx]:
+                flagged += 1
+            elif not game.revealed[ny][nx]:
+                cells.append((nx, ny))
+        if cells:
+            constraints.append((cells, game.board[y][x] - flagged))
+    return constraints, hidden
+
+
+def split_components(constraints: Sequence[Tuple[List[Cell], int]]) -> List[Tuple[List[Cell], List[Constraint]]]:
+    """Split constraints into independent components of connected frontier cells.
+
+    Cells in each component are ordered breadth-first through shared
+    constraints, which lets the enumerator close constraints early.
+    """
+    cell_constraints: Dict[Cell, List[int]] = defaultdict(list)
+    for index, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            cell_constraints[cell].append(index)
+
+    seen_cells: Set[Cell] = set()
+    components = []
+    for start in cell_constraints:
+        if start in seen_cells:
+            continue
+        order = []
+        used = set()
+        queue = deque([start])
+        seen_cells.add(start)
+        while queue:
+            cell = queue.popleft()
+            order.append(cell)
+            for index in cell_constraints[cell]:
+                if index in used:
+                    continue
+                used.add(index)
+                for other in constraints[index][0]:
+                    if other not in seen_cells:
+                        seen_cells.add(other)
+                        queue.append(other)
+        position = {cell: i for i, cell in enumerate(order)}
+        local = [(tuple(position[c] for c in constraints[i][0]), constraints[i][1]) for i in sorted(used)]
+        components.append((order, local))
+    return components
+
+
+def enumerate_component(size: int, constraints: Sequence[Constraint],
+                        fixed: Optional[Dict[int, int]] = None,
+                        deadline: Optional[float] = None) -> ComponentCounts:
+    """Count every mine assignment of ``size`` cells that satisfies ``constraints``.
+
+    ``fixed`` pins some cells to 0/1 so a component can be split into
+    independent subtrees. Raises EnumerationTimeout past ``deadline``.
+    """
+    fixed = fixed or {}
+    need = [mines for _, mines in constraints]
+    placed = [0] * len(constraints)
+    open_cells = [len(cells) for cells, _ in constraints]
+    by_cell: List[List[int]] = [[] for _ in range(size)]
+    for index, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            by_cell[cell].append(index)
+
+    results: ComponentCounts = {}
+    assignment = [0] * size
+    nodes = 0
+
+    def assign(cell: int, value: int) -> bool:
+        ok = True
+        for index in by_cell[cell]:
+            placed[index] += value
+            open_cells[index] -= 1
+            if placed[index] > need[index] or placed[index] + open_cells[index] < need[index]:
+                ok = False
+        return ok
+
+    def unassign(cell: int, value: int):
+        for index in by_cell[cell]:
+            placed[index] -= value
+            open_cells[index] += 1
+
+    options = [(fixed[cell],) if cell in fixed else (0, 1) for cell in range(size)]
+    # Depth-first with an explicit stack, as components can be longer than
+    # the recursion limit. Frames are [cell, mines so far, next option].
+    stack = [[0, 0, 0]]
+    while stack:
+        frame = stack[-1]
+        cell, mines, option = frame
+        if option == 0:
+            nodes += 1
+            # Check the clock on the first node and every 256 after it.
+            if deadline is not None and nodes & 0xFF == 1 and time.time() > deadline:
+                raise EnumerationTimeout()
+            if cell == size:
+                solutions, per_cell = results.get(mines, (0, None))
+                if per_cell is None:
+                    per_cell = [0] * size
+                for i in range(size):
+                    per_cell[i] += assignment[i]
+                results[mines] = (solutions + 1, per_cell)
+                stack.pop()
+                continue
+        else:
+            unassign(cell, options[cell][option - 1])
+        if option == len(options[cell]):
+            assignment[cell] = 0
+            stack.pop()
+            continue
+        value = options[cell][option]
+        frame[2] = option + 1
+        assignment[cell] = value
+        if assign(cell, value):
+            stack.append([cell + 1, mines + value, 0])
+    return results
+
+
+def merge_counts(parts: Sequence[ComponentCounts], size: int) -> ComponentCounts:
+    """Exactly combine the counts of disjoint subtrees of one component."""
+    merged: ComponentCounts = {}
+    for part in parts:
+        for mines, (solutions, per_cell) in part.items():
+            total, totals = merged.get(mines, (0, [0] * size))
+            merged[mines] = (total + solutions, [a + b for a, b in zip(totals, per_cell)])
+    return merged
+
+
+def split_assignments(size: int, constraints: Sequence[Constraint], depth: int) -> List[Dict[int, int]]:
+    """Pick the ``depth`` most constrained cells and list their feasible 0/1 pinnings."""
+    degree = [0] * size
+    for cells, _ in constraints:
+        for cell in cells:
+            degree[cell] += 1
+    branch = sorted(range(size), key=lambda c: -degree[c])[:depth]
+    assignments = []
+    for values in itertools.product((0, 1), repeat=len(branch)):
+        fixed = dict(zip(branch, values))
+        feasible = True
+        for cells, mines in constraints:
+            pinned = [fixed[c] for c in cells if c in fixed]
+            if sum(pinned) > mines or sum(pinned) + len(cells) - len(pinned) < mines:
+                feasible = False
+                break
+        if feasible:
+            assignments.append(fixed)
+    return assignments
+
+
+def _enumerate_task(args) -> ComponentCounts:
+    """Process-pool entry point: enumerate one (sub)tree of a component."""
+    size, constraints, fixed, deadline = args
+    return enumerate_component(size, constraints, fixed, deadline)
+
+
+def combine_components(components: Sequence[Tuple[List[Cell], ComponentCounts]],
+                       outside: int, remaining_mines: int) -> Tuple[Dict[Cell, float], Optional[float]]:
+    """Weight component solutions by the ways to fill the unconstrained cells.
+
+    Returns per-cell mine probabilities for frontier cells, and the
+    probability for any cell outside the frontier (None if there is none).
+    Each component's "all the others" distribution comes from prefix and
+    suffix convolutions, so the work grows linearly with the component
+    count.
+    """
+    distributions = [{k: v[0] for k, v in counts.items()} for _, counts in components]
+
+    def convolve(a: Dict[int, int], b: Dict[int, int]) -> Dict[int, int]:
+        step: Dict[int, int] = defaultdict(int)
+        for i, ca in a.items():
+            for j, cb in b.items():
+                step[i + j] += ca * cb
+        return step
+
+    prefix = [{0: 1}]
+    for dist in distributions:
+        prefix.append(convolve(prefix[-1], dist))
+    suffix = [{0: 1}]
+    for dist in reversed(distributions):
+        suffix.append(convolve(suffix[-1], dist))
+    suffix.reverse()
+
+    def outside_ways(used: int) -> int:
+        left = remaining_mines - used
+        if left < 0 or left > outside:
+            return 0
+        return math.comb(outside, left)
+
+    everything = prefix[-1]
+    weight = sum(count * outside_ways(k) for k, count in everything.items())
+    if weight == 0:
+        return {}, None
+
+    probabilities: Dict[Cell, float] = {}
+    for index, (cells, counts) in enumerate(components):
+        others = convolve(prefix[index], suffix[index + 1])
+        per_cell = [0] * len(cells)
+        for k, (_, mine_counts) in counts.items():
+            factor = sum(count * outside_ways(k + j) for j, count in others.items())
+            if factor:
+                for i, value in enumerate(mine_counts):
+                    per_cell[i] += value * factor
+        for cell, value in zip(cells, per_cell):
+            probabilities[cell] = value / weight
+
+    outside_prob = None
+    if outside:
+        expected = sum(count * outside_ways(k) * (remaining_mines - k) for k, count in everything.items())
+        outside_prob = expected / (weight * outside)
+    return probabilities, outside_prob
+
+
+def approximate_probabilities(cells: Sequence[Cell], constraints: Sequence[Constraint]) -> Dict[Cell, float]:
+    """Cheap fallback: average remaining/hidden ratio over each cell's constraints."""
+    totals = [0.0] * len(cells)
+    seen = [0] * len(cells)
+    for members, mines in constraints:
+        ratio = mines / len(members)
+        for cell in members:
+            totals[cell] += ratio
+            seen[cell] += 1
+    return {cell: totals[i] / seen[i] if seen[i] else 0.5 for i, cell in enumerate(cells)}
+
+
+class ConstraintSolver:
+    """Exact frontier probabilities with optional multi-core enumeration.
+
+    Independent frontier components, and subtrees of components larger
+    than ``split_threshold`` cells, are enumerated in a process pool when
+    the frontier is big enough to pay for it. Partial counts are merged
+    exactly. If ``time_budget`` (seconds) runs out, unfinished components
+    fall back to the local ratio estimate and the result is marked inexact.
+
+    Components already seen, in any rotation or reflection, are answered
+    from ``cache`` (the process-wide ``shared_cache`` unless given; pass
+    None to always enumerate).
+    """
+
+    def __init__(self, workers: Optional[int] = None, time_budget: Optional[float] = None,
+                 parallel_threshold: int = 40, split_threshold: int = 28, split_depth: int = 4,
+                 cache: Optional[PatternCache] = shared_cache):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.time_budget = time_budget
+        self.parallel_threshold = parallel_threshold
+        self.split_threshold = split_threshold
+        self.split_depth = split_depth
+        self.cache = cache
+        self.last_exact = True
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def shutdown(self):
+        """Stop the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def solve(self, game, numbers: Optional[Iterable[Cell]] = None,
+              hidden: Optional[int] = None) -> Tuple[Dict[Cell, float], Optional[float]]:
+        """Return (frontier cell probabilities, probability for non-frontier cells).
+
+        ``numbers`` and ``hidden`` are passed through to build_constraints.
+        """
+        constraints, hidden = build_constraints(game, numbers, hidden)
+        components = split_components(constraints)
+        frontier = sum(len(cells) for cells, _ in components)
+        outside = hidden - frontier
+        remaining = game.num_mines - game.get_flag_count()
+        deadline = time.time() + self.time_budget if self.time_budget is not None else None
+
+        lookups = [self.cache.lookup(cells, local) if self.cache is not None else (None, None, None)
+                   for cells, local in components]
+        counted = [counts for counts, _, _ in lookups]
+        pending = [i for i, counts in enumerate(counted) if counts is None]
+        todo = [components[i] for i in pending]
+        if self.workers > 1 and sum(len(cells) for cells, _ in todo) >= self.parallel_threshold:
+            results = self._enumerate_parallel(todo, deadline)
+        else:
+            results = self._enumerate_serial(todo, deadline)
+        for i, counts in zip(pending, results):
+            counted[i] = counts
+            if counts is not None and self.cache is not None:
+                _, key, rank = lookups[i]
+                self.cache.store(key, rank, counts)
+
+        exact = [(cells, counts) for (cells, _), counts in zip(components, counted) if counts is not None]
+        self.last_exact = len(exact) == len(components)
+        if self.last_exact:
+            return combine_components(exact, outside, remaining)
+
+        # Budget exhausted: exact results where we have them, estimates elsewhere.
+        probabilities, _ = combine_components(exact, outside, remaining) if exact else ({}, None)
+        for (cells, local), counts in zip(components, counted):
+            if counts is None:
+                probabilities.update(approximate_probabilities(cells, local))
+        expected = remaining - sum(probabilities.values())
+        outside_prob = min(1.0, max(0.0, expected / outside)) if outside else None
+        return probabilities, outside_prob
+
+    def _enumerate_serial(self, components, deadline) -> List[Optional[ComponentCounts]]:
+        counted = []
+        for cells, local in components:
+            try:
+                counted.append(enumerate_component(len(cells), local, deadline=deadline))
+            except EnumerationTimeout:
+                counted.append(None)
+        return counted
+
+    def _enumerate_parallel(self, components, deadline) -> List[Optional[ComponentCounts]]:
+        from concurrent.futures import wait
+
+        pool = self._get_pool()
+        jobs = []
+        for cells, local in components:
+            size = len(cells)
+            if size > self.split_threshold:
+                splits = split_assignments(size, local, self.split_depth)
+            else:
+                splits = [None]
+            jobs.append([pool.submit(_enumerate_task, (size, local, fixed, deadline)) for fixed in splits])
+
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        futures = [future for group in jobs for future in group]
+        wait(futures, timeout=timeout)
+
+        counted = []
+        for (cells, _), group in zip(components, jobs):
+            if all(f.done() and not f.cancelled() and f.exception() is None for f in group):
+                counted.append(merge_counts([f.result() for f in group], len(cells)))
+            else:
+                for future in group:
+                    future.cancel()
+                counted.append(None)
+        return counted
@@ -0,0 +1,153 @@
+import io
+import math
+import platform
+import struct
+import sys
+import threading
+import wave
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, List, Optional, Tuple
+
+Sound = Tuple[int, int]  # (frequency Hz, duration ms)
+
+SAMPLE_RATE = 22050
+
+
+@lru_cache(maxsize=32)
+def synthesize(frequency: int, duration: int, rate: int = SAMPLE_RATE, volume: float = 0.3) -> bytes:
+    """A sine tone as an in-memory mono 16-bit WAV file, built once per sound.
+
+    A few milliseconds of fade at each end avoid clicks.
+    """
+    count = rate * duration // 1000
+    fade = max(1, min(count // 4, rate // 200))
+    step = 2 * math.pi * frequency / rate
+    peak = 32767 * volume
+    samples = [int(peak * math.sin(i * step) * min(1.0, i / fade, (count - i) / fade)) for i in range(count)]
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes(struct.pack(f'<{count}h', *samples))
+    return buffer.getvalue()
+
+
+class SilentBackend:
+    """Plays nothing and remembers what it was asked to play (headless runs, tests)."""
+
+    def __init__(self):
+        self.played: List[Sound] = []
+
+    def __call__(self, frequency: int, duration: int):
+        self.played.append((frequency, duration))
+
+
+def _pipe_player(command: List[str]) -> Callable[[int, int], None]:
+    import subprocess
+
+    def play(frequency, duration):
+        subprocess.run(command, input=synthesize(frequency, duration),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+    return play
+
+
+def load_backend() -> Callable[[int, int], None]:
+    """The best blocking player here: winsound on Windows, a cached waveform
+    piped to ``aplay``/``paplay`` on Linux, the terminal bell otherwise, and
+    silence if none of them can be set up."""
+    try:
+        if platform.system() == 'Windows':
+            import winsound
+            return winsound.Beep
+        import shutil
+        for command in (['aplay', '-q', '-'], ['paplay']):
+            if shutil.which(command[0]):
+                return _pipe_player(command)
+
+        def bell(frequency, duration):
+            sys.stdout.write('\a')
+            sys.stdout.flush()
+        return bell
+    except Exception:
+        return SilentBackend()
+
+
+class SoundWorker:
+    """Plays sounds on a background thread so callers never wait for audio.
+
+    ``play()`` only appends to a queue of at most ``maxsize`` sounds and
+    returns. When input outpaces playback, a sound equal to the one
+    already waiting last is merged into it (``coalesced``), and a full
+    queue drops its oldest sound (``dropped``), so what is heard stays
+    close to what just happened. The thread and the platform backend are
+    started on the first sound.
+    """
+
+    def __init__(self, backend: Optional[Callable[[int, int], None]] = None, maxsize: int = 4):
+        self.backend = backend
+        self.maxsize = maxsize
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._queue: Deque[Sound] = deque()
+        self._ready = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def play(self, frequency: int = 800, duration: int = 100):
+        """Queue a sound; never blocks."""
+        with self._ready:
+            if self._closed:
+                return
+            sound = (frequency, duration)
+            if self._queue and self._queue[-1] == sound:
+                self.coalesced += 1
+                return
+            if len(self._queue) >= self.maxsize:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(sound)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='sound', daemon=True)
+                self._thread.start()
+            self._ready.notify()
+
+    def _run(self):
+        if self.backend is None:
+            self.backend = load_backend()
+        while True:
+            with self._ready:
+                while not self._queue and not self._closed:
+                    self._ready.wait()
+                if not self._queue:
+                    return
+                sound = self._queue.popleft()
+                self._busy = True
+            try:
+                self.backend(*sound)
+            except Exception:
+                pass
+            with self._ready:
+                self._busy = False
+                self.played += 1
+                self._ready.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued has played; returns False on timeout."""
+        with self._ready:
+            return self._ready.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def close(self, timeout: float = 1.0):
+        """Drop queued sounds and stop the thread."""
+        with self._ready:
+            self._closed = True
+            self._queue.clear()
+            self._ready.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_summary(self) -> str:
+        return f"{self.played} sounds played, {self.coalesced} coalesced, {self.dropped} dropped"
@@ -0,0 +1,114 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Cell glyphs as pixel bitmaps ('#' = ink), keyed like the GUI's text tags.
+# Drawing them into images once avoids font and emoji rendering per cell.
+GLYPHS: Dict[str, Tuple[str, ...]] = {
+    'text_blank': (),
+    'text_flag': (
+        ".##....",
+        ".####..",
+        ".######",
+        ".####..",
+        ".##....",
+        ".#.....",
+        "####...",
+    ),
+    'text_mine': (
+        "...#...",
+        ".#####.",
+        ".#####.",
+        "#######",
+        ".#####.",
+        ".#####.",
+        "...#...",
+    ),
+    'text_1': ("..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."),
+    'text_2': (".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"),
+    'text_3': (".###.", "#...#", "....#", "..##.", "....#", "#...#", ".###."),
+    'text_4': ("...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."),
+    'text_5': ("#####", "#....", "####.", "....#", "....#", "#...#", ".###."),
+    'text_6': (".###.", "#....", "#....", "####.", "#...#", "#...#", ".###."),
+    'text_7': ("#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."),
+    'text_8': (".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."),
+}
+
+State = Tuple[str, str]  # (rectangle tag, glyph tag), as in MinesweeperGUI.cell_tags
+
+
+def render_pixels(size: int, fill: str, outline: str, ink: str, glyph: Tuple[str, ...]) -> List[List[str]]:
+    """Colour of every pixel of one cell: a bordered square with the glyph centred.
+
+    The glyph is scaled by a whole factor to about half the cell height.
+    """
+    rows = [[outline] * size] + [[outline] + [fill] * (size - 2) + [outline] for _ in range(size - 2)]
+    rows.append([outline] * size)
+    if glyph:
+        height, width = len(glyph), len(glyph[0])
+        scale = max(1, (size // 2) // height)
+        top = (size - height * scale) // 2
+        left = (size - width * scale) // 2
+        for gy, line in enumerate(glyph):
+            for gx, pixel in enumerate(line):
+                if pixel == '#':
+                    for y in range(top + gy * scale, top + (gy + 1) * scale):
+                        row = rows[y]
+                        for x in range(left + gx * scale, left + (gx + 1) * scale):
+                            row[x] = ink
+    return rows
+
+
+def photo_data(rows: List[List[str]]) -> str:
+    """Pixel rows in the format ``PhotoImage.put`` takes in a single call."""
+    return ' '.join('{' + ' '.join(row) + '}' for row in rows)
+
+
+class SpriteAtlas:
+    """Pre-rendered cell images for one theme and cell size at a time.
+
+    Each cell state's image is rendered on first use from the theme's
+    style table (``MinesweeperGUI.build_style_table``) and then shared by
+    every cell in that state, so repainting a cell is one image swap.
+    ``use()`` switches theme or size and drops the old images.
+    ``image_factory(width, height)`` returns an object with
+    ``put(data)``; it is ``tk.PhotoImage`` in the GUI.
+    """
+
+    def __init__(self, style_tables: Dict[str, Dict[str, Dict[str, str]]],
+                 image_factory: Optional[Callable] = None):
+        self.style_tables = style_tables
+        self.image_factory = image_factory
+        self.theme: Optional[str] = None
+        self.size = 0
+        self.images: Dict[State, object] = {}
+        self.rendered = 0
+
+    def use(self, theme: str, size: int) -> bool:
+        """Select the theme and cell size; returns True if images were evicted."""
+        if (theme, size) == (self.theme, self.size):
+            return False
+        self.theme, self.size = theme, size
+        evicted = bool(self.images)
+        self.images = {}
+        return evicted
+
+    def get(self, state: State):
+        """The image for a cell state, rendered once per theme and size."""
+        image = self.images.get(state)
+        if image is None:
+            rect_tag, text_tag = state
+            style = self.style_tables[self.theme]
+            rows = render_pixels(self.size, style[rect_tag]['fill'], style[rect_tag]['outline'],
+                                 style[text_tag]['fill'], GLYPHS[text_tag])
+            if self.image_factory is None:
+                import tkinter as tk
+                self.image_factory = lambda width, height: tk.PhotoImage(width=width, height=height)
+            image = self.image_factory(self.size, self.size)
+            image.put(photo_data(rows))
+            self.images[state] = image
+            self.rendered += 1
+        return image
+
+    @staticmethod
+    def tag(state: State) -> str:
+        """Canvas tag shared by every cell item showing ``state``."""
+        return f"sprite:{state[0]}:{state[1]}"
@@ -0,0 +1,183 @@
+import mmap
+from typing import Iterator, List, Optional
+
+
+# Packed cell layout: one byte per cell.
+#   bits 0-3  adjacent mine count (0-8), or MINE_VALUE for a mine
+#   bit 4     revealed
+#   bit 5     flagged
+VALUE_MASK = 0x0F
+MINE_VALUE = 0x0F
+REVEALED_BIT = 0x10
+FLAGGED_BIT = 0x20
+
+
+class ListBoardStorage:
+    """Default in-memory storage: three list-of-lists grids indexed [y][x]."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.board = [[0 for _ in range(width)] for _ in range(height)]
+        self.revealed = [[False for _ in range(width)] for _ in range(height)]
+        self.flagged = [[False for _ in range(width)] for _ in range(height)]
+
+    @classmethod
+    def wrap(cls, width: int, height: int, board, revealed, flagged) -> 'ListBoardStorage':
+        """Storage around existing grids, without copying them."""
+        storage = cls.__new__(cls)
+        storage.width = width
+        storage.height = height
+        storage.board = board
+        storage.revealed = revealed
+        storage.flagged = flagged
+        return storage
+
+    def close(self):
+        """Nothing to release for in-memory grids."""
+
+
+class _RowView:
+    """One row of a packed grid, indexable by x like a list."""
+
+    __slots__ = ('_storage', '_y', '_get', '_set')
+
+    def __init__(self, storage: 'MmapBoardStorage', y: int, get, set_):
+        self._storage = storage
+        self._y = y
+        self._get = get
+        self._set = set_
+
+    def __len__(self) -> int:
+        return self._storage.width
+
+    def __getitem__(self, x: int):
+        if x < 0:
+            x += self._storage.width
+        return self._get(self._storage._offset(x, self._y))
+
+    def __setitem__(self, x: int, value):
+        if x < 0:
+            x += self._storage.width
+        self._set(self._storage._offset(x, self._y), value)
+
+    def __iter__(self) -> Iterator:
+        offset, get = self._storage._offset, self._get
+        for x in range(self._storage.width):
+            yield get(offset(x, self._y))
+
+
+class _GridView:
+    """A packed grid exposed with the engine's [y][x] indexing."""
+
+    def __init__(self, storage: 'MmapBoardStorage', get, set_):
+        self._storage = storage
+        self._get = get
+        self._set = set_
+
+    def __len__(self) -> int:
+        return self._storage.height
+
+    def __getitem__(self, y: int) -> _RowView:
+        if y < 0:
+            y += self._storage.height
+        if not 0 <= y < self._storage.height:
+            raise IndexError("row index out of range")
+        return _RowView(self._storage, y, self._get, self._set)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for y in range(self._storage.height):
+            yield _RowView(self._storage, y, self._get, self._set)
+
+
+class MmapBoardStorage:
+    """Board storage backed by a memory-mapped file with a tiled layout.
+
+    Cells are packed one byte each and grouped into square tiles of
+    ``tile_size`` x ``tile_size`` cells (64 x 64 = one 4 KiB page), so a
+    flood-fill or frontier scan only faults in the pages it touches. The
+    file is created sparse; untouched tiles cost no disk or RAM, and the OS
+    page cache decides what stays resident.
+    """
+
+    def __init__(self, width: int, height: int, path: Optional[str] = None, tile_size: int = 64):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.tiles_x = (width + tile_size - 1) // tile_size
+        self.tiles_y = (height + tile_size - 1) // tile_size
+        self._tile_cells = tile_size * tile_size
+        size = self.tiles_x * self.tiles_y * self._tile_cells
+
+        if path is None:
+            import tempfile  # deferred: only mmap-backed games need it
+            self._file = tempfile.TemporaryFile()
+        else:
+            self._file = open(path, 'w+b')
+        self._file.truncate(size)
+        self.path = path
+        self._mm = mmap.mmap(self._file.fileno(), size)
+
+        self.board = _GridView(self, self._get_value, self._set_value)
+        self.revealed = _GridView(self, self._get_revealed, self._set_revealed)
+        self.flagged = _GridView(self, self._get_flagged, self._set_flagged)
+
+    def _offset(self, x: int, y: int) -> int:
+        """Byte offset of cell (x, y) in the tiled file."""
+        ts = self.tile_size
+        tx, ix = divmod(x, ts)
+        ty, iy = divmod(y, ts)
+        return (ty * self.tiles_x + tx) * self._tile_cells + iy * ts + ix
+
+    def _get_value(self, offset: int) -> int:
+        value = self._mm[offset] & VALUE_MASK
+        return -1 if value == MINE_VALUE else value
+
+    def _set_value(self, offset: int, value: int):
+        packed = MINE_VALUE if value == -1 else value
+        self._mm[offset] = (self._mm[offset] & ~VALUE_MASK) | packed
+
+    def _get_revealed(self, offset: int) -> bool:
+        return bool(self._mm[offset] & REVEALED_BIT)
+
+    def _set_revealed(self, offset: int, value: bool):
+        if value:
+            self._mm[offset] |= REVEALED_BIT
+        else:
+            self._mm[offset] &= ~REVEALED_BIT
+
+    def _get_flagged(self, offset: int) -> bool:
+        return bool(self._mm[offset] & FLAGGED_BIT)
+
+    def _set_flagged(self, offset: int, value: bool):
+        if value:
+            self._mm[offset] |= FLAGGED_BIT
+        else:
+            self._mm[offset] &= ~FLAGGED_BIT
+
+    def flush(self):
+        """Write dirty pages back to the backing file."""
+        self._mm.flush()
+
+    def close(self):
+        """Unmap the buffer and close the backing file."""
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MmapBoardStorage':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def resident_tiles(storage: MmapBoardStorage) -> List[int]:
+    """Return indices of tiles that contain any non-zero byte (debug helper)."""
+    tiles = []
+    step = storage._tile_cells
+    zero = bytes(step)
+    for index in range(storage.tiles_x * storage.tiles_y):
+        if storage._mm[index * step:(index + 1) * step] != zero:
+            tiles.append(index)
+    return tiles
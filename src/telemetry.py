@@ -0,0 +1,167 @@
+import csv
+import gzip
+import io
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+# Column order of every segment; one row per game.
+FIELDS = ('seed', 'width', 'height', 'mines', 'moves', 'guesses',
+          'guess_probabilities', 'won', 'elapsed')
+SUFFIX = '.csv.gz'
+
+
+class GameRecord:
+    """Per-game telemetry: board, seed, moves, guesses and outcome."""
+
+    __slots__ = ('seed', 'width', 'height', 'mines', 'moves',
+                 'guess_probabilities', 'won', 'elapsed')
+
+    def __init__(self, seed: int, width: int, height: int, mines: int, moves: int,
+                 guess_probabilities: List[float], won: bool, elapsed: float):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.mines = mines
+        self.moves = moves
+        self.guess_probabilities = guess_probabilities
+        self.won = won
+        self.elapsed = elapsed
+
+    @property
+    def guesses(self) -> int:
+        return len(self.guess_probabilities)
+
+    def to_row(self) -> List[str]:
+        probabilities = ';'.join(f"{p:.6g}" for p in self.guess_probabilities)
+        return [str(self.seed), str(self.width), str(self.height), str(self.mines),
+                str(self.moves), str(self.guesses), probabilities,
+                '1' if self.won else '0', f"{self.elapsed:.6f}"]
+
+    @classmethod
+    def from_row(cls, row: List[str]) -> 'GameRecord':
+        seed, width, height, mines, moves, _, probabilities, won, elapsed = row
+        return cls(int(seed), int(width), int(height), int(mines), int(moves),
+                   [float(p) for p in probabilities.split(';')] if probabilities else [],
+                   won == '1', float(elapsed))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"GameRecord(seed={self.seed}, {self.width}x{self.height}/{self.mines}, "
+                f"moves={self.moves}, guesses={self.guesses}, won={self.won})")
+
+
+class TelemetryWriter:
+    """Stream game records into rotating gzip-compressed CSV segments.
+
+    Records are written as they arrive, so memory does not grow with the
+    run. Once a segment's compressed size reaches ``max_bytes`` it is closed
+    and the next record starts a new one, named ``<prefix>-00001.csv.gz``
+    and so on; numbering continues after segments already in ``directory``.
+    The size checked is what the compressor has emitted so far, so a
+    segment can run a few tens of KB past the limit.
+    """
+
+    def __init__(self, directory: Union[str, Path], prefix: str = 'games',
+                 max_bytes: int = 64 * 1024 * 1024, compresslevel: int = 6):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self.segments: List[Path] = []
+        self.records = 0
+        self._index = self._last_index()
+        self._raw = None
+        self._text = None
+        self._csv = None
+
+    def _last_index(self) -> int:
+        """Highest segment number already in the directory, 0 if none.
+
+        Taken from the names rather than a count, so gaps left by deleted
+        segments never lead to overwriting a later one.
+        """
+        start, end = len(self.prefix) + 1, -len(SUFFIX)
+        numbers = [path.name[start:end] for path in self.directory.glob(f"{self.prefix}-*{SUFFIX}")]
+        return max((int(n) for n in numbers if n.isdigit()), default=0)
+
+    def _open_segment(self):
+        self._index += 1
+        path = self.directory / f"{self.prefix}-{self._index:05d}{SUFFIX}"
+        self._raw = open(path, 'wb')
+        compressed = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=self.compresslevel)
+        self._text = io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+        self._csv = csv.writer(self._text)
+        self._csv.writerow(FIELDS)
+        self.segments.append(path)
+
+    def _close_segment(self):
+        if self._raw is not None:
+            self._text.close()
+            self._raw.close()
+            self._raw = self._text = self._csv = None
+
+    def write(self, record: GameRecord):
+        """Append one record, rotating to a new segment at the size limit."""
+        if self._raw is None:
+            self._open_segment()
+        self._csv.writerow(record.to_row())
+        self.records += 1
+        if self._raw.tell() >= self.max_bytes:
+            self._close_segment()
+
+    def write_all(self, records: Iterable[GameRecord]) -> int:
+        """Drain a record stream into segments; returns how many were written."""
+        start = self.records
+        for record in records:
+            self.write(record)
+        return self.records - start
+
+    def close(self):
+        self._close_segment()
+
+    def __enter__(self) -> 'TelemetryWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def segment_paths(path: Union[str, Path], prefix: Optional[str] = None) -> List[Path]:
+    """Segments under ``path`` in write order (a single file is returned as is)."""
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    pattern = f"{prefix}-*{SUFFIX}" if prefix else f"*{SUFFIX}"
+    return sorted(path.glob(pattern))
+
+
+def read_records(path: Union[str, Path], prefix: Optional[str] = None) -> Iterator[GameRecord]:
+    """Lazily yield every record from a segment file or a directory of them."""
+    for segment in segment_paths(path, prefix):
+        with gzip.open(segment, 'rt', encoding='utf-8', newline='') as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            for row in rows:
+                yield GameRecord.from_row(row)
+
+
+if __name__ == "__main__":
+    import argparse
+    from src.simulation import stream_records
+
+    parser = argparse.ArgumentParser(description="Write per-game AI telemetry segments.")
+    parser.add_argument('directory')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--difficulty', default='beginner')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-mb', type=float, default=64)
+    args = parser.parse_args()
+    with TelemetryWriter(args.directory, max_bytes=int(args.max_mb * 1024 * 1024)) as writer:
+        count = writer.write_all(stream_records(args.games, args.difficulty, args.seed, args.workers))
+    print(f"Wrote {count} games to {len(writer.segments)} segment(s) in {args.directory}")
@@ -0,0 +1,217 @@
+import json
+from abc import ABC, abstractmethod
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+# Rectangular boards up to this many cells remember each cell's neighbour
+# tuple once built (some 600 bytes a cell); larger ones recompute it.
+CACHE_LIMIT = 1 << 16
+# Rectangular boards up to this many cells share one topology per shape;
+# larger ones get their own, freed with the game.
+SHARE_LIMIT = 1 << 12
+
+_SQUARE = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+# Hexagonal boards use "odd-r" offset rows: odd rows sit half a cell right.
+_HEX_EVEN = ((-1, -1), (0, -1), (-1, 0), (1, 0), (-1, 1), (0, 1))
+_HEX_ODD = ((0, -1), (1, -1), (-1, 0), (1, 0), (0, 1), (1, 1))
+
+
+class Topology(ABC):
+    """Which cells touch which, for a board of ``width`` x ``height`` cells.
+
+    Cells are addressed as (x, y) like everywhere else and numbered
+    ``y * width + x``. Subclasses provide ``neighbors(x, y)``, returning a
+    tuple that callers must not modify, and ``neighbor_indices(index)``.
+    """
+
+    kind = 'graph'
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+    @abstractmethod
+    def neighbors(self, x: int, y: int) -> Sequence[Cell]:
+        """Cells touching (x, y)."""
+
+    @abstractmethod
+    def neighbor_indices(self, index: int) -> Sequence[int]:
+        """Indices of the cells touching cell ``index``."""
+
+    def max_degree(self) -> int:
+        """The largest number of neighbours any cell has."""
+        return max((len(self.neighbor_indices(i)) for i in range(self.size)), default=0)
+
+    def to_graph(self) -> 'GraphTopology':
+        """The same adjacency as CSR arrays."""
+        return GraphTopology.from_lists(self.width, self.height,
+                                        (self.neighbor_indices(i) for i in range(self.size)), self.kind)
+
+
+class RectTopology(Topology):
+    """The classic 8-neighbour rectangle.
+
+    Its adjacency is implied by the geometry, so nothing is precomputed:
+    a cell's neighbour tuple is built on first use and kept, which makes
+    creating a board free and later lookups one list index. Boards above
+    ``CACHE_LIMIT`` cells do not keep the tuples.
+    """
+
+    kind = 'rectangular'
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+        self._tuples: Optional[List[Optional[Tuple[Cell, ...]]]] = \
+            [None] * self.size if self.size <= CACHE_LIMIT else None
+
+    def neighbors(self, x: int, y: int) -> Sequence[Cell]:
+        tuples = self._tuples
+        if tuples is not None:
+            cells = tuples[y * self.width + x]
+            if cells is not None:
+                return cells
+        width, height = self.width, self.height
+        cells = tuple((x + dx, y + dy) for dx, dy in _SQUARE
+                      if 0 <= x + dx < width and 0 <= y + dy < height)
+        if tuples is not None:
+            tuples[y * width + x] = cells
+        return cells
+
+    def neighbor_indices(self, index: int) -> Sequence[int]:
+        width = self.width
+        return tuple(ny * width + nx for nx, ny in self.neighbors(index % width, index // width))
+
+    def max_degree(self) -> int:
+        return 8 if self.width > 1 and self.height > 1 else min(max(self.width, self.height) - 1, 2)
+
+
+class GraphTopology(Topology):
+    """Adjacency stored as CSR arrays: cell ``i`` touches
+    ``targets[offsets[i]:offsets[i + 1]]``.
+
+    ``neighbors(x, y)`` builds each cell's tuple of coordinates the first
+    time it is asked for and then returns the same tuple, so repeated
+    lookups cost one list index.
+    """
+
+    def __init__(self, width: int, height: int, offsets: array, targets: array, kind: str = 'graph'):
+        super().__init__(width, height)
+        if len(offsets) != self.size + 1 or offsets[-1] != len(targets):
+            raise ValueError("CSR arrays do not match the board size")
+        self.kind = kind
+        self.offsets = offsets
+        self.targets = targets
+        self._tuples: List[Optional[Tuple[Cell, ...]]] = [None] * self.size
+
+    @classmethod
+    def from_lists(cls, width: int, height: int, adjacency: Sequence[Iterable[int]],
+                   kind: str = 'graph') -> 'GraphTopology':
+        """Build from one list of neighbour indices per cell."""
+        offsets = array('I', [0])
+        targets = array('I')
+        for near in adjacency:
+            targets.extend(sorted(set(near)))
+            offsets.append(len(targets))
+        return cls(width, height, offsets, targets, kind)
+
+    @classmethod
+    def from_edges(cls, width: int, height: int, edges: Iterable[Tuple[int, int]]) -> 'GraphTopology':
+        """Build from undirected edges between cell indices."""
+        adjacency: List[List[int]] = [[] for _ in range(width * height)]
+        for a, b in edges:
+            if a != b:
+                adjacency[a].append(b)
+                adjacency[b].append(a)
+        return cls.from_lists(width, height, adjacency)
+
+    def neighbors(self, x: int, y: int) -> Sequence[Cell]:
+        index = y * self.width + x
+        cells = self._tuples[index]
+        if cells is None:
+            width = self.width
+            cells = self._tuples[index] = tuple(
+                (j % width, j // width) for j in self.targets[self.offsets[index]:self.offsets[index + 1]])
+        return cells
+
+    def neighbor_indices(self, index: int) -> Sequence[int]:
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def max_degree(self) -> int:
+        offsets = self.offsets
+        return max((offsets[i + 1] - offsets[i] for i in range(self.size)), default=0)
+
+    def to_dict(self) -> dict:
+        return {'width': self.width, 'height': self.height, 'kind': self.kind,
+                'neighbors': [list(self.neighbor_indices(i)) for i in range(self.size)]}
+
+
+def _offset_graph(width: int, height: int, offsets_for, wrap: bool, kind: str) -> GraphTopology:
+    adjacency = []
+    for y in range(height):
+        for x in range(width):
+            near = []
+            for dx, dy in offsets_for(y):
+                nx, ny = x + dx, y + dy
+                if wrap:
+                    nx, ny = nx % width, ny % height
+                elif not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                if (nx, ny) != (x, y):
+                    near.append(ny * width + nx)
+            adjacency.append(near)
+    return GraphTopology.from_lists(width, height, adjacency, kind)
+
+
+# Topologies are immutable, so games of the same shape share one.
+@lru_cache(maxsize=16)
+def _shared_rectangle(width: int, height: int) -> RectTopology:
+    return RectTopology(width, height)
+
+
+def rectangular(width: int, height: int) -> RectTopology:
+    """The standard 8-neighbour board.
+
+    Small boards share one instance per shape; boards above
+    ``SHARE_LIMIT`` cells get their own, so its cache is not pinned after
+    the game is gone.
+    """
+    if width * height <= SHARE_LIMIT:
+        return _shared_rectangle(width, height)
+    return RectTopology(width, height)
+
+
+@lru_cache(maxsize=16)
+def torus(width: int, height: int) -> GraphTopology:
+    """8-neighbour board whose edges wrap around."""
+    return _offset_graph(width, height, lambda y: _SQUARE, True, 'torus')
+
+
+@lru_cache(maxsize=16)
+def hexagonal(width: int, height: int) -> GraphTopology:
+    """6-neighbour hex board in odd-r offset rows."""
+    return _offset_graph(width, height, lambda y: _HEX_ODD if y % 2 else _HEX_EVEN, False, 'hexagonal')
+
+
+def load_topology(path: str) -> GraphTopology:
+    """Read a graph saved as JSON.
+
+    The file holds ``width`` and ``height`` plus either ``neighbors`` (one
+    list of cell indices per cell) or ``edges`` (pairs of cell indices).
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    width, height = data['width'], data['height']
+    if 'neighbors' in data:
+        return GraphTopology.from_lists(width, height, data['neighbors'], data.get('kind', 'graph'))
+    return GraphTopology.from_edges(width, height, data['edges'])
+
+
+def save_topology(topology: Topology, path: str):
+    """Write a topology in the format ``load_topology`` reads."""
+    graph = topology if isinstance(topology, GraphTopology) else topology.to_graph()
+    with open(path, 'w') as f:
+        json.dump(graph.to_dict(), f)
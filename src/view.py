@@ -0,0 +1,195 @@
+import struct
+from typing import Iterator, Optional, Tuple
+
+# Player-visible cell codes: 0-8 revealed number, -1 revealed mine.
+FLAG = 9
+HIDDEN = 10
+
+# Shared game block: header, then the visible codes from offset HEADER_SIZE.
+# Header: width, height, mines, flags, status, generation. The generation is
+# odd while the engine is writing and advances by two per change.
+HEADER = struct.Struct('<IIIIIQ')
+HEADER_SIZE = 32
+PLAYING, WON, LOST = 0, 1, 2
+
+# Views keep one byte per cell in RAM, so they are refused for boards
+# larger than this (64 Mi cells). Bigger games, e.g. on the mmap tiled
+# storage, can still be played through the engine, just not by the AI,
+# the hint engine or shared-memory workers.
+MAX_VIEW_CELLS = 1 << 26
+
+
+class _FlagRow:
+    """One row of a derived boolean grid over the visible codes."""
+
+    __slots__ = ('_cells', '_start', '_width', '_test')
+
+    def __init__(self, cells: memoryview, start: int, width: int, test):
+        self._cells = cells
+        self._start = start
+        self._width = width
+        self._test = test
+
+    def __len__(self) -> int:
+        return self._width
+
+    def __getitem__(self, x: int) -> bool:
+        if not 0 <= x < self._width:
+            raise IndexError("column index out of range")
+        return self._test(self._cells[self._start + x])
+
+    def __iter__(self) -> Iterator[bool]:
+        test = self._test
+        for code in self._cells[self._start:self._start + self._width]:
+            yield test(code)
+
+
+class _Grid:
+    """[y][x] access over the flat visible buffer.
+
+    Without ``test`` rows are read-only ``memoryview`` slices of the codes
+    themselves; with it they are light proxies returning ``test(code)``.
+    """
+
+    def __init__(self, cells: memoryview, width: int, height: int, test=None):
+        self._cells = cells
+        self._width = width
+        self._height = height
+        self._test = test
+
+    def __len__(self) -> int:
+        return self._height
+
+    def __getitem__(self, y: int):
+        if not 0 <= y < self._height:
+            raise IndexError("row index out of range")
+        start = y * self._width
+        if self._test is None:
+            return self._cells[start:start + self._width]
+        return _FlagRow(self._cells, start, self._width, self._test)
+
+    def __iter__(self):
+        for y in range(self._height):
+            yield self[y]
+
+
+def _is_revealed(code: int) -> bool:
+    return code < FLAG
+
+
+def _is_flagged(code: int) -> bool:
+    return code == FLAG
+
+
+class BoardView:
+    """Read-only, player-visible view of a game.
+
+    The view reads the packed buffer the engine keeps for it (one signed
+    byte per cell: the number once revealed, else ``FLAG`` or ``HIDDEN``),
+    through a read-only ``memoryview``, so it never sees mines, never goes
+    stale and allocates nothing per cell read. ``cells`` is that flat
+    buffer, indexed ``y * width + x``.
+
+    The view mirrors the parts of the ``Minesweeper`` interface a player
+    may use (``board``, ``revealed``, ``flagged``, ``get_neighbors``,
+    ``get_flag_count``), so solver helpers written against a game accept a
+    view unchanged. ``BoardView.attach`` opens a view on a game shared with
+    ``Minesweeper.share_state()`` from another process; its counts and
+    status then come from the shared header.
+    """
+
+    def __init__(self, game=None, buffer=None, width: Optional[int] = None,
+                 height: Optional[int] = None, num_mines: Optional[int] = None, topology=None):
+        self._game = game
+        self._shared = None
+        if game is not None:
+            buffer = game.visible_buffer()
+            width, height, num_mines = game.width, game.height, game.num_mines
+            topology = game.topology
+        elif topology is None:
+            from src.topology import rectangular
+            topology = rectangular(width, height)
+        self.topology = topology
+        self.get_neighbors = topology.neighbors
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.cells = memoryview(buffer).cast('b').toreadonly()
+        self.board = _Grid(self.cells, width, height)
+        self.revealed = _Grid(self.cells, width, height, _is_revealed)
+        self.flagged = _Grid(self.cells, width, height, _is_flagged)
+
+    @classmethod
+    def attach(cls, name: str, topology=None) -> 'BoardView':
+        """Open a view on a game shared by another process with ``share_state()``.
+
+        The header does not record the topology; pass it unless the board
+        is the standard rectangle.
+        """
+        from multiprocessing import shared_memory
+        shared = shared_memory.SharedMemory(name=name)
+        width, height, num_mines = HEADER.unpack_from(shared.buf)[:3]
+        view = cls(buffer=shared.buf[HEADER_SIZE:HEADER_SIZE + width * height],
+                   width=width, height=height, num_mines=num_mines, topology=topology)
+        view._shared = shared
+        return view
+
+    def close(self):
+        """Release an attached shared block (views on a local game need nothing).
+
+        Rows taken from ``board`` are slices of the shared buffer; drop them
+        first or the block cannot be unmapped.
+        """
+        if self._shared is not None:
+            for grid in (self.board, self.revealed, self.flagged):
+                grid._cells = None
+            self.cells.release()
+            self._shared.close()
+            self._shared = None
+
+    def _header(self) -> Tuple[int, ...]:
+        """Consistent header fields from the shared block (retries mid-write reads)."""
+        while True:
+            fields = HEADER.unpack_from(self._shared.buf)
+            if not fields[5] & 1 and HEADER.unpack_from(self._shared.buf)[5] == fields[5]:
+                return fields
+
+    @property
+    def generation(self) -> int:
+        """Change counter of a shared game; advances by two per engine change."""
+        if self._game is not None:
+            return self._game.generation
+        return self._header()[5]
+
+    def touched_rows(self) -> Iterator[int]:
+        """Rows that may hold a revealed or flagged cell; the rest are all HIDDEN.
+
+        A view on a local game answers from its per-row hidden counts
+        without reading the cells.
+        """
+        if self._game is not None:
+            width, row_hidden = self.width, self._game.row_hidden
+            return (y for y in range(self.height) if row_hidden[y] != width)
+        return iter(range(self.height))
+
+    def cell(self, x: int, y: int) -> int:
+        """Visible code of (x, y): its number once revealed, else FLAG or HIDDEN."""
+        return self.cells[y * self.width + x]
+
+    @property
+    def game_over(self) -> bool:
+        if self._game is not None:
+            return self._game.game_over
+        return self._header()[4] != PLAYING
+
+    @property
+    def game_won(self) -> bool:
+        if self._game is not None:
+            return self._game.game_won
+        return self._header()[4] == WON
+
+    def get_flag_count(self) -> int:
+        if self._game is not None:
+            return self._game.get_flag_count()
+        return self._header()[3]
+
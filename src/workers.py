@@ -0,0 +1,137 @@
+import random
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from src.solver import ConstraintSolver
+from src.view import HIDDEN, BoardView
+
+Cell = Tuple[int, int]
+# ('reveal' | 'flag', x, y)
+Action = Tuple[str, int, int]
+
+# Per-worker-process state: attached games (most recent last) and a solver.
+_views: 'OrderedDict[str, BoardView]' = OrderedDict()
+_solver: Optional[ConstraintSolver] = None
+_MAX_VIEWS = 16
+
+
+def _init_worker(time_budget: Optional[float]):
+    global _solver
+    _solver = ConstraintSolver(workers=1, time_budget=time_budget)
+
+
+def _topology_spec(topology):
+    """What a request carries about the board's shape.
+
+    None for the standard rectangle, ``(kind, width, height)`` for the
+    built-in torus and hex boards (rebuilt in the worker) and the topology
+    itself for any other graph.
+    """
+    if topology.kind == 'rectangular':
+        return None
+    if topology.kind in ('torus', 'hexagonal'):
+        return topology.kind, topology.width, topology.height
+    return topology
+
+
+def _attach(name: str, spec=None) -> BoardView:
+    """Attach to a shared game once per worker, keeping a few recent ones open."""
+    view = _views.get(name)
+    if view is None:
+        topology = spec
+        if isinstance(spec, tuple):
+            from src import topology as topologies
+            kind, width, height = spec
+            topology = getattr(topologies, kind)(width, height)
+        view = _views[name] = BoardView.attach(name, topology)
+        if len(_views) > _MAX_VIEWS:
+            _views.popitem(last=False)[1].close()
+    else:
+        _views.move_to_end(name)
+    return view
+
+
+def plan_moves(view: BoardView, solver: ConstraintSolver, numbers: Optional[Iterable[Cell]] = None,
+               hidden: Optional[int] = None) -> List[Action]:
+    """Every move the frontier forces, or the single best guess if none is forced.
+
+    Forced moves are cells the solver gives probability 0 (reveal) or 1
+    (flag); otherwise the lowest-probability cell is revealed, standing a
+    random off-frontier cell in for the rest of the board.
+    """
+    probabilities, outside = solver.solve(view, numbers, hidden)
+    moves: List[Action] = [('flag', x, y) for (x, y), p in probabilities.items() if p == 1]
+    moves += [('reveal', x, y) for (x, y), p in probabilities.items() if p == 0]
+    if moves:
+        return moves
+    hidden_total = hidden if hidden is not None else sum(1 for code in view.cells if code == HIDDEN)
+    if outside is not None and hidden_total > len(probabilities):
+        for _ in range(64):
+            x, y = random.randrange(view.width), random.randrange(view.height)
+            if view.cell(x, y) == HIDDEN and (x, y) not in probabilities:
+                probabilities[(x, y)] = outside
+                break
+    if not probabilities:
+        cells = [(x, y) for y in range(view.height) for x in range(view.width) if view.cell(x, y) == HIDDEN]
+        return [('reveal',) + random.choice(cells)] if cells else []
+    best = min(probabilities.values())
+    x, y = random.choice([cell for cell, p in probabilities.items() if p == best])
+    return [('reveal', x, y)]
+
+
+def _plan_task(name: str, generation: int, numbers, hidden, spec=None) -> Tuple[int, List[Action]]:
+    """Worker entry point: plan moves for a shared game; returns (generation seen, moves)."""
+    view = _attach(name, spec)
+    seen = view.generation
+    if seen != generation:
+        # The hints describe another state; fall back to a full scan.
+        numbers = hidden = None
+    return seen, plan_moves(view, _solver, numbers, hidden)
+
+
+def _generation_task(name: str, spec=None) -> int:
+    """Worker entry point used to measure bare handoff cost."""
+    return _attach(name, spec).generation
+
+
+class SolverPool:
+    """Plans moves for shared games in worker processes.
+
+    The game's visible state is shared once with ``Minesweeper.share_state``;
+    each request then sends only the block name, its generation and the
+    optional frontier hints, and gets back a short move list, so the
+    per-move handoff does not grow with the board. Torus and hex boards
+    add their kind name; other graph boards send their adjacency with
+    every request.
+    """
+
+    def __init__(self, workers: Optional[int] = None, time_budget: Optional[float] = None):
+        from concurrent.futures import ProcessPoolExecutor
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(time_budget,))
+
+    def submit(self, game, numbers: Optional[Iterable[Cell]] = None, hidden: Optional[int] = None):
+        """Start planning for ``game``; the future resolves to (generation, moves)."""
+        name = game.share_state()
+        hint = list(numbers) if numbers is not None else None
+        return self._pool.submit(_plan_task, name, game.generation, hint, hidden,
+                                 _topology_spec(game.topology))
+
+    def plan(self, game, numbers: Optional[Iterable[Cell]] = None, hidden: Optional[int] = None) -> List[Action]:
+        """Plan moves for ``game`` and wait for them."""
+        return self.submit(game, numbers, hidden).result()[1]
+
+    def ping(self, game) -> int:
+        """Round-trip a request that only reads the shared header."""
+        return self._pool.submit(_generation_task, game.share_state(),
+                                 _topology_spec(game.topology)).result()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._pool.shutdown()
+
+    def __enter__(self) -> 'SolverPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
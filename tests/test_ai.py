@@ -0,0 +1,82 @@
+"""
+Unit tests for the AI solver.
+Run with: pytest tests/test_ai.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai import MinesweeperAI
+from src.minesweeper import Minesweeper
+
+
+def full_scan(game):
+    """Recompute the AI's incremental picture of the board from scratch."""
+    hidden = sum(1 for y in range(game.height) for x in range(game.width)
+                 if not game.revealed[y][x] and not game.flagged[y][x])
+    frontier = set()
+    for y in range(game.height):
+        for x in range(game.width):
+            if game.revealed[y][x] and game.board[y][x] > 0 and any(
+                    not game.revealed[ny][nx] and not game.flagged[ny][nx]
+                    for nx, ny in game.get_neighbors(x, y)):
+                frontier.add((x, y))
+    return hidden, frontier
+
+
+class TestMinesweeperAI:
+    """Test suite for the AI solver."""
+
+    def test_incremental_state_matches_full_scan(self):
+        """Test that event-driven frontier tracking never drifts."""
+        random.seed(42)
+        game = Minesweeper(30, 16, 99, first_click=(15, 8))
+        ai = MinesweeperAI(game, workers=1)
+        game.reveal(15, 8)
+        while not game.game_over:
+            hidden, frontier = full_scan(game)
+            assert ai.hidden_count == hidden
+            assert ai.frontier_numbers == frontier
+            if not ai.make_move():
+                break
+        ai.close()
+
+    def test_unflag_restores_frontier(self):
+        """Test that removing a flag puts its numbers back on the frontier."""
+        game = Minesweeper(9, 9, 10, first_click=(4, 4))
+        game.reveal(4, 4)
+        ai = MinesweeperAI(game, workers=1)
+        x, y = next(iter(ai.frontier_numbers))
+        hidden = [(nx, ny) for nx, ny in game.get_neighbors(x, y)
+                  if not game.revealed[ny][nx]]
+        for cell in hidden:
+            game.toggle_flag(*cell)
+        assert (x, y) not in ai.frontier_numbers
+        game.toggle_flag(*hidden[0])
+        assert (x, y) in ai.frontier_numbers
+        assert (ai.hidden_count, ai.frontier_numbers) == full_scan(game)
+
+    def test_undo_keeps_incremental_state(self):
+        """Test that rolling back moves with undo() leaves the AI's picture exact."""
+        random.seed(7)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        ai = MinesweeperAI(game, workers=1)
+        game.checkpoint()
+        game.reveal(8, 8)
+        game.checkpoint()
+        for _ in range(3):
+            ai.make_move()
+        hidden = [(x, y) for y in range(16) for x in range(16) if not game.revealed[y][x]]
+        game.toggle_flag(*hidden[0])
+        game.toggle_flag(*hidden[1])
+        game.toggle_flag(*hidden[1])
+        game.undo()
+        assert (ai.hidden_count, ai.frontier_numbers) == full_scan(game)
+        assert not (ai._dirty_mines | ai._dirty_safe) - ai.frontier_numbers
+        game.undo()  # back before the first click
+        assert (ai.hidden_count, ai.frontier_numbers) == (256, set())
+        ai.close()
@@ -0,0 +1,94 @@
+"""
+Unit tests for the board analyzer.
+Run with: pytest tests/test_analysis.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis import (AnalysisCache, BoardAnalyzer, _Frontier, analyze_board, analyze_many,
+                          board_hash, count_3bv, layout_of, random_layouts)
+from src.minesweeper import Minesweeper
+from src.solver import ConstraintSolver, build_constraints
+
+
+class TestBoardAnalysis:
+    """Test suite for board metrics."""
+
+    def test_3bv(self):
+        """Test 3BV and openings on small hand-checked layouts."""
+        assert count_3bv(5, 1, [2]) == (2, 2)
+        assert count_3bv(3, 1, [0]) == (1, 1)
+        # Four corner mines: no zeros, five separate numbers
+        assert count_3bv(3, 3, [0, 2, 6, 8]) == (5, 0)
+
+    def test_forced_guess(self):
+        """Test that a closing 50/50 counts as one forced guess."""
+        analysis = BoardAnalyzer().analyze((3, 2, (0,), (2, 1)))
+        assert analysis.forced_guesses == 1
+        assert analysis.bbbv == 2 and analysis.openings == 1
+
+    def test_deduction_depth(self):
+        """Test per-cell waves: flag first, then clear with the mine count."""
+        analysis = BoardAnalyzer().analyze((5, 1, (2,), (0, 0)))
+        assert analysis.forced_guesses == 0
+        assert list(analysis.depths) == [0, 0, 1, 2, 2]
+        assert analysis.depth_counts == [2, 1, 2]
+        assert analysis.max_depth == 2 and analysis.solver_waves == 1
+
+    def test_forced_cells_are_sound(self):
+        """Test that every proven cell is certain according to the exact solver."""
+        solver = ConstraintSolver(workers=1)
+        for seed in range(20):
+            random.seed(seed)
+            game = Minesweeper(16, 16, 40, first_click=(8, 8))
+            game.reveal(8, 8)
+            constraints, _ = build_constraints(game)
+            safe, mines = _Frontier(constraints, game).forced()
+            probabilities, _ = solver.solve(game)
+            assert all(probabilities[cell] == 0 for cell in safe)
+            assert all(probabilities[cell] == 1 for cell in mines)
+
+    def test_layout_matches_board(self):
+        """Test that layouts read from the mine index list every mine in row order."""
+        random.seed(9)
+        game = Minesweeper(40, 30, 200, first_click=(5, 5))
+        game.place_mines(exclude=(5, 5))
+        width, height, mines, click = layout_of(game, (5, 5))
+        assert (width, height, click) == (40, 30, (5, 5))
+        assert mines == tuple(y * 40 + x for y in range(30) for x in range(40) if game.board[y][x] == -1)
+
+    def test_analyze_board_from_game(self):
+        """Test that a played game's layout hashes and analyzes like its layout."""
+        random.seed(3)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        game.reveal(8, 8)
+        analysis = analyze_board(game, (8, 8))
+        assert analysis.key == board_hash(layout_of(game, (8, 8)))
+        assert analysis.mines == 40
+        assert sum(analysis.depth_counts) >= 16 * 16 - 40
+        assert analysis.depth(8, 8) == 0
+
+
+class TestAnalyzeMany:
+    """Test suite for batched, cached analysis."""
+
+    def test_cache_and_workers(self, tmp_path):
+        """Test that workers match inline runs and repeats come from the cache."""
+        layouts = list(random_layouts(12, 9, 9, 10))
+        inline = analyze_many(layouts, workers=1)
+        cache = AnalysisCache(path=str(tmp_path / 'analysis.json'))
+        pooled = analyze_many(layouts + layouts[:3], workers=2, cache=cache, chunk=4)
+        assert [a.to_dict() for a in pooled[:12]] == [a.to_dict() for a in inline]
+        assert [a.key for a in pooled[12:]] == [a.key for a in inline[:3]]
+        assert len(cache) == 12 and cache.misses == 15
+
+        cache.save()
+        reloaded = AnalysisCache(path=str(tmp_path / 'analysis.json'))
+        again = analyze_many(layouts, workers=1, cache=reloaded)
+        assert reloaded.hits == 12
+        assert [a.rating() for a in again] == [a.rating() for a in inline]
@@ -0,0 +1,87 @@
+"""
+Unit tests for the bot arena.
+Run with: pytest tests/test_arena.py
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.arena import (AIStrategy, ArenaResult, RandomStrategy, RuleStrategy, SolverStrategy, Strategy,
+                       _play_chunk, play_game, run_arena)
+from src.latency import percentile
+
+
+class RecordingStrategy(RandomStrategy):
+    """Remembers the board it was shown at the start of each game."""
+
+    def new_game(self, view, game):
+        self.first_view = [list(row) for row in view.board]
+
+
+class TestArena:
+    """Test suite for the arena runner."""
+
+    def test_strategies_see_identical_boards(self):
+        """Test that every strategy starts each seed from the same opening."""
+        first, second = RecordingStrategy(), RecordingStrategy()
+        play_game(first, seed=7)
+        play_game(second, seed=7)
+        assert first.first_view == second.first_view
+
+    def test_run_arena_reports_metrics(self):
+        """Test that results carry strength and speed for every strategy."""
+        results = run_arena([RandomStrategy(), RuleStrategy(), SolverStrategy()], games=12, workers=1)
+        assert [r.name for r in results] == ['random', 'rules', 'solver']
+        for result in results:
+            assert result.games == 12
+            assert result.moves >= 12
+            assert len(result.latencies) == result.moves
+            assert result.mean_latency() > 0 and result.p99_latency() > 0
+            assert result.moves_per_second() > 0
+        assert results[2].wins >= results[0].wins
+
+    def test_run_arena_in_worker_processes(self):
+        """Test that pooled runs match in-process runs on the same seeds."""
+        serial = run_arena([RuleStrategy()], games=8, seed=3, workers=1)[0]
+        pooled = run_arena([RuleStrategy()], games=8, seed=3, workers=2)[0]
+        assert (pooled.games, pooled.wins, pooled.moves) == (serial.games, serial.wins, serial.moves)
+
+    def test_base_strategy_must_be_implemented(self):
+        """Test that the base class is only an interface."""
+        with pytest.raises(TypeError):
+            Strategy()
+
+    def test_p99_is_nearest_rank(self):
+        """Test that the arena's p99 matches the latency tracer's percentile."""
+        result = ArenaResult('x')
+        latencies = [i / 1000 for i in range(150, 0, -1)]
+        result.add(0, 1, len(latencies), 1.0, latencies)
+        assert result.p99_latency() == percentile(sorted(latencies), 99) == 0.149
+        assert ArenaResult('empty').p99_latency() == 0.0
+
+    def test_ai_strategy_plays_through_arena(self):
+        """Test that MinesweeperAI plays arena games one applied action at a time."""
+        strategy = AIStrategy(time_budget=0.05)
+        results = run_arena([strategy, RandomStrategy()], games=6, workers=1)
+        ai, rand = results
+        assert ai.name == 'ai' and ai.games == 6
+        assert len(ai.latencies) == ai.moves
+        assert ai.wins >= rand.wins and ai.wins > 0
+        copy = pickle.loads(pickle.dumps(strategy))
+        assert copy.options == {'time_budget': 0.05, 'workers': 1} and copy._ai is None
+
+    def test_ai_strategy_is_closed_after_its_chunk(self):
+        """Test that the last game's AI stops listening once the chunk is played."""
+        strategy = AIStrategy(time_budget=0.05)
+        games = []
+        new_game = strategy.new_game
+        strategy.new_game = lambda view, game: (games.append(game), new_game(view, game))
+        _play_chunk((strategy, [1, 2], 'beginner'))
+        assert len(games) == 2 and strategy._ai is None
+        assert all(game._listeners == [] for game in games)
@@ -0,0 +1,98 @@
+"""
+Unit tests for the batched game engine and AI.
+Run with: pytest tests/test_batch.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.batch import BatchAI, BatchMinesweeper
+from src.minesweeper import Minesweeper
+from src.simulation import RulePlayer, simulate_objects
+
+
+def engine_copy(batch, game):
+    """A Minesweeper object holding the same board as one batched game."""
+    single = Minesweeper(batch.width, batch.height, batch.num_mines, first_click=(0, 0))
+    board = batch.get_board(game)
+    for y in range(batch.height):
+        single.board[y][:] = board[y]
+    single._mines_placed = True
+    return single
+
+
+class TestBatchMinesweeper:
+    """Test suite for BatchMinesweeper."""
+
+    def test_counts_match_engine(self):
+        """Test that bit-sliced adjacent counts match a full recount."""
+        batch = BatchMinesweeper(20, 16, 16, 40, seed=1)
+        for game in range(batch.count):
+            single = engine_copy(batch, game)
+            single.calculate_adjacent_mines()
+            assert single.board == batch.get_board(game)
+            assert sum(row.count(-1) for row in single.board) == 40
+
+    def test_flood_fill_matches_engine(self):
+        """Test that batched flood fill reveals exactly what reveal() does."""
+        batch = BatchMinesweeper(30, 16, 16, 40, first_click=(8, 8), seed=2)
+        singles = [engine_copy(batch, game) for game in range(batch.count)]
+        batch.reveal(batch.cells_mask([(8, 8)] * batch.count))
+        for game, single in enumerate(singles):
+            single.reveal(8, 8)
+            assert [list(row) for row in single.revealed] == batch.get_revealed(game)
+
+    def test_mine_hit_finishes_only_that_game(self):
+        """Test that per-game done/won flags follow each game's own moves."""
+        batch = BatchMinesweeper(3, 9, 9, 10, seed=3)
+        mine = next((x, y) for y in range(9) for x in range(9) if batch.get_board(0)[y][x] == -1)
+        batch.reveal(batch.cells_mask([mine, None, None]))
+        assert batch.done == [True, False, False]
+        assert batch.won == [False, False, False]
+        batch.reveal(batch.cells_mask([mine, mine, None]))
+        assert batch.done[0] and batch.get_revealed(0)[mine[1]][mine[0]]
+
+
+class TestBatchAI:
+    """Test suite for BatchAI."""
+
+    def test_plays_every_game_to_the_end(self):
+        """Test that rules only flag mines and every game finishes correctly."""
+        batch = BatchMinesweeper(200, 16, 16, 40, first_click=(8, 8), seed=4)
+        ai = BatchAI(batch, seed=5)
+        batch.reveal(batch.cells_mask([(8, 8)] * batch.count))
+        while ai.step():
+            pass
+        assert all(batch.done)
+        for game in range(batch.count):
+            board = batch.get_board(game)
+            revealed = batch.get_revealed(game)
+            flagged = batch.get_flagged(game)
+            cells = [(x, y) for y in range(16) for x in range(16)]
+            assert all(board[y][x] == -1 for x, y in cells if flagged[y][x])
+            hit = any(revealed[y][x] and board[y][x] == -1 for x, y in cells)
+            solved = all(revealed[y][x] for x, y in cells if board[y][x] != -1)
+            assert batch.won[game] == (solved and not hit)
+        assert 0.3 < sum(batch.won) / batch.count < 0.7
+
+
+class TestRulePlayer:
+    """Test suite for the per-object baseline player."""
+
+    def test_rules_flag_before_guessing(self):
+        """Test that forced mines are flagged in one step without a guess."""
+        game = Minesweeper(5, 2, 2, first_click=(0, 0))
+        game.set_mines([(2, 0), (2, 1)])
+        player = RulePlayer(game)
+        game.reveal(0, 0)
+        assert player.step()
+        assert game.flagged[0][2] and game.flagged[1][2]
+        assert not any(game.revealed[y][x] for y in range(2) for x in (3, 4))
+
+    def test_simulate_objects_finishes_games(self):
+        """Test that the object runner plays every game to the end."""
+        result = simulate_objects(20, 'beginner', seed=4)
+        assert result.games == 20 and 0 < result.wins <= 20
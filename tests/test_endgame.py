@@ -0,0 +1,88 @@
+"""
+Unit tests for the endgame win-probability search.
+Run with: pytest tests/test_endgame.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai import MinesweeperAI
+from src.endgame import EndgameSolver
+from src.minesweeper import Minesweeper
+from src.view import BoardView
+
+
+def fixed_game(width, height, mines, click):
+    game = Minesweeper(width, height, len(mines), first_click=click)
+    game.set_mines(mines)
+    game.reveal(*click)
+    return game
+
+
+class TestEndgameSolver:
+    """Test suite for EndgameSolver."""
+
+    def test_coin_flip(self):
+        """Test that a forced 50/50 is worth exactly one half."""
+        game = fixed_game(2, 3, [(0, 2)], (0, 0))
+        solver = EndgameSolver()
+        assert len(solver.layouts(BoardView(game))[1]) == 2
+        move = solver.best_move(BoardView(game))
+        assert move.cell in ((0, 2), (1, 2))
+        assert move.probability == 0.5 and move.win_probability == 0.5
+
+    def test_mine_count_proves_safe_cell(self):
+        """Test that the mine count turns a 50/50 into a sure win."""
+        # One mine, either side of the 1; the cells beyond must be safe and
+        # revealing (3, 0) tells the two layouts apart
+        game = Minesweeper(5, 1, 1, first_click=(1, 0))
+        game.set_mines([(0, 0)])
+        game.reveal(1, 0)
+        move = EndgameSolver().best_move(BoardView(game))
+        assert move.cell == (3, 0)
+        assert move.probability == 0 and move.win_probability == 1.0
+
+    def test_gives_up_on_large_states(self):
+        """Test that boards with too many unknown cells are left to the solver."""
+        game = Minesweeper(9, 9, 10, first_click=(4, 4))
+        assert EndgameSolver(max_cells=14).best_move(BoardView(game)) is None
+
+    def test_table_answers_the_next_move(self):
+        """Test that after a real move the next state comes from the table."""
+        random.seed(3)
+        solver = EndgameSolver(max_cells=12)
+        for _ in range(200):
+            game = Minesweeper(5, 5, 5, first_click=(2, 2))
+            game.reveal(2, 2)
+            ai = MinesweeperAI(game, workers=1, endgame_cells=0)
+            while not game.game_over and ai.hidden_count > solver.max_cells:
+                ai.make_move()
+            move = None if game.game_over else solver.best_move(ai.view)
+            if move is None or move.win_probability in (0.0, 1.0) or not game.reveal(*move.cell):
+                ai.close()
+                continue
+            size = len(solver.table)
+            if not game.game_over:
+                again = solver.best_move(ai.view)
+                assert again is not None and len(solver.table) == size
+            ai.close()
+            return
+        raise AssertionError("no suitable endgame found")
+
+    def test_ai_plays_endgames(self):
+        """Test that the AI still finishes games with the endgame search on."""
+        random.seed(5)
+        wins = 0
+        for _ in range(30):
+            game = Minesweeper(9, 9, 10, first_click=(4, 4))
+            game.reveal(4, 4)
+            ai = MinesweeperAI(game, workers=1, endgame_cells=14)
+            while not game.game_over:
+                ai.make_move()
+            wins += game.game_won
+            ai.close()
+        assert wins >= 15
@@ -0,0 +1,92 @@
+"""
+Unit tests for the GUI frame scheduler.
+Run with: pytest tests/test_frames.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.frames import FrameScheduler
+
+
+class FakeLoop:
+    """A stand-in for Tk's ``after`` with a manual clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.timers = []
+
+    def clock(self):
+        return self.now
+
+    def after(self, delay_ms, callback):
+        self.timers.append((self.now + delay_ms / 1000, callback))
+        return len(self.timers)
+
+    def cancel(self, timer):
+        self.timers[timer - 1] = (float('inf'), None)
+
+    def advance(self, seconds):
+        """Move the clock, firing due timers in order."""
+        end = self.now + seconds
+        while True:
+            due = [t for t in self.timers if t[0] <= end and t[1] is not None]
+            if not due:
+                break
+            first = min(due, key=lambda t: t[0])
+            self.timers[self.timers.index(first)] = (float('inf'), None)
+            self.now = max(self.now, first[0])
+            first[1]()
+        self.now = end
+
+
+def make_scheduler(loop, frames):
+    return FrameScheduler(loop.after, lambda cells, labels, full: frames.append((cells, labels, full)),
+                          fps=50, clock=loop.clock, cancel=loop.cancel)
+
+
+class TestFrameScheduler:
+    """Test suite for FrameScheduler."""
+
+    def test_updates_coalesce_into_one_frame(self):
+        """Test that many updates within a frame are drawn once, with the last label text."""
+        loop, frames = FakeLoop(), []
+        scheduler = make_scheduler(loop, frames)
+        for i in range(100):
+            scheduler.mark_cells([(i % 10, 0)])
+            scheduler.set_label('info_label', f"move {i}")
+        loop.advance(0.001)
+        assert len(frames) == 1
+        cells, labels, full = frames[0]
+        assert len(cells) == 10 and labels == {'info_label': 'move 99'} and not full
+        assert scheduler.coalesced == 199
+
+    def test_frame_rate_is_capped(self):
+        """Test that a steady stream of updates flushes at most once per frame interval."""
+        loop, frames = FakeLoop(), []
+        scheduler = make_scheduler(loop, frames)
+        for _ in range(1000):
+            scheduler.mark_cells([(0, 0)])
+            loop.advance(0.001)
+        # one second at 50 fps
+        assert 45 <= len(frames) <= 51
+        assert 45 <= scheduler.fps() <= 51
+
+    def test_flush_now_and_dropped_frames(self):
+        """Test immediate flushes, and that a busy loop is counted as dropped frames."""
+        loop, frames = FakeLoop(), []
+        scheduler = make_scheduler(loop, frames)
+        assert not scheduler.pending()
+        scheduler.mark_all()
+        assert scheduler.pending()
+        scheduler.flush_now()
+        assert frames == [(set(), {}, True)] and not scheduler.pending()
+        loop.advance(0.5)
+        assert len(frames) == 1  # the cancelled timer does not fire
+        scheduler.mark_cells([(1, 1)])
+        loop.now += 0.1  # the event loop is blocked for 100 ms
+        loop.advance(0)
+        assert len(frames) == 2 and scheduler.dropped >= 4
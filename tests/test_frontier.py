@@ -0,0 +1,68 @@
+"""
+Unit tests for the shared frontier tracker.
+Run with: pytest tests/test_frontier.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.frontier import FrontierTracker
+from src.minesweeper import Minesweeper
+from src.view import BoardView
+
+
+def fixed_game(width, height, mines, click):
+    game = Minesweeper(width, height, len(mines), first_click=click)
+    game.set_mines(mines)
+    game.reveal(*click)
+    return game
+
+
+class TestFrontierTracker:
+    """Test suite for FrontierTracker."""
+
+    def test_events_keep_dirty_sets_and_counts(self):
+        """Test that every owner's dirty set hears about new frontier numbers."""
+        game = fixed_game(5, 1, [(2, 0)], (0, 0))
+        first, second = set(), set()
+        tracker = FrontierTracker(BoardView(game), dirty=(first, second))
+        game.subscribe(tracker.apply)
+        assert tracker.frontier_numbers == {(1, 0)} and first == second == {(1, 0)}
+        first.clear()
+        game.reveal(3, 0)
+        assert tracker.hidden_count == 2
+        assert (3, 0) in tracker.frontier_numbers and (3, 0) in first
+        game.toggle_flag(2, 0)
+        assert tracker.hidden_count == 1 and tracker.frontier_numbers == {(3, 0)}
+
+    def test_known_mines_resolve_numbers(self):
+        """Test that proven mines take their numbers off the frontier but stay hidden."""
+        game = fixed_game(5, 1, [(2, 0)], (0, 0))
+        known = set()
+        tracker = FrontierTracker(BoardView(game), known_mines=known)
+        known.add((2, 0))
+        tracker.touch(2, 0)
+        assert tracker.frontier_numbers == set()
+        assert tracker.hidden_count == 3
+
+    def test_matches_a_fresh_scan_after_undo(self):
+        """Test that an undo of several moves leaves the same picture as a new scan."""
+        random.seed(11)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        game.reveal(8, 8)
+        tracker = FrontierTracker(BoardView(game))
+        game.subscribe(tracker.apply)
+        game.checkpoint()
+        safe = [(x, y) for y in range(16) for x in range(16)
+                if not game.revealed[y][x] and game.board[y][x] != -1]
+        for cell in safe[:3]:
+            game.reveal(*cell)
+        mine = next((x, y) for y in range(16) for x in range(16) if game.board[y][x] == -1)
+        game.toggle_flag(*mine)
+        game.undo()
+        fresh = FrontierTracker(BoardView(game))
+        assert (tracker.hidden_count, tracker.frontier_numbers) == (fresh.hidden_count, fresh.frontier_numbers)
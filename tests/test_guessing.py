@@ -0,0 +1,52 @@
+"""
+Unit tests for information-gain guess selection.
+Run with: pytest tests/test_guessing.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.guessing import GuessSelector, corner_cells
+from src.minesweeper import Minesweeper
+from src.simulation import simulate_ai
+from src.view import BoardView
+
+
+class TestGuessSelector:
+    """Test suite for GuessSelector."""
+
+    def test_prefers_cells_that_settle_more(self):
+        """Test that among equal risks the cell with sure-looking neighbours wins."""
+        view = BoardView(Minesweeper(5, 5, 3))
+        # (0, 0)'s neighbours are nearly certain; (2, 2)'s are coin flips
+        probabilities = {(0, 0): 0.2, (2, 2): 0.2, (1, 0): 0.02, (0, 1): 0.02, (1, 1): 0.02}
+        for x, y in ((1, 2), (2, 1), (3, 2), (2, 3), (3, 3), (1, 3), (3, 1)):
+            probabilities[(x, y)] = 0.5
+        selector = GuessSelector()
+        assert selector.expected_settled(view, (0, 0), probabilities) > \
+            selector.expected_settled(view, (2, 2), probabilities)
+        assert selector.choose(view, {c: probabilities[c] for c in ((0, 0), (2, 2))}, 0.5) == (0, 0)
+
+    def test_tolerance_bounds_the_extra_risk(self):
+        """Test that a much riskier cell is never chosen for its information."""
+        view = BoardView(Minesweeper(5, 5, 3))
+        probabilities = {(2, 2): 0.1, (0, 0): 0.3}
+        assert GuessSelector(tolerance=0.02).choose(view, probabilities, 0.5) == (2, 2)
+
+    def test_corner_cells(self):
+        """Test that only hidden corners outside the exclusion are offered."""
+        game = Minesweeper(4, 4, 1, first_click=(0, 0))
+        game.set_mines([(3, 3)])
+        game.toggle_flag(3, 3)
+        assert corner_cells(BoardView(game), exclude=[(3, 0)]) == [(0, 0), (0, 3)]
+
+    def test_simulation_reports_guesses(self):
+        """Test that the AI runner counts guesses alongside wins."""
+        random.seed(0)
+        result = simulate_ai(20, 'beginner')
+        assert result.guesses is not None and result.guesses >= 0
+        assert 'guesses/game' in result.get_summary()
@@ -0,0 +1,99 @@
+"""
+Unit tests for display-independent GUI helpers.
+Run with: pytest tests/test_gui.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui import MinesweeperGUI
+from src.minesweeper import Minesweeper
+
+
+class Recorder:
+    """Stands in for Tk widgets and the sprite atlas, logging calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args))
+            return name, args
+        return record
+
+
+class TestStyleTables:
+    """Test suite for precomputed per-theme canvas styles."""
+
+    def test_every_theme_styles_the_same_tags(self):
+        """Test that a theme switch touches a fixed set of tags."""
+        tables = [MinesweeperGUI.build_style_table(colors) for colors in MinesweeperGUI.THEMES.values()]
+        keys = set(tables[0])
+        assert all(set(table) == keys for table in tables)
+        assert {f'text_{n}' for n in range(1, 9)} <= keys
+        assert set(MinesweeperGUI.GLYPHS) <= keys
+
+    def test_number_colours_follow_theme(self):
+        """Test that number glyph colours come from the theme's palette."""
+        colors = MinesweeperGUI.THEMES['Modern']
+        table = MinesweeperGUI.build_style_table(colors)
+        assert table['text_3']['fill'] == colors['numbers'][3]
+        assert table['cell_hidden']['fill'] == colors['cell_hidden']
+
+
+class TestThemeRepaint:
+    """Test suite for re-skinning only the cell states on show."""
+
+    def make_gui(self):
+        random.seed(3)
+        gui = MinesweeperGUI.__new__(MinesweeperGUI)
+        gui.game = Minesweeper(9, 9, 10, first_click=(4, 4))
+        gui.root, gui.canvas, gui.sprites = Recorder(), Recorder(), Recorder()
+        gui.info_label = gui.mine_counter_label = gui.timer_label = None
+        gui.current_theme, gui.cell_size = 'Dark', 25
+        hidden = ('cell_hidden', 'text_blank')
+        gui.cell_items = [[(x, y) for x in range(9)] for y in range(9)]
+        gui.cell_states = [[hidden] * 9 for _ in range(9)]
+        gui.state_counts = {hidden: 81}
+        return gui
+
+    def test_state_counts_follow_drawn_cells(self):
+        """Test that per-state counts match the drawn board and drive apply_theme."""
+        gui = self.make_gui()
+        gui.game.reveal(4, 4)
+        flag = next((x, y) for y in range(9) for x in range(9) if not gui.game.revealed[y][x])
+        gui.game.toggle_flag(*flag)
+        for y in range(9):
+            for x in range(9):
+                gui.draw_cell(x, y)
+        expected = {}
+        for row in gui.cell_states:
+            for state in row:
+                expected[state] = expected.get(state, 0) + 1
+        assert gui.state_counts == expected
+        gui.canvas.calls.clear()
+        gui.apply_theme()
+        retagged = {args[0] for name, args in gui.canvas.calls if name == 'itemconfigure'}
+        assert retagged == {('tag', (state,)) for state in expected}
+
+
+class TestNewGame:
+    """Test suite for choosing the size of a new game."""
+
+    def test_new_game_starts_preset_or_asks_for_custom(self):
+        """Test that presets start directly and Custom only opens the dialog."""
+        gui = MinesweeperGUI.__new__(MinesweeperGUI)
+        started, dialogs = [], []
+        gui.start_game = lambda *size: started.append(size)
+        gui.show_custom_dialog = lambda: dialogs.append(True)
+        gui.current_difficulty = 'Expert'
+        gui.new_game()
+        gui.current_difficulty = 'Custom'
+        gui.new_game()
+        assert started == [MinesweeperGUI.DIFFICULTIES['Expert']]
+        assert dialogs == [True]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the GUI hint engine.
+Run with: pytest tests/test_hints.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.hints import HintEngine
+from src.minesweeper import Minesweeper
+
+
+def fixed_game(width, height, mines, click):
+    game = Minesweeper(width, height, len(mines), first_click=click)
+    game.set_mines(mines)
+    game.reveal(*click)
+    return game
+
+
+class TestHintEngine:
+    """Test suite for HintEngine."""
+
+    def test_hint_does_not_change_the_game(self):
+        """Test that a query leaves the board and its generation untouched."""
+        random.seed(4)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        hints = HintEngine(game)
+        assert hints.hint().cell == (8, 8)
+        game.reveal(8, 8)
+        generation = game.generation
+        revealed = [list(row) for row in game.revealed]
+        hints.hint()
+        assert game.generation == generation
+        assert [list(row) for row in game.revealed] == revealed
+        assert game.get_flag_count() == 0
+
+    def test_safe_hints_are_safe(self):
+        """Test that following hints never steps on a 'safe' mine."""
+        for seed in range(10):
+            random.seed(seed)
+            game = Minesweeper(30, 16, 99, first_click=(15, 8))
+            hints = HintEngine(game)
+            while not game.game_over:
+                hint = hints.hint()
+                x, y = hint.cell
+                if hint.kind == 'safe':
+                    assert game.board[y][x] != -1
+                game.reveal(x, y)
+            hints.close()
+
+    def test_deduced_mines_count_without_flags(self):
+        """Test that a proven mine clears the cells beyond it."""
+        game = fixed_game(5, 1, [(2, 0)], (0, 0))
+        hint = HintEngine(game).hint()
+        assert hint.kind == 'safe' and hint.cell in {(3, 0), (4, 0)}
+        assert game.get_flag_count() == 0
+
+    def test_guess_is_cached_until_the_board_changes(self):
+        """Test that a stuck position is solved once per board state."""
+        game = fixed_game(3, 2, [(0, 0)], (2, 1))
+        hints = HintEngine(game)
+        first = hints.hint()
+        assert first.kind == 'guess' and first.probability == 0.5
+        assert hints.hint() is first
+        game.toggle_flag(0, 0)
+        assert hints.hint().cell == (0, 1)
+
+    def test_undo_forgets_frontier_and_proofs(self):
+        """Test that undo() hides numbers from the frontier and drops stale proofs."""
+        game = fixed_game(5, 1, [(2, 0)], (0, 0))
+        hints = HintEngine(game)
+        assert hints.hint().cell in {(3, 0), (4, 0)}
+        game.checkpoint()
+        game.reveal(3, 0)
+        game.toggle_flag(2, 0)
+        game.undo()
+        assert hints.hidden_count == 3
+        assert hints.frontier_numbers == {(1, 0)}
+        assert hints.hint().cell in {(3, 0), (4, 0)}
@@ -0,0 +1,193 @@
+"""
+Unit tests for input-to-paint latency tracing.
+Run with: pytest tests/test_latency.py
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.latency import LatencyTracer, percentile, replay, scripted_inputs
+from src.minesweeper import Minesweeper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLatencyTracer:
+    """Test suite for splitting and summarising latencies."""
+
+    def test_input_is_split_into_phases(self):
+        """Test that engine, stats, render and waiting time add up to the total."""
+        clock = FakeClock()
+        tracer = LatencyTracer(clock=clock)
+        tracer.begin('reveal')
+        with tracer.phase('engine'):
+            clock.now += 0.004
+        with tracer.phase('stats'):
+            clock.now += 0.001
+        clock.now += 0.010  # waiting for the frame
+        tracer.render_started()
+        clock.now += 0.002
+        tracer.painted()
+        assert tracer.count == 1
+        kind, total, engine, stats, render, wait = tracer.samples[0]
+        assert kind == 'reveal'
+        assert abs(total - 0.017) < 1e-9
+        assert abs(engine - 0.004) < 1e-9 and abs(stats - 0.001) < 1e-9
+        assert abs(render - 0.002) < 1e-9 and abs(wait - 0.010) < 1e-9
+
+    def test_input_after_flush_waits_for_next_paint(self):
+        """Test that a click arriving between flush and paint is closed by the next paint."""
+        clock = FakeClock()
+        tracer = LatencyTracer(clock=clock)
+        tracer.begin('reveal')
+        tracer.render_started()
+        clock.now += 0.001
+        tracer.begin('flag')
+        tracer.painted()
+        assert tracer.count == 1
+        tracer.render_started()
+        tracer.painted()
+        assert [sample[0] for sample in tracer.samples] == ['reveal', 'flag']
+
+    def test_cancel_and_paint_without_input(self):
+        """Test that cancelled inputs and untraced frames record nothing."""
+        tracer = LatencyTracer(clock=FakeClock())
+        tracer.render_started()
+        tracer.painted()
+        tracer.begin('chord')
+        tracer.cancel()
+        tracer.render_started()
+        tracer.painted()
+        assert tracer.count == 0
+        assert tracer.get_summary() == "no inputs traced"
+
+    def test_percentiles_and_dump(self, tmp_path):
+        """Test the rolling window's percentiles and the JSON dump."""
+        assert percentile([], 50) == 0.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+        assert percentile([float(i) for i in range(1, 101)], 99) == 99.0
+        clock = FakeClock()
+        tracer = LatencyTracer(window=10, clock=clock)
+        for i in range(20):
+            tracer.begin('reveal')
+            clock.now += (i + 1) / 1000
+            tracer.render_started()
+            tracer.painted()
+        assert tracer.count == 20 and len(tracer.samples) == 10
+        figures = tracer.percentiles()
+        assert abs(figures['total']['p50'] - 15.0) < 1e-6 and abs(figures['total']['p99'] - 20.0) < 1e-6
+        path = tmp_path / 'latency.json'
+        tracer.dump(str(path))
+        data = json.loads(path.read_text())
+        assert data['inputs'] == 20 and len(data['samples']) == 10
+        assert abs(data['percentiles_ms']['total']['p95'] - 20.0) < 1e-6
+
+
+class TestScriptedInputs:
+    """Test suite for the replay input stream."""
+
+    def play(self, seed):
+        rng = random.Random(seed)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        game.set_mines(rng.sample([(x, y) for y in range(16) for x in range(16)], 40))
+        applied = []
+        for kind, x, y in scripted_inputs(game, 60, seed=seed):
+            if kind == 'reveal':
+                game.reveal(x, y)
+            elif kind == 'flag':
+                game.toggle_flag(x, y)
+            else:
+                game.chord(x, y)
+            applied.append((kind, x, y))
+        return game, applied
+
+    def test_script_never_ends_the_game(self):
+        """Test that scripted inputs neither hit a mine nor win."""
+        for seed in range(5):
+            game, applied = self.play(seed)
+            assert not game.game_over
+            assert applied[0][0] == 'reveal' and len(applied) > 10
+
+    def test_script_is_repeatable(self):
+        """Test that the same seed gives the same inputs."""
+        assert self.play(3)[1] == self.play(3)[1]
+
+
+class FakeCanvas:
+    """Records generated events and opens a traced input like the GUI handler."""
+
+    KINDS = {'<Button-1>': 'reveal', '<Button-3>': 'flag', '<Button-2>': 'chord'}
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.events = []
+
+    def event_generate(self, sequence, x, y):
+        self.events.append((sequence, x, y))
+        kind = self.KINDS[sequence]
+        self.tracer.begin(kind)
+        if kind == 'chord':
+            self.tracer.cancel()  # a chord that changes nothing paints nothing
+
+
+class FakeRoot:
+    """Paints every open input on the second event-loop pass after it arrives."""
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.updates = 0
+        self.waiting = 0
+
+    def update(self):
+        self.updates += 1
+        if self.tracer.pending:
+            self.waiting += 1
+            if self.waiting == 2:
+                self.tracer.render_started()
+                self.tracer.painted()
+                self.waiting = 0
+
+
+class FakeGUI:
+    def __init__(self):
+        self.cell_size = 20
+        self.latency = LatencyTracer()
+        self.canvas = FakeCanvas(self.latency)
+        self.root = FakeRoot(self.latency)
+
+
+class TestReplay:
+    """Test suite for feeding inputs to the GUI as Tk events."""
+
+    def test_inputs_become_button_events_at_cell_centres(self):
+        """Test that each input is one button event at its cell's centre, waited on until painted."""
+        gui = FakeGUI()
+        inputs = [('reveal', 2, 3), ('flag', 0, 0), ('chord', 1, 4), ('reveal', 5, 1)]
+        began = time.perf_counter()
+        assert replay(gui, iter(inputs), timeout=5.0) == 4
+        assert time.perf_counter() - began < 1.0
+        assert gui.canvas.events == [('<Button-1>', 50, 70), ('<Button-3>', 10, 10),
+                                     ('<Button-2>', 30, 90), ('<Button-1>', 110, 30)]
+        assert [sample[0] for sample in gui.latency.samples] == ['reveal', 'flag', 'reveal']
+        assert gui.latency.pending == 0
+
+    def test_unpainted_input_gives_up_at_timeout(self):
+        """Test that an input that is never painted stops waiting after the timeout."""
+        gui = FakeGUI()
+        gui.root.update = lambda: None
+        began = time.perf_counter()
+        assert replay(gui, iter([('reveal', 0, 0)]), timeout=0.05) == 1
+        assert 0.05 <= time.perf_counter() - began < 1.0
+        assert gui.latency.count == 0
@@ -3,6 +3,7 @@ Unit tests for Minesweeper game logic.
 Run with: pytest test_minesweeper.py
 """
 
+import copy
 import pytest
 import sys
 from pathlib import Path
@@ -109,3 +110,195 @@ class TestMinesweeper:
             if game.game_over:
                 break
 
+    
+    def test_change_events(self):
+        """Test that reveal and flag changes are published to subscribers."""
+        game = Minesweeper(10, 10, 10, first_click=(5, 5))
+        events = []
+        game.subscribe(lambda kind, cells: events.append((kind, list(cells))))
+        game.reveal(5, 5)
+        assert events[0][0] == 'reveal'
+        revealed = {(x, y) for y in range(10) for x in range(10) if game.revealed[y][x]}
+        assert set(events[0][1]) == revealed
+        
+        hidden = next((x, y) for y in range(10) for x in range(10) if not game.revealed[y][x])
+        game.toggle_flag(*hidden)
+        game.toggle_flag(*hidden)
+        assert events[1:] == [('flag', [hidden]), ('unflag', [hidden])]
+
+    def test_set_mines(self):
+        """Test that a fixed layout replaces random placement."""
+        game = Minesweeper(4, 3, 5, first_click=(3, 2))
+        game.set_mines([(0, 0), (1, 0)])
+        assert game.num_mines == 2
+        assert game.board[1][0] == 2 and game.board[1][2] == 1 and game.board[2][3] == 0
+        game.reveal(3, 2)
+        assert game.board[0][0] == -1 and game.board[0][1] == -1
+        assert game.game_won
+
+    def test_reveal_many_is_one_move(self):
+        """Test that a batch reveal floods from every seed and publishes once."""
+        game = Minesweeper(9, 3, 1, first_click=(0, 0))
+        game.set_mines([(4, 1)])
+        events = []
+        game.subscribe(lambda kind, cells: events.append((kind, list(cells))))
+        assert game.reveal_many([(0, 0), (8, 2), (0, 0), (4, 0), (4, 2)]) is True
+        assert len(events) == 1
+        assert len(events[0][1]) == len(set(events[0][1])) == 26
+        assert game.game_won
+
+    def test_reveal_many_with_mine(self):
+        """Test that a mine in the batch loses the game and stops the move there."""
+        game = Minesweeper(5, 5, 1, first_click=(0, 0))
+        game.set_mines([(2, 2)])
+        events = []
+        game.subscribe(lambda kind, cells: events.append((kind, list(cells))))
+        assert game.reveal_many([(2, 2), (1, 1), (0, 4)]) is False
+        assert game.game_over and not game.game_won
+        assert game.revealed[2][2] and not game.revealed[1][1] and not game.revealed[4][0]
+        assert events == [('reveal', [(2, 2)])]
+
+    def test_lost_chord_opens_one_mine_and_no_cascade(self):
+        """Test that a chord around a wrong flag stops at its first mine."""
+        game = Minesweeper(6, 6, 2, first_click=(1, 1))
+        game.set_mines([(0, 0), (2, 0)])
+        game.reveal(1, 1)
+        game.toggle_flag(0, 1)  # wrong: the number's mines are above it
+        game.toggle_flag(1, 0)
+        events = []
+        game.subscribe(lambda kind, cells: events.append((kind, list(cells))))
+        assert game.chord(1, 1) is False
+        assert game.game_over
+        assert events == [('reveal', [(0, 0)])]
+        assert not game.revealed[0][2] and not game.revealed[2][2]
+        assert sum(row.count(True) for row in game.revealed) == 2
+
+    def test_chord_reveals_in_one_event(self):
+        """Test that chording publishes a single combined change."""
+        game = Minesweeper(5, 5, 1, first_click=(0, 0))
+        game.set_mines([(2, 2)])
+        game.reveal(1, 1)
+        game.toggle_flag(2, 2)
+        events = []
+        game.subscribe(lambda kind, cells: events.append(kind))
+        assert game.chord(1, 1) is True
+        assert events == ['reveal']
+        assert game.game_won
+
+    def test_mine_index(self):
+        """Test that the mine index matches the board and answers row queries."""
+        game = Minesweeper(10, 10, 15)
+        mines = game.mine_cells()
+        assert len(mines) == 15
+        assert all(game.board[y][x] == -1 for x, y in mines)
+        assert game.mines_in_rows() == 15
+        assert game.mines_in_rows(0, 5) + game.mines_in_rows(5, 10) == 15
+        assert game.mines_in_rows(3, 4) == sum(1 for x, y in mines if y == 3)
+        assert game.mine_density() == 0.15
+
+    def test_row_hidden_counts(self):
+        """Test that per-row hidden counts follow reveals and flags."""
+        game = Minesweeper(5, 5, 1, first_click=(0, 0))
+        game.set_mines([(4, 4)])
+        game.toggle_flag(4, 4)
+        assert list(game.row_hidden) == [5, 5, 5, 5, 4]
+        game.reveal(0, 0)
+        assert list(game.row_hidden) == [0, 0, 0, 0, 0]
+        game.toggle_flag(4, 4)
+        assert game.row_hidden[4] == 0  # the game is won, so the flag stays
+
+    def test_reveal_mines_after_loss(self):
+        """Test that a loss reveals only the unflagged mines, in one event."""
+        game = Minesweeper(5, 5, 3, first_click=(0, 0))
+        game.set_mines([(4, 0), (4, 2), (4, 4)])
+        game.toggle_flag(4, 4)
+        game.reveal(4, 0)
+        events = []
+        game.subscribe(lambda kind, cells: events.append((kind, cells)))
+        assert game.reveal_mines() == [(4, 2)]
+        assert events == [('reveal', [(4, 2)])]
+        assert not game.revealed[4][4]
+
+    def test_recount_rebuilds_index(self):
+        """Test that recounting a hand-written board rebuilds the mine index."""
+        game = Minesweeper(4, 4, 0, first_click=(0, 0))
+        game.board[1][1] = -1
+        game.board[3][3] = -1
+        game.calculate_adjacent_mines()
+        assert game.mine_cells() == [(1, 1), (3, 3)]
+        assert game.board[2][2] == 2 and game.board[0][3] == 0
+
+    def test_save_and_load(self):
+        """Test that a game survives a to_dict/from_dict round trip."""
+        game = Minesweeper(8, 8, 1, first_click=(0, 0))
+        game.set_mines([(7, 7)])
+        game.reveal(0, 0)
+        game2 = Minesweeper(8, 8, 5, first_click=(0, 0))
+        game2.reveal(0, 0)
+        game2.toggle_flag(*game2.mine_cells()[0])
+        for original in (game, game2):
+            loaded = Minesweeper.from_dict(original.to_dict())
+            assert loaded.board == original.board
+            assert loaded.revealed == original.revealed
+            assert loaded.flagged == original.flagged
+            assert list(loaded.row_hidden) == list(original.row_hidden)
+            assert loaded.game_won == original.game_won
+            assert loaded.is_solved() == original.is_solved()
+
+    def test_clone_is_independent(self):
+        """Test that moves on a clone and on the original do not leak across."""
+        game = Minesweeper(6, 6, 1, first_click=(0, 0))
+        game.set_mines([(5, 5)])
+        game.toggle_flag(5, 5)
+        twin = game.clone()
+        assert twin.board is game.board  # mines placed: board is shared
+        twin.toggle_flag(5, 5)
+        twin.reveal(0, 0)
+        assert twin.game_won and not game.game_over
+        assert not any(any(row) for row in game.revealed)
+        assert game.flagged[5][5] and not twin.flagged[5][5]
+        game.reveal(0, 0)
+        assert game.game_won and game.get_flag_count() == 1
+
+    def test_clone_before_first_click(self):
+        """Test that a clone places its own mines on its first reveal."""
+        game = Minesweeper(8, 8, 10, first_click=(0, 0))
+        twin = game.clone()
+        twin.reveal(3, 3)
+        assert len(twin.mine_cells()) == 10
+        assert not any(-1 in row for row in game.board)
+
+    def test_undo_restores_state(self):
+        """Test that undo rolls reveals and flags back to the checkpoint."""
+        game = Minesweeper(6, 6, 2, first_click=(0, 0))
+        game.set_mines([(5, 0), (5, 5)])
+        game.toggle_flag(5, 5)
+        before = (copy.deepcopy(game.revealed), copy.deepcopy(game.flagged),
+                  list(game.row_hidden), game.get_flag_count())
+        buffer = game.visible_buffer()
+        snapshot = bytes(buffer)
+        game.checkpoint()
+        game.toggle_flag(5, 5)
+        game.reveal(0, 0)
+        game.reveal(5, 0)
+        assert game.game_over
+        assert game.undo() is True
+        assert (game.revealed, game.flagged, list(game.row_hidden), game.get_flag_count()) == before
+        assert not game.game_over and bytes(buffer) == snapshot
+        assert game.undo() is False
+
+    def test_nested_undo_and_first_click(self):
+        """Test that nested checkpoints unwind in order, including mine placement."""
+        game = Minesweeper(8, 8, 10, first_click=(0, 0))
+        game.checkpoint()
+        game.reveal(0, 0)
+        game.checkpoint()
+        cell = next((x, y) for y in range(8) for x in range(8) if not game.revealed[y][x])
+        game.toggle_flag(*cell)
+        game.undo()
+        assert not game.flagged[cell[1]][cell[0]] and game.revealed[0][0]
+        game.undo()
+        assert not any(any(row) for row in game.revealed)
+        assert game.mine_cells() == [] and not any(any(row) for row in game.board)
+        game.reveal(4, 4)
+        assert len(game.mine_cells()) == 10
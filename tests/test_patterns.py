@@ -0,0 +1,86 @@
+"""
+Unit tests for the constraint-pattern cache.
+Run with: pytest tests/test_patterns.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.minesweeper import Minesweeper
+from src.patterns import PatternCache, canonicalize
+from src.solver import ConstraintSolver, enumerate_component
+
+# An L-shaped frontier: three cells along a wall and one around the corner.
+CELLS = [(0, 0), (1, 0), (2, 0), (2, 1)]
+CONSTRAINTS = [((0, 1), 1), ((0, 1, 2), 1), ((1, 2, 3), 2), ((3,), 1)]
+
+
+def transformed(cells, transform, dx=0, dy=0):
+    return [(transform(x, y)[0] + dx, transform(x, y)[1] + dy) for x, y in cells]
+
+
+class TestPatternCache:
+    """Test suite for canonical pattern keys and the LRU cache."""
+
+    def test_symmetric_copies_share_key(self):
+        """Test that rotated and reflected patterns canonicalize identically."""
+        key, _ = canonicalize(CELLS, CONSTRAINTS)
+        rotated = transformed(CELLS, lambda x, y: (-y, x), dx=10, dy=3)
+        mirrored = transformed(CELLS, lambda x, y: (-x, y), dx=7)
+        assert canonicalize(rotated, CONSTRAINTS)[0] == key
+        assert canonicalize(mirrored, CONSTRAINTS)[0] == key
+
+    def test_hit_maps_back_to_component_order(self):
+        """Test that a hit on a permuted copy returns that copy's counts."""
+        cache = PatternCache()
+        counts, key, rank = cache.lookup(CELLS, CONSTRAINTS)
+        assert counts is None
+        cache.store(key, rank, enumerate_component(len(CELLS), CONSTRAINTS))
+
+        # Same shape, rotated, with the cells listed in a different order.
+        order = [3, 1, 0, 2]
+        rotated = transformed([CELLS[i] for i in order], lambda x, y: (y, -x))
+        remap = {old: new for new, old in enumerate(order)}
+        constraints = [(tuple(remap[c] for c in members), mines) for members, mines in CONSTRAINTS]
+
+        counts, _, _ = cache.lookup(rotated, constraints)
+        assert counts == enumerate_component(len(CELLS), constraints)
+        assert cache.hits == 1 and cache.misses == 1
+        assert cache.get_hit_rate() == 50.0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used pattern is evicted first."""
+        cache = PatternCache(capacity=2)
+        for mines in (0, 1, 2):
+            constraints = [((0, 1), mines)]
+            _, key, rank = cache.lookup([(0, 0), (1, 0)], constraints)
+            cache.store(key, rank, enumerate_component(2, constraints))
+        assert len(cache) == 2
+        assert cache.lookup([(0, 0), (1, 0)], [((0, 1), 0)])[0] is None
+
+    def test_save_and_load(self, tmp_path):
+        """Test that patterns persist to disk between runs."""
+        path = str(tmp_path / "patterns.json")
+        cache = PatternCache(path=path)
+        _, key, rank = cache.lookup(CELLS, CONSTRAINTS)
+        cache.store(key, rank, enumerate_component(len(CELLS), CONSTRAINTS))
+        cache.save()
+
+        reloaded = PatternCache(path=path)
+        counts, _, _ = reloaded.lookup(CELLS, CONSTRAINTS)
+        assert counts == enumerate_component(len(CELLS), CONSTRAINTS)
+
+    def test_solver_reuses_patterns(self):
+        """Test that repeated solves of a position become cache hits."""
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        game.reveal(8, 8)
+        cache = PatternCache()
+        uncached = ConstraintSolver(workers=1, cache=None).solve(game)
+        solver = ConstraintSolver(workers=1, cache=cache)
+        first = solver.solve(game)
+        second = solver.solve(game)
+        assert first == second == uncached
+        assert cache.hits == cache.misses
@@ -24,6 +24,27 @@ def test_imports() -> Tuple[bool, str]:
         return False, f"[FAIL] Import failed: {e}"
 
 
+def test_headless_imports():
+    """Test that engine, AI and stats imports never load tkinter (fresh interpreter)."""
+    import subprocess
+    code = ("import sys; import src; from src import Minesweeper; "
+            "import src.ai, src.stats; "
+            "assert 'tkinter' not in sys.modules, 'tkinter was imported'; "
+            "assert 'src.gui' not in sys.modules, 'src.gui was imported'")
+    result = subprocess.run([sys.executable, '-c', code], cwd=str(Path(__file__).parent.parent),
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def check_headless_imports() -> Tuple[bool, str]:
+    """Run test_headless_imports for the validation script."""
+    try:
+        test_headless_imports()
+        return True, "[PASS] Headless imports stay free of tkinter"
+    except AssertionError as e:
+        return False, f"[FAIL] Headless imports failed: {e}"
+
+
 def test_game_creation() -> Tuple[bool, str]:
     """Test basic game creation."""
     try:
@@ -165,6 +186,7 @@ def run_all_tests() -> Tuple[int, int]:
     """Run all tests and return (passed, total)."""
     tests = [
         test_imports,
+        check_headless_imports,
         test_game_creation,
         test_game_logic,
         test_neighbors,
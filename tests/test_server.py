@@ -0,0 +1,159 @@
+"""
+Unit tests for the multiplayer game server (loopback clients only).
+Run with: pytest tests/test_server.py
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.server import FLAG, HIDDEN, GameServer, Session
+
+
+async def connect(server):
+    return await asyncio.open_connection(server.host, server.port)
+
+
+async def send(streams, **command):
+    """Send one command without waiting for a reply."""
+    _, writer = streams
+    writer.write((json.dumps(command) + '\n').encode())
+    await writer.drain()
+
+
+async def request(streams, **command):
+    """Send one command and return the next message."""
+    await send(streams, **command)
+    return await receive(streams)
+
+
+async def receive(streams):
+    reader, _ = streams
+    return json.loads(await asyncio.wait_for(reader.readline(), 5))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestGameServer:
+    """Test suite for GameServer."""
+
+    def test_moves_stream_as_deltas_to_every_client(self):
+        """Test that players and spectators get the same per-move deltas."""
+        async def scenario():
+            server = GameServer()
+            await server.start()
+            player, spectator = await connect(server), await connect(server)
+            created = await request(player, op='new', width=9, height=9, mines=10)
+            assert created['type'] == 'snapshot' and created['cells'] == []
+            joined = await request(spectator, op='join', game=created['game'])
+            assert joined['seq'] == 0
+
+            delta = await request(player, op='reveal', x=4, y=4)
+            assert delta == await receive(spectator)
+            assert delta['type'] == 'delta' and delta['seq'] == 1
+            room = server.rooms[created['game']]
+            assert len(delta['cells']) == sum(row.count(True) for row in room.game.revealed)
+            assert all(code == room.game.board[y][x] for x, y, code in delta['cells'])
+
+            hidden = next((x, y) for y in range(9) for x in range(9) if not room.game.revealed[y][x])
+            flagged = await request(player, op='flag', x=hidden[0], y=hidden[1])
+            assert flagged['cells'] == [[hidden[0], hidden[1], FLAG]]
+            unflagged = await request(player, op='flag', x=hidden[0], y=hidden[1])
+            assert unflagged['cells'] == [[hidden[0], hidden[1], HIDDEN]]
+            assert unflagged['seq'] == 3
+            await server.close()
+        run(scenario())
+
+    def test_errors_are_reported(self):
+        """Test that bad commands get an error reply and keep the connection."""
+        async def scenario():
+            server = GameServer()
+            await server.start()
+            client = await connect(server)
+            assert (await request(client, op='reveal', x=0, y=0))['type'] == 'error'
+            assert (await request(client, op='join', game=99))['type'] == 'error'
+            await request(client, op='new', width=5, height=5, mines=3)
+            assert (await request(client, op='flag', x=7, y=0))['type'] == 'error'
+            assert (await request(client, op='dance'))['type'] == 'error'
+            await server.close()
+        run(scenario())
+
+    def test_new_game_sizes_are_validated(self):
+        """Test that impossible or oversized games are refused before any board is built."""
+        async def scenario():
+            server = GameServer(max_side=100)
+            await server.start()
+            client = await connect(server)
+            for width, height, mines in ((3, 3, 5), (0, 9, 1), (9, -1, 1), (101, 9, 10), (9, 9, -1)):
+                reply = await request(client, op='new', width=width, height=height, mines=mines)
+                assert reply['type'] == 'error'
+            assert server.rooms == {}
+            reply = await request(client, op='new', width=2, height=2, mines=0)
+            assert reply['message'] == "board must have at least 9 cells, not 4"
+            reply = await request(client, op='new', width=3, height=4, mines=4)
+            assert reply['message'] == "mines must be between 0 and 3"
+            assert (await request(client, op='new', width=4, height=4, mines=7))['type'] == 'snapshot'
+            await server.close()
+        run(scenario())
+
+    def test_rooms_close_with_their_last_session(self):
+        """Test that empty rooms are dropped and open rooms per client are capped."""
+        async def scenario():
+            server = GameServer(max_rooms_per_client=2)
+            await server.start()
+            owner = await connect(server)
+            guests = [await connect(server), await connect(server)]
+            first = await request(owner, op='new', width=9, height=9, mines=10)
+            game = server.rooms[first['game']].game
+            await send(owner, op='leave')
+            await asyncio.sleep(0.05)
+            assert server.rooms == {} and game._listeners == []
+            # Rooms kept open by another client count against their creator
+            for guest in guests:
+                created = await request(owner, op='new', width=9, height=9, mines=10)
+                await request(guest, op='join', game=created['game'])
+            assert len(server.rooms) == 2
+            reply = await request(owner, op='new', width=9, height=9, mines=10)
+            assert reply['type'] == 'error' and len(server.rooms) == 2
+            await send(guests[0], op='leave')
+            await asyncio.sleep(0.05)
+            assert len(server.rooms) == 1
+            assert (await request(owner, op='new', width=9, height=9, mines=10))['type'] == 'snapshot'
+            await server.close()
+        run(scenario())
+
+    def test_many_spectators(self):
+        """Test that one loop fans a move out to hundreds of sessions."""
+        async def scenario():
+            server = GameServer()
+            await server.start()
+            player = await connect(server)
+            created = await request(player, op='new', width=16, height=16, mines=40)
+            spectators = [await connect(server) for _ in range(300)]
+            await asyncio.gather(*(request(s, op='join', game=created['game']) for s in spectators))
+            delta = await request(player, op='reveal', x=8, y=8)
+            received = await asyncio.gather(*(receive(s) for s in spectators))
+            assert all(message == delta for message in received)
+            await server.close()
+        run(scenario())
+
+    def test_slow_client_is_resynced(self):
+        """Test that a full queue drops the backlog for one snapshot."""
+        async def scenario():
+            server = GameServer(queue_size=4)
+            room = server.create_game(9, 9, 10)
+            session = Session(writer=None, queue_size=4)
+            room.sessions.add(session)
+            session.room = room
+            for x in range(6):
+                room.game.toggle_flag(x, 0)
+                room.flush()
+            assert session.resyncs == 1
+            assert session.queue.qsize() == 2
+        run(scenario())
@@ -0,0 +1,192 @@
+"""
+Unit tests for the constraint solver.
+Run with: pytest tests/test_solver.py
+"""
+
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai import MinesweeperAI
+from src.minesweeper import Minesweeper
+from src.patterns import shared_cache
+from src.sampling import MonteCarloEstimator
+from src.solver import (ConstraintSolver, EnumerationTimeout, build_constraints,
+                        enumerate_component, merge_counts, split_assignments,
+                        split_components)
+
+
+def make_game(rows, revealed=()):
+    """Build a game from a layout of '*' (mine) and '.' (safe) characters."""
+    height, width = len(rows), len(rows[0])
+    mines = sum(row.count('*') for row in rows)
+    game = Minesweeper(width, height, mines, first_click=(0, 0))
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            game.board[y][x] = -1 if char == '*' else 0
+    game.calculate_adjacent_mines()
+    game._mines_placed = True
+    for x, y in revealed:
+        game.reveal(x, y)
+    return game
+
+
+class TestConstraintSolver:
+    """Test suite for frontier enumeration and probabilities."""
+
+    def test_edge_pair(self):
+        """Test exact probabilities on a pair of cells sharing one mine."""
+        game = make_game([
+            '*..',
+            '...',
+        ], revealed=[(2, 1)])
+        probs, outside = ConstraintSolver(workers=1).solve(game)
+        assert outside is None
+        assert probs == {(0, 0): pytest.approx(0.5), (0, 1): pytest.approx(0.5)}
+
+    def test_matches_brute_force(self):
+        """Test probabilities against enumerating every mine layout."""
+        game = make_game([
+            '.....*',
+            '*.....',
+            '......',
+            '...*..',
+            '*.....',
+        ], revealed=[(3, 0), (5, 4)])
+        constraints, _ = build_constraints(game)
+        unknown = [(x, y) for y in range(game.height) for x in range(game.width)
+                   if not game.revealed[y][x] and not game.flagged[y][x]]
+        remaining = game.num_mines - game.get_flag_count()
+        hits = {cell: 0 for cell in unknown}
+        total = 0
+        for layout in itertools.combinations(unknown, remaining):
+            mines = set(layout)
+            if all(sum(c in mines for c in cells) == need for cells, need in constraints):
+                total += 1
+                for cell in layout:
+                    hits[cell] += 1
+
+        probs, outside = ConstraintSolver(workers=1).solve(game)
+        for cell in unknown:
+            expected = hits[cell] / total
+            assert probs.get(cell, outside) == pytest.approx(expected)
+
+    def test_split_subtrees_merge_exactly(self):
+        """Test that pinning branch cells and merging equals a full enumeration."""
+        constraints = [((0, 1, 2), 1), ((1, 2, 3, 4), 2), ((3, 4, 5), 1), ((5, 6), 1)]
+        full = enumerate_component(7, constraints)
+        parts = [enumerate_component(7, constraints, fixed)
+                 for fixed in split_assignments(7, constraints, 3)]
+        assert merge_counts(parts, 7) == full
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool path returns the serial answer."""
+        game = Minesweeper(16, 16, 40)
+        for y in range(16):
+            for x in range(16):
+                if game.board[y][x] == 0:
+                    game.reveal(x, y)
+        serial = ConstraintSolver(workers=1).solve(game)
+        solver = ConstraintSolver(workers=2, parallel_threshold=1, split_threshold=4, split_depth=2)
+        try:
+            parallel = solver.solve(game)
+        finally:
+            solver.shutdown()
+        assert parallel[0].keys() == serial[0].keys()
+        for cell, prob in serial[0].items():
+            assert parallel[0][cell] == pytest.approx(prob)
+        assert solver.last_exact
+
+    def test_deadline_raises(self):
+        """Test that an expired deadline aborts enumeration."""
+        constraints = [(tuple(range(40)), 20)]
+        with pytest.raises(EnumerationTimeout):
+            enumerate_component(40, constraints, deadline=0.0)
+
+    def test_budget_falls_back_to_estimate(self):
+        """Test that an exhausted budget still returns probabilities."""
+        game = make_game(['.' * 40, '*.' * 20])
+        game.reveal(0, 0)
+        solver = ConstraintSolver(workers=1, time_budget=0.0)
+        probs, _ = solver.solve(game)
+        assert probs
+        assert all(0.0 <= p <= 1.0 for p in probs.values())
+
+    def test_long_component_does_not_recurse(self):
+        """Test that a component longer than the recursion limit is still enumerated."""
+        game = make_game(['.' * 1600, '.' * 1600, '*.' * 800])
+        game.reveal(0, 0)
+        solver = ConstraintSolver(workers=1, time_budget=2.0, cache=None)
+        probs, _ = solver.solve(game)
+        assert len(probs) == 1600 and solver.last_exact
+        assert all(p == (1.0 if x % 2 == 0 else 0.0) for (x, _), p in probs.items())
+
+    def test_components_are_independent(self):
+        """Test that disjoint frontiers split into separate components."""
+        constraints, _ = build_constraints(make_game([
+            '*.....*',
+            '.......',
+        ], revealed=[(3, 1)]))
+        assert len(split_components(constraints)) == 2
+
+
+class TestMonteCarloEstimator:
+    """Test suite for the sampling probability estimator."""
+
+    def test_converges_to_exact(self):
+        """Test that estimates land near the exact probabilities."""
+        random.seed(2024)
+        game = Minesweeper(16, 16, 40)
+        for y in range(16):
+            for x in range(16):
+                if game.board[y][x] == 0:
+                    game.reveal(x, y)
+        exact, outside = ConstraintSolver(workers=1).solve(game)
+        estimate = MonteCarloEstimator(time_budget=5.0, max_samples=8000, seed=7).estimate(game)
+        assert estimate.samples == 8000
+        for cell, prob in exact.items():
+            low, high = estimate.intervals[cell]
+            assert low <= high
+            assert estimate.probabilities[cell] == pytest.approx(prob, abs=0.1)
+        if outside is not None:
+            assert estimate.outside == pytest.approx(outside, abs=0.1)
+
+    def test_batch_means_average_to_the_estimate(self):
+        """Test that each batch mean covers exactly its own batch of samples."""
+        random.seed(2024)
+        game = Minesweeper(16, 16, 40)
+        for y in range(16):
+            for x in range(16):
+                if game.board[y][x] == 0:
+                    game.reveal(x, y)
+        estimate = MonteCarloEstimator(time_budget=5.0, max_samples=4000, batches=20, seed=7).estimate(game)
+        assert estimate.samples == 4000
+        for cell, prob in estimate.probabilities.items():
+            means = estimate.batch_means[cell]
+            assert len(means) == 20
+            assert sum(means) / len(means) == pytest.approx(prob, abs=1e-9)
+            assert all(0.0 <= m <= 1.0 for m in means)
+
+    def test_respects_time_budget(self):
+        """Test that sampling stops near the wall-clock budget."""
+        game = make_game(['.' * 60, '*..' * 20, '.' * 60])
+        game.reveal(0, 0)
+        estimate = MonteCarloEstimator(time_budget=0.05, max_samples=10 ** 9).estimate(game)
+        assert estimate.elapsed < 0.5
+        assert estimate.samples > 0
+
+    def test_ai_guesses_within_budget(self):
+        """Test that a budgeted AI falls back to sampling and still moves."""
+        game = make_game(['.' * 40, '*.' * 20, '.' * 40])
+        game.reveal(0, 0)
+        shared_cache.clear()  # a cached pattern would skip enumeration and its deadline
+        ai = MinesweeperAI(game, workers=1, time_budget=0.0)
+        move = ai.find_best_probability_move()
+        assert not ai.solver.last_exact
+        assert move is not None and not game.revealed[move[1]][move[0]]
@@ -0,0 +1,94 @@
+"""
+Unit tests for the background sound worker.
+Run with: pytest tests/test_sound.py
+"""
+
+import io
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sound import SilentBackend, SoundWorker, synthesize
+
+
+class BlockingBackend(SilentBackend):
+    """A silent backend that holds each sound until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, frequency, duration):
+        self.started.set()
+        self.release.wait(5)
+        super().__call__(frequency, duration)
+
+
+class TestSynthesize:
+    """Test suite for the waveform cache."""
+
+    def test_wav_has_expected_length_and_is_cached(self):
+        """Test that a tone is a valid WAV of the right length, built once."""
+        data = synthesize(440, 100)
+        with wave.open(io.BytesIO(data)) as wav:
+            assert wav.getnchannels() == 1 and wav.getsampwidth() == 2
+            assert wav.getnframes() == wav.getframerate() // 10
+        assert synthesize(440, 100) is data
+
+
+class TestSoundWorker:
+    """Test suite for queued, non-blocking playback."""
+
+    def test_sounds_play_in_order(self):
+        """Test that queued sounds reach the backend in order."""
+        backend = SilentBackend()
+        worker = SoundWorker(backend)
+        worker.play(400, 50)
+        worker.play(600, 50)
+        assert worker.wait(5)
+        assert backend.played == [(400, 50), (600, 50)]
+        assert worker.played == 2
+        worker.close()
+
+    def test_play_does_not_wait_for_backend(self):
+        """Test that play() returns while the backend is still busy."""
+        backend = BlockingBackend()
+        worker = SoundWorker(backend)
+        start = time.perf_counter()
+        worker.play(200, 300)
+        assert backend.started.wait(5)
+        worker.play(400, 50)
+        assert time.perf_counter() - start < 1
+        backend.release.set()
+        assert worker.wait(5)
+        worker.close()
+
+    def test_burst_is_coalesced_and_bounded(self):
+        """Test that repeats merge and a full queue drops its oldest sounds."""
+        backend = BlockingBackend()
+        worker = SoundWorker(backend, maxsize=2)
+        worker.play(100, 10)
+        assert backend.started.wait(5)
+        for frequency in (200, 200, 300, 400, 400):
+            worker.play(frequency, 10)
+        assert worker.coalesced == 2
+        assert worker.dropped == 1
+        backend.release.set()
+        assert worker.wait(5)
+        assert backend.played == [(100, 10), (300, 10), (400, 10)]
+        worker.close()
+
+    def test_closed_worker_ignores_sounds(self):
+        """Test that nothing is queued after close()."""
+        backend = SilentBackend()
+        worker = SoundWorker(backend)
+        worker.close()
+        worker.play(400, 50)
+        assert worker.wait(1)
+        assert backend.played == []
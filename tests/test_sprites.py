@@ -0,0 +1,91 @@
+"""
+Unit tests for the cell sprite atlas.
+Run with: pytest tests/test_sprites.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui import MinesweeperGUI
+from src.sprites import GLYPHS, SpriteAtlas, photo_data, render_pixels
+
+
+class FakeImage:
+    """A stand-in for ``tk.PhotoImage`` that records what was put into it."""
+
+    def __init__(self, width, height):
+        self.size = (width, height)
+        self.puts = []
+
+    def put(self, data):
+        self.puts.append(data)
+
+
+def make_atlas():
+    tables = {name: MinesweeperGUI.build_style_table(colors) for name, colors in MinesweeperGUI.THEMES.items()}
+    return SpriteAtlas(tables, image_factory=FakeImage)
+
+
+class TestRenderPixels:
+    """Test suite for rendering one cell's pixels."""
+
+    def test_border_fill_and_glyph(self):
+        """Test that a cell has an outline border, a fill and ink only where the glyph is."""
+        rows = render_pixels(25, '#111111', '#000000', '#ffffff', GLYPHS['text_1'])
+        assert len(rows) == 25 and all(len(row) == 25 for row in rows)
+        assert set(rows[0]) == {'#000000'} and set(rows[-1]) == {'#000000'}
+        assert all(row[0] == '#000000' and row[-1] == '#000000' for row in rows)
+        inner = {pixel for row in rows[1:-1] for pixel in row[1:-1]}
+        assert inner == {'#111111', '#ffffff'}
+
+    def test_blank_glyph_has_no_ink(self):
+        """Test that a blank cell is only border and fill."""
+        rows = render_pixels(15, '#111111', '#000000', '#ffffff', GLYPHS['text_blank'])
+        assert {pixel for row in rows for pixel in row} == {'#111111', '#000000'}
+
+    def test_photo_data_has_one_group_per_row(self):
+        """Test that the put() data lists every row in braces."""
+        data = photo_data(render_pixels(4, '#111111', '#000000', '#ffffff', ()))
+        assert data.count('{') == 4 and data.startswith('{#000000 #000000')
+
+
+class TestSpriteAtlas:
+    """Test suite for caching and evicting sprites."""
+
+    def test_each_state_is_rendered_once(self):
+        """Test that cells in the same state share one image rendered once."""
+        atlas = make_atlas()
+        atlas.use('Dark', 25)
+        first = atlas.get(('cell_hidden', 'text_blank'))
+        assert atlas.get(('cell_hidden', 'text_blank')) is first
+        assert first.size == (25, 25) and len(first.puts) == 1
+        atlas.get(('cell_revealed', 'text_3'))
+        assert atlas.rendered == 2
+
+    def test_theme_or_size_change_evicts(self):
+        """Test that switching theme or cell size drops the old sprites."""
+        atlas = make_atlas()
+        atlas.use('Dark', 25)
+        old = atlas.get(('cell_flag', 'text_flag'))
+        assert not atlas.use('Dark', 25)
+        assert atlas.use('Light', 25)
+        assert atlas.images == {}
+        new = atlas.get(('cell_flag', 'text_flag'))
+        assert new is not old and new.puts != old.puts
+        assert atlas.use('Light', 15)
+        assert atlas.get(('cell_flag', 'text_flag')).size == (15, 15)
+
+    def test_every_gui_state_has_a_glyph(self):
+        """Test that every state the GUI can show renders under every theme."""
+        atlas = make_atlas()
+        states = [('cell_hidden', 'text_blank'), ('cell_flag', 'text_flag'), ('cell_mine', 'text_mine'),
+                  ('cell_revealed', 'text_blank')] + [('cell_revealed', f'text_{n}') for n in range(1, 9)]
+        for theme in MinesweeperGUI.THEMES:
+            atlas.use(theme, 20)
+            for state in states:
+                atlas.get(state)
+            assert len(atlas.images) == len(states)
+        assert len({SpriteAtlas.tag(state) for state in states}) == len(states)
@@ -0,0 +1,74 @@
+"""
+Unit tests for board storage backends.
+Run with: pytest tests/test_storage.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.minesweeper import Minesweeper
+from src.storage import MmapBoardStorage, resident_tiles
+
+
+class TestMmapBoardStorage:
+    """Test suite for the memory-mapped board backend."""
+
+    def test_grid_roundtrip(self):
+        """Test that packed grids read back what was written."""
+        with MmapBoardStorage(70, 70, tile_size=8) as storage:
+            storage.board[3][69] = -1
+            storage.board[69][0] = 7
+            storage.revealed[69][0] = True
+            storage.flagged[3][69] = True
+            assert storage.board[3][69] == -1
+            assert storage.board[69][0] == 7
+            assert storage.revealed[69][0] is True
+            assert storage.flagged[3][69] is True
+            assert storage.revealed[3][69] is False
+            assert len(list(storage.board[0])) == 70
+
+    def test_matches_list_backend(self):
+        """Test that an mmap-backed game plays identically to the default."""
+        random.seed(1234)
+        reference = Minesweeper(20, 15, 40, first_click=(4, 4))
+        reference.reveal(4, 4)
+
+        random.seed(1234)
+        storage = MmapBoardStorage(20, 15, tile_size=8)
+        game = Minesweeper(20, 15, 40, first_click=(4, 4), storage=storage)
+        game.reveal(4, 4)
+
+        for y in range(15):
+            for x in range(20):
+                assert game.board[y][x] == reference.board[y][x]
+                assert game.revealed[y][x] == reference.revealed[y][x]
+        assert game.is_solved() == reference.is_solved()
+        storage.close()
+
+    def test_counts_match_full_recalculation(self):
+        """Test that incremental counting agrees with a full recount."""
+        game = Minesweeper(30, 16, 99)
+        counts = [row[:] for row in game.board]
+        game.calculate_adjacent_mines()
+        assert counts == game.board
+
+    def test_flood_fill_touches_few_tiles(self):
+        """Test that an opening walled off in one corner stays in one tile."""
+        storage = MmapBoardStorage(128, 128)
+        game = Minesweeper(128, 128, 41, first_click=(0, 0), storage=storage)
+        for i in range(21):
+            game.board[20][i] = -1
+            game.board[i][20] = -1
+        game.calculate_adjacent_mines()
+        game._mines_placed = True
+
+        assert game.reveal(0, 0) is True
+        assert game.revealed[18][18] is True
+        assert game.revealed[30][30] is False
+        # Only the corner tile holds non-default bytes (recount touches mines' tiles too)
+        assert resident_tiles(storage) == [0]
+        storage.close()
@@ -0,0 +1,75 @@
+"""
+Unit tests for per-game telemetry segments.
+Run with: pytest tests/test_telemetry.py
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.simulation import play_records, stream_records
+from src.telemetry import GameRecord, TelemetryWriter, read_records
+
+
+def make_record(seed):
+    probabilities = [round(1 / (2 + (seed * k) % 11), 6) for k in range(1, seed % 4 + 1)]
+    return GameRecord(seed, 9, 9, 10, 20 + seed % 7, probabilities, seed % 2 == 0, seed / 1000)
+
+
+class TestTelemetry:
+    """Test suite for TelemetryWriter and read_records."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that records read back equal to what was written."""
+        records = [make_record(seed) for seed in range(50)]
+        with TelemetryWriter(tmp_path) as writer:
+            assert writer.write_all(records) == 50
+        assert list(read_records(tmp_path)) == records
+        assert [r.guesses for r in read_records(writer.segments[0])][:5] == [0, 1, 2, 3, 0]
+
+    def test_segments_rotate_at_size_limit(self, tmp_path):
+        """Test that segments close at the limit and read back in order."""
+        with TelemetryWriter(tmp_path, max_bytes=16 * 1024) as writer:
+            writer.write_all(make_record(seed) for seed in range(20000))
+        assert len(writer.segments) > 3
+        # Every closed segment reached the limit; compression buffering lets it overshoot a little
+        assert all(16 * 1024 <= path.stat().st_size < 128 * 1024 for path in writer.segments[:-1])
+        with gzip.open(writer.segments[1], 'rt') as f:
+            assert f.readline().startswith('seed,width,height')
+        assert [r.seed for r in read_records(tmp_path)] == list(range(20000))
+
+    def test_new_writer_continues_numbering(self, tmp_path):
+        """Test that a second run appends segments instead of overwriting."""
+        with TelemetryWriter(tmp_path) as writer:
+            writer.write(make_record(1))
+        with TelemetryWriter(tmp_path) as writer:
+            writer.write(make_record(2))
+        assert writer.segments[0].name == 'games-00002.csv.gz'
+        assert [r.seed for r in read_records(tmp_path)] == [1, 2]
+
+    def test_numbering_skips_past_gaps(self, tmp_path):
+        """Test that numbering follows the highest existing segment, not the count."""
+        for seed in (1, 2, 3):
+            with TelemetryWriter(tmp_path) as writer:
+                writer.write(make_record(seed))
+        (tmp_path / 'games-00001.csv.gz').unlink()
+        (tmp_path / 'games-notes.csv.gz').write_bytes(b'')
+        with TelemetryWriter(tmp_path) as writer:
+            writer.write(make_record(4))
+        assert writer.segments[0].name == 'games-00004.csv.gz'
+        (tmp_path / 'games-notes.csv.gz').unlink()
+        assert [r.seed for r in read_records(tmp_path)] == [2, 3, 4]
+
+    def test_worker_pipeline_matches_inline_play(self, tmp_path):
+        """Test that worker processes stream the same games in seed order."""
+        inline = list(play_records(range(10, 22)))
+        with TelemetryWriter(tmp_path) as writer:
+            writer.write_all(stream_records(12, seed=10, workers=2, chunk=5))
+        streamed = list(read_records(tmp_path))
+        assert [r.seed for r in streamed] == list(range(10, 22))
+        assert [(r.won, r.moves, r.guesses) for r in streamed] == \
+               [(r.won, r.moves, r.guesses) for r in inline]
+        assert all(0 < p < 1 for r in streamed for p in r.guess_probabilities)
@@ -0,0 +1,116 @@
+"""
+Unit tests for board topologies.
+Run with: pytest tests/test_topology.py
+"""
+
+import random
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis import count_3bv, layout_of
+from src.minesweeper import Minesweeper
+from src.solver import ConstraintSolver
+from src.topology import (CACHE_LIMIT, SHARE_LIMIT, GraphTopology, hexagonal, load_topology,
+                          Topology, rectangular, save_topology, torus)
+from src.view import BoardView
+
+
+def symmetric(topology):
+    return all(i in topology.neighbor_indices(j)
+               for i in range(topology.size) for j in topology.neighbor_indices(i))
+
+
+class TestTopology:
+    """Test suite for the topology layer."""
+
+    def test_rectangle_matches_offsets(self):
+        """Test that the default topology is the classic 8-neighbour board."""
+        topology = rectangular(5, 4)
+        for y in range(4):
+            for x in range(5):
+                expected = [(x + dx, y + dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                            if (dx or dy) and 0 <= x + dx < 5 and 0 <= y + dy < 4]
+                assert list(topology.neighbors(x, y)) == expected
+        assert topology.to_graph().max_degree() == 8
+        assert rectangular(5, 4) is topology
+
+    def test_large_rectangles_are_not_pinned(self):
+        """Test that big boards get their own topology and skip the tuple cache."""
+        side = int(SHARE_LIMIT ** 0.5) + 1
+        assert rectangular(side, side) is not rectangular(side, side)
+        big = rectangular(1024, 1024)
+        assert big.size > CACHE_LIMIT and big._tuples is None
+        assert big.neighbors(0, 0) == ((1, 0), (0, 1), (1, 1))
+
+    def test_torus_and_hex_shapes(self):
+        """Test degrees and symmetry of the wrapped and hexagonal boards."""
+        ring = torus(6, 5)
+        assert all(len(ring.neighbor_indices(i)) == 8 for i in range(ring.size))
+        assert (5, 4) in ring.neighbors(0, 0)
+        hexes = hexagonal(6, 5)
+        assert hexes.max_degree() == 6
+        assert len(hexes.neighbors(0, 0)) == 2 and len(hexes.neighbors(2, 2)) == 6
+        assert symmetric(ring) and symmetric(hexes)
+
+    def test_save_and_load_graph(self, tmp_path):
+        """Test that graphs round-trip through JSON, from lists or edges."""
+        path = tmp_path / "graph.json"
+        save_topology(hexagonal(4, 3), str(path))
+        loaded = load_topology(str(path))
+        assert list(loaded.targets) == list(hexagonal(4, 3).targets)
+        path.write_text('{"width": 3, "height": 1, "edges": [[0, 1], [1, 2]]}')
+        line = load_topology(str(path))
+        assert line.neighbors(1, 0) == ((0, 0), (2, 0))
+
+    def test_game_follows_topology(self):
+        """Test that counts and flood fill use the board's own adjacency."""
+        random.seed(7)
+        for topology in (torus(8, 8), hexagonal(8, 8)):
+            game = Minesweeper(8, 8, 6, first_click=(3, 3), topology=topology)
+            game.reveal(3, 3)
+            mines = set(game.mine_cells())
+            for y in range(8):
+                for x in range(8):
+                    if (x, y) not in mines:
+                        assert game.board[y][x] == sum(n in mines for n in topology.neighbors(x, y))
+            for x, y in [(x, y) for y in range(8) for x in range(8) if game.revealed[y][x]]:
+                if game.board[y][x] == 0:
+                    assert all(game.revealed[ny][nx] for nx, ny in topology.neighbors(x, y))
+            loaded = Minesweeper.from_dict(game.to_dict())
+            assert loaded.topology is topology and loaded.board == game.board
+
+    def test_solver_on_custom_graph(self):
+        """Test that constraints follow an arbitrary graph."""
+        # A path 0-1-2: the middle cell shows 1, so one end is a mine
+        line = GraphTopology.from_edges(3, 1, [(0, 1), (1, 2)])
+        game = Minesweeper(3, 1, 1, first_click=(1, 0), topology=line)
+        game.set_mines([(0, 0)])
+        game.reveal(1, 0)
+        probabilities, _ = ConstraintSolver(workers=1).solve(BoardView(game))
+        assert probabilities == {(0, 0): 0.5, (2, 0): 0.5}
+
+    def test_size_mismatch_is_rejected(self):
+        """Test that a topology for another board size is refused."""
+        with pytest.raises(ValueError):
+            Minesweeper(4, 4, 2, topology=torus(5, 5))
+
+    def test_base_topology_is_abstract(self):
+        """Test that the base class cannot stand in for a topology."""
+        with pytest.raises(TypeError):
+            Topology(3, 3)
+
+    def test_3bv_follows_topology(self):
+        """Test that 3BV uses the board's adjacency and layouts refuse other shapes."""
+        ring = GraphTopology.from_edges(5, 1, [(i, (i + 1) % 5) for i in range(5)])
+        # On the ring the two zeros either side of cell 0 join into one opening
+        assert count_3bv(5, 1, [2]) == (2, 2)
+        assert count_3bv(5, 1, [2], topology=ring) == (1, 1)
+        assert count_3bv(5, 1, [2], topology=rectangular(5, 1)) == (2, 2)
+        game = Minesweeper(8, 8, 6, first_click=(3, 3), topology=torus(8, 8))
+        game.place_mines(exclude=(3, 3))
+        with pytest.raises(ValueError):
+            layout_of(game, (3, 3))
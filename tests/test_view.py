@@ -0,0 +1,108 @@
+"""
+Unit tests for the player-visible board view.
+Run with: pytest tests/test_view.py
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.minesweeper import Minesweeper
+from src.storage import MmapBoardStorage
+from src.view import FLAG, HIDDEN, MAX_VIEW_CELLS, BoardView
+
+
+def visible_state(name):
+    """Worker-side: attach to a shared game and read it back."""
+    view = BoardView.attach(name)
+    state = (view.cells.tolist(), view.get_flag_count(), view.game_over, view.generation)
+    view.close()
+    return state
+
+
+class TestBoardView:
+    """Test suite for BoardView."""
+
+    def test_hides_mines_and_tracks_game(self):
+        """Test that only revealed numbers and flags are visible."""
+        game = Minesweeper(9, 9, 10, first_click=(4, 4))
+        view = BoardView(game)
+        assert all(code == HIDDEN for row in view.board for code in row)
+        game.reveal(4, 4)
+        hidden = next((x, y) for y in range(9) for x in range(9) if not game.revealed[y][x])
+        game.toggle_flag(*hidden)
+        for y in range(9):
+            for x in range(9):
+                if game.revealed[y][x]:
+                    assert view.board[y][x] == game.board[y][x]
+                else:
+                    assert view.board[y][x] == (FLAG if (x, y) == hidden else HIDDEN)
+                assert view.revealed[y][x] == game.revealed[y][x]
+                assert view.flagged[y][x] == game.flagged[y][x]
+
+    def test_shows_revealed_mine(self):
+        """Test that a mine reads as -1 once it has been revealed."""
+        game = Minesweeper(5, 5, 5)
+        view = BoardView(game)
+        x, y = next((x, y) for y in range(5) for x in range(5) if game.board[y][x] == -1)
+        game.reveal(x, y)
+        assert view.cell(x, y) == -1
+
+    def test_is_read_only(self):
+        """Test that a strategy cannot write through the view."""
+        view = BoardView(Minesweeper(5, 5, 3))
+        with pytest.raises(TypeError):
+            view.revealed[0][0] = True
+        with pytest.raises(TypeError):
+            view.board[0][0] = 0
+
+    def test_views_share_the_engine_buffer(self):
+        """Test that views are zero-copy windows on one engine buffer."""
+        game = Minesweeper(9, 9, 10)
+        first, second = BoardView(game), BoardView(game)
+        assert first.cells.obj is second.cells.obj
+
+    def test_shared_view_in_worker_process(self):
+        """Test that a worker attaches by name and sees live state."""
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        name = game.share_state()
+        game.reveal(8, 8)
+        hidden = next((x, y) for y in range(16) for x in range(16) if not game.revealed[y][x])
+        game.toggle_flag(*hidden)
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                codes, flags, over, generation = pool.submit(visible_state, name).result()
+        finally:
+            game.close_shared()
+        assert codes == BoardView(game).cells.tolist()
+        assert (flags, over) == (1, game.game_over)
+        assert generation == game.generation == 4
+
+    def test_view_reads_only_touched_rows(self):
+        """Test that building a view skips rows nobody has revealed or flagged."""
+        game = Minesweeper(30, 16, 99, first_click=(0, 0))
+        game.set_mines([(29, 15)])
+        game.reveal(0, 0)
+        game.toggle_flag(29, 15)
+        view = BoardView(game)
+        assert list(view.touched_rows()) == list(range(16))
+        game = Minesweeper(30, 16, 1, first_click=(0, 0))
+        game.set_mines([(29, 15)])
+        game.toggle_flag(3, 4)
+        view = BoardView(game)
+        assert list(view.touched_rows()) == [4]
+        assert view.cell(3, 4) == FLAG and view.cells.tolist().count(HIDDEN) == 30 * 16 - 1
+
+    def test_oversized_board_is_refused(self):
+        """Test that a view on a board above MAX_VIEW_CELLS raises instead of allocating."""
+        side = 1 << 14
+        assert side * side > MAX_VIEW_CELLS
+        with MmapBoardStorage(side, side) as storage:
+            game = Minesweeper(side, side, 10, first_click=(0, 0), storage=storage)
+            with pytest.raises(ValueError):
+                BoardView(game)
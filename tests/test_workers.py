@@ -0,0 +1,86 @@
+"""
+Unit tests for the shared-memory solver pool.
+Run with: pytest tests/test_workers.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai import MinesweeperAI
+from src.minesweeper import Minesweeper
+from src.solver import ConstraintSolver
+from src.topology import GraphTopology, torus
+from src.view import BoardView
+from src.workers import SolverPool, plan_moves
+
+
+class TestPlanMoves:
+    """Test suite for plan_moves."""
+
+    def test_forced_moves_are_correct(self):
+        """Test that planned flags are mines and planned reveals are safe when forced."""
+        random.seed(11)
+        game = Minesweeper(16, 16, 40, first_click=(8, 8))
+        game.reveal(8, 8)
+        moves = plan_moves(BoardView(game), ConstraintSolver(workers=1))
+        assert moves
+        if len(moves) > 1 or moves[0][0] == 'flag':
+            for op, x, y in moves:
+                assert (game.board[y][x] == -1) == (op == 'flag')
+
+
+class TestSolverPool:
+    """Test suite for SolverPool."""
+
+    def test_pool_plays_games_from_shared_state(self):
+        """Test that workers see live state through the shared block."""
+        random.seed(5)
+        with SolverPool(workers=2) as pool:
+            for _ in range(3):
+                game = Minesweeper(16, 16, 40, first_click=(8, 8))
+                game.reveal(8, 8)
+                assert pool.ping(game) == game.generation
+                while not game.game_over:
+                    for op, x, y in pool.plan(game):
+                        if op == 'flag':
+                            game.toggle_flag(x, y)
+                        else:
+                            game.reveal(x, y)
+                assert pool.ping(game) == game.generation
+                game.close_shared()
+
+    def test_ai_guesses_through_pool(self):
+        """Test that MinesweeperAI can hand its guessing to the pool."""
+        random.seed(8)
+        with SolverPool(workers=1) as pool:
+            game = Minesweeper(30, 16, 99, first_click=(15, 8))
+            ai = MinesweeperAI(game, workers=1, pool=pool)
+            game.reveal(15, 8)
+            while not game.game_over:
+                ai.make_move()
+            ai.close()
+            game.close_shared()
+        assert all(game.board[y][x] == -1 for y in range(16) for x in range(30) if game.flagged[y][x])
+
+    def test_pool_follows_game_topology(self):
+        """Test that workers plan with the shared game's own adjacency."""
+        # A path 0-1-2: the middle cell shows 1, so one end is a mine
+        line = GraphTopology.from_edges(3, 1, [(0, 1), (1, 2)])
+        game = Minesweeper(3, 1, 1, first_click=(1, 0), topology=line)
+        game.set_mines([(0, 0)])
+        game.reveal(1, 0)
+        random.seed(0)
+        ring = Minesweeper(8, 8, 10, first_click=(0, 0), topology=torus(8, 8))
+        ring.reveal(0, 0)
+        expected = sorted(plan_moves(BoardView(ring), ConstraintSolver(workers=1)))
+        assert len(expected) > 1
+        with SolverPool(workers=1) as pool:
+            assert pool.plan(game)[0][1:] in ((0, 0), (2, 0))
+            assert sorted(pool.plan(ring)) == expected
+            assert pool.ping(ring) == ring.generation
+        game.close_shared()
+        ring.close_shared()